@@ -5,3 +5,11 @@
 .PHONY: _custom_run_target
 _custom_run_target: ## make run WHAT=target — run target with settings.json
 	$(Q)PYTHONPATH=$(SRC_DIR) $(POETRY) run target-oracle --config settings.json
+
+.PHONY: _custom_run_benchmarks
+_custom_run_benchmarks: ## make run WHAT=benchmarks — offline load-path benchmarks, compared with the last saved run
+	$(Q)PYTHONPATH=$(SRC_DIR) $(POETRY) run pytest tests/benchmarks --benchmark-enable --benchmark-autosave --benchmark-compare --benchmark-sort=name -p no:randomly
+
+.PHONY: _custom_run_scaling
+_custom_run_scaling: ## make run WHAT=scaling — scaling sweep; SCALING_ARGS="--records 10000,100000 --baseline ..."
+	$(Q)PYTHONPATH=$(SRC_DIR) $(POETRY) run python -m tests.benchmarks.scaling $(SCALING_ARGS)
@@ -21,6 +21,20 @@ class FlextTargetOracleConstantsBase:
     QUALIFIED_IDENTIFIER_RE: ClassVar[t.RegexPattern] = re.compile(
         QUALIFIED_IDENTIFIER_PATTERN
     )
+    SIMPLE_IDENTIFIER_RE: ClassVar[t.RegexPattern] = re.compile(
+        r"[A-Z][A-Z0-9_$#]*"
+    )
+    # Top-level scalar members of a Singer message line (type, stream, version,
+    # time_extracted); used to slice the raw ``record`` object out of the line.
+    SINGER_SCALAR_MEMBER_PATTERN: Final[str] = (
+        r'\s*"[^"\\]*"\s*:\s*(?:"[^"\\]*"|-?[0-9.eE+-]+|true|false|null)\s*'
+    )
+    SINGER_RECORD_PREFIX_RE: ClassVar[t.RegexPattern] = re.compile(
+        rf'\s*\{{(?:{SINGER_SCALAR_MEMBER_PATTERN},)*\s*"record"\s*:\s*(?=\{{)'
+    )
+    SINGER_RECORD_SUFFIX_RE: ClassVar[t.RegexPattern] = re.compile(
+        rf"(?:,{SINGER_SCALAR_MEMBER_PATTERN})*\}}\s*"
+    )
 
     # LoadMethods
     LOAD_METHOD_INSERT: Final[str] = "INSERT"
@@ -33,10 +47,156 @@ class FlextTargetOracleConstantsBase:
     STORAGE_MODE_JSON: Final[str] = "json"
     STORAGE_MODE_HYBRID: Final[str] = "hybrid"
 
+    # JsonColumnTypes
+    JSON_COLUMN_TYPE_CLOB: Final[str] = "CLOB"
+    JSON_COLUMN_TYPE_JSON: Final[str] = "JSON"
+    JSON_FALLBACK_DATA_TYPE: Final[str] = "BLOB"
+    NATIVE_JSON_MIN_VERSION: Final[int] = 21
+
+    # BatchErrorModes
+    BATCH_ERROR_MODE_FAIL: Final[str] = "fail"
+    BATCH_ERROR_MODE_QUARANTINE: Final[str] = "quarantine"
+    BATCH_SAVEPOINT_NAME: Final[str] = "FLEXT_TARGET_BATCH"
+    ORA_ERROR_CODE_RE: ClassVar[t.RegexPattern] = re.compile(r"ORA-\d{5}")
+    QUARANTINE_FILE_SUFFIX: Final[str] = ".jsonl"
+
+    # RowHash
+    ROW_HASH_COLUMN: Final[str] = "_SDC_ROW_HASH"
+    ROW_HASH_DIGEST_SIZE: Final[int] = 16
+    ROW_HASH_DATA_TYPE: Final[str] = "VARCHAR2(32)"
+    ROW_HASH_NULL_MARKER: Final[bytes] = b"\x00"
+    ROW_HASH_FIELD_SEPARATOR: Final[bytes] = b"\x1e"
+    ORACLE_TIMESTAMP_TEXT_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S.%f"
+    ORACLE_NUMERIC_TYPE_PREFIXES: Final[tuple[str, ...]] = (
+        "NUMBER",
+        "FLOAT",
+        "INTEGER",
+        "BINARY_",
+    )
+    ORACLE_TEMPORAL_TYPE_PREFIXES: Final[tuple[str, ...]] = ("TIMESTAMP", "DATE")
+
+    # FullTableSwap
+    SHADOW_TABLE_SUFFIX: Final[str] = "_SHD"
+    RETIRED_TABLE_SUFFIX: Final[str] = "_OLD"
+    MAX_IDENTIFIER_LENGTH: Final[int] = 30
+    DIRECT_PATH_INSERT_HINT: Final[str] = "/*+ APPEND_VALUES */"
+    PRIMARY_KEY_INDEX_SUFFIX: Final[str] = "_PK"
+    KEYS_PENDING_TABLE_COMMENT: Final[str] = "flext-target-oracle: keys pending"
+
+    # ParallelDml
+    PARALLEL_HINT_TEMPLATE: Final[str] = "/*+ PARALLEL({degree}) */"
+
+    # TablePartitioning
+    PARTITION_INTERVAL_EXPRESSIONS: Final[t.StrMapping] = {
+        "day": "NUMTODSINTERVAL(1, 'DAY')",
+        "month": "NUMTOYMINTERVAL(1, 'MONTH')",
+    }
+    PARTITION_INITIAL_BOUND: Final[str] = "TIMESTAMP '2000-01-01 00:00:00'"
+    PARTITION_HIGH_VALUE_RE: ClassVar[t.RegexPattern] = re.compile(
+        r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"
+    )
+
+    # TableOptions
+    LOB_DATA_TYPES: Final[frozenset[str]] = frozenset({"CLOB", "NCLOB", "BLOB"})
+
+    # Metrics
+    # Log-linear histogram resolution: values keep their top 7 binary digits,
+    # so each power of two splits into 64 buckets (~1.6% relative error).
+    METRICS_SUB_BUCKET_BITS: Final[int] = 7
+    METRIC_PHASE_PARSE: Final[str] = "parse"
+    METRIC_PHASE_PARAM_BUILD: Final[str] = "param_build"
+    METRIC_PHASE_EXECUTE: Final[str] = "execute"
+    METRIC_PHASE_COMMIT: Final[str] = "commit"
+    METRIC_PHASE_FLUSH: Final[str] = "flush"
+
+    # Singer SDK-style metric log lines: ``METRIC: {"type": ..., "metric": ...}``.
+    SINGER_METRIC_PREFIX: Final[str] = "METRIC: "
+    SINGER_METRIC_COUNTER: Final[str] = "counter"
+    SINGER_METRIC_TIMER: Final[str] = "timer"
+    SINGER_METRIC_RECORD_COUNT: Final[str] = "record_count"
+    SINGER_METRIC_BATCH_TIME: Final[str] = "batch_processing_time"
+    SINGER_METRIC_STATUS_SUCCEEDED: Final[str] = "succeeded"
+    SINGER_METRIC_STATUS_FAILED: Final[str] = "failed"
+
+    # Prometheus exposition
+    PROMETHEUS_METRIC_PREFIX: Final[str] = "flext_target_oracle_"
+    PROMETHEUS_CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+    PROMETHEUS_FAMILIES: Final[tuple[tuple[str, str, str], ...]] = (
+        ("buffer_records", "gauge", "Records buffered and not yet flushed"),
+        ("buffer_bytes", "gauge", "Singer payload bytes buffered and not yet flushed"),
+        ("records_received_total", "counter", "Records accepted into the buffer"),
+        ("records_loaded_total", "counter", "Records written to Oracle"),
+        ("records_quarantined_total", "counter", "Rejected rows sent to quarantine"),
+        (
+            "records_per_second",
+            "gauge",
+            "Records loaded per second since the previous scrape",
+        ),
+        ("flush_duration_seconds", "summary", "Wall time of one batch flush"),
+        (
+            "session_utilization_ratio",
+            "gauge",
+            "Share of run time spent inside Oracle flush sessions",
+        ),
+        ("uptime_seconds", "gauge", "Seconds since the loader started"),
+    )
+
+    # Profiling
+    PROFILE_TRACEMALLOC_FRAMES: Final[int] = 32
+    PROFILE_FILE_SUFFIX: Final[str] = ".folded"
+    PROFILE_PHASE_OTHER: Final[str] = "other"
+
+    # Tracing
+    SQL_STATEMENT_TABLE_RE: ClassVar[t.RegexPattern] = re.compile(
+        r'\b(?:TABLE|INTO|FROM|INDEX|UPDATE)\s+([\w$#."]+)', re.IGNORECASE
+    )
+    TRACE_SERVICE_NAME: Final[str] = "flext-target-oracle"
+    TRACE_SCOPE_NAME: Final[str] = "flext_target_oracle"
+    TRACE_EXPORT_BATCH_SPANS: Final[int] = 512
+    TRACE_EXPORT_TIMEOUT_SECONDS: Final[float] = 5.0
+    # OTLP SpanKind.SPAN_KIND_CLIENT and Status.StatusCode values.
+    TRACE_SPAN_KIND_CLIENT: Final[int] = 3
+    TRACE_STATUS_OK: Final[int] = 1
+    TRACE_STATUS_ERROR: Final[int] = 2
+
+    # PreflightValidation
+    ORACLE_CHARACTER_TYPE_RE: ClassVar[t.RegexPattern] = re.compile(
+        r"\s*(N?VARCHAR2|N?CHAR)\s*\(\s*(\d+)\s*(BYTE|CHAR)?\s*\)", re.IGNORECASE
+    )
+    ORACLE_NUMBER_TYPE_RE: ClassVar[t.RegexPattern] = re.compile(
+        r"\s*(?:NUMBER\s*(?:\(\s*(\d+|\*)\s*(?:,\s*(-?\d+)\s*)?\))?"
+        r"|INTEGER|INT|SMALLINT|FLOAT|BINARY_FLOAT|BINARY_DOUBLE)\b",
+        re.IGNORECASE,
+    )
+    NUMERIC_TEXT_RE: ClassVar[t.RegexPattern] = re.compile(
+        r"\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*"
+    )
+    MAX_BYTES_PER_CHARACTER: Final[int] = 4
+    ORACLE_CHARACTER_TYPE_NAMES: Final[frozenset[str]] = frozenset({
+        "CHAR",
+        "NCHAR",
+        "NVARCHAR2",
+        "VARCHAR2",
+    })
+    ORACLE_CHARACTER_SET_ENCODINGS: Final[t.StrMapping] = {
+        "AL32UTF8": "utf-8",
+        "UTF8": "utf-8",
+    }
+
     # CommandTypes
     COMMAND_TYPE_VALIDATE: Final[str] = "oracle_target_validate"
     COMMAND_TYPE_LOAD: Final[str] = "oracle_target_load"
     COMMAND_TYPE_ABOUT: Final[str] = "oracle_target_about"
+    COMMAND_TYPE_GENERATE: Final[str] = "oracle_target_generate"
+    COMMAND_TYPE_PURGE: Final[str] = "oracle_target_purge"
+
+    # SyntheticStreams
+    GENERATOR_STREAM_PREFIX: Final[str] = "synthetic"
+    GENERATOR_STRING_ALPHABET: Final[str] = "abcdefghijklmnopqrstuvwxyz0123456789"
+    # Power of two so pool slots are drawn with a single getrandbits call.
+    GENERATOR_VALUE_POOL_SIZE: Final[int] = 1024
+    GENERATOR_CLOB_POOL_SIZE: Final[int] = 16
+    GENERATOR_WRITE_CHUNK_LINES: Final[int] = 4096
 
     # OutputFormats
     OUTPUT_FORMAT_TEXT: Final[str] = "text"
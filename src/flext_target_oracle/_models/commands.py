@@ -67,3 +67,84 @@ class FlextTargetOracleModelsCommands:
             str | None,
             u.Field(description="Path to JSON configuration file to validate"),
         ] = None
+
+    class OracleTargetPurgeCommand(m.Command):
+        """Command to drop expired interval partitions outside a load."""
+
+        command_type: Annotated[
+            t.NonEmptyStr,
+            u.Field(description="Command discriminator for partition retention"),
+        ] = c.TargetOracle.COMMAND_TYPE_PURGE
+        command_id: Annotated[
+            t.NonEmptyStr,
+            u.Field(description="Stable identifier for the purge command"),
+        ] = "cmd_oracle_purge"
+        config_file: Annotated[
+            str | None,
+            u.Field(description="Path to JSON configuration file for target settings"),
+        ] = None
+        stream: Annotated[
+            str | None,
+            u.Field(description="Stream to purge; every partitioned stream when unset"),
+        ] = None
+
+    class OracleTargetGenerateCommand(m.Command):
+        """Command to emit a seeded synthetic Singer stream."""
+
+        command_type: Annotated[
+            t.NonEmptyStr,
+            u.Field(description="Command discriminator for synthetic stream output"),
+        ] = c.TargetOracle.COMMAND_TYPE_GENERATE
+        command_id: Annotated[
+            t.NonEmptyStr,
+            u.Field(description="Stable identifier for the generate command"),
+        ] = "cmd_oracle_generate"
+        output_file: Annotated[
+            str | None,
+            u.Field(description="File to write Singer lines to; stdout when unset"),
+        ] = None
+        seed: Annotated[
+            int, u.Field(description="Random seed; equal seeds give equal output")
+        ] = 0
+        streams: Annotated[
+            int, u.Field(ge=1, description="Number of streams, records interleaved")
+        ] = 1
+        records: Annotated[
+            int, u.Field(ge=0, description="RECORD messages emitted per stream")
+        ] = 1000
+        columns: Annotated[
+            int, u.Field(ge=1, description="Scalar columns per record besides the key")
+        ] = 8
+        string_length: Annotated[
+            int, u.Field(ge=1, description="Length of generated string values")
+        ] = 16
+        nested_objects: Annotated[
+            int, u.Field(ge=0, description="Object-typed fields per record")
+        ] = 0
+        array_length: Annotated[
+            int,
+            u.Field(
+                ge=0, description="Items in one array field per record; 0 omits it"
+            ),
+        ] = 0
+        key_cardinality: Annotated[
+            int,
+            u.Field(
+                ge=0, description="Distinct key values per stream; 0 keeps keys unique"
+            ),
+        ] = 0
+        duplicate_rate: Annotated[
+            float,
+            u.Field(
+                ge=0.0,
+                le=1.0,
+                description="Share of records that repeat an earlier key",
+            ),
+        ] = 0.0
+        clob_size: Annotated[
+            int, u.Field(ge=0, description="Characters in one CLOB-sized text field")
+        ] = 0
+        state_every: Annotated[
+            int,
+            u.Field(ge=0, description="Emit a STATE message every N records; 0 never"),
+        ] = 0
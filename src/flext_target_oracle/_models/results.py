@@ -134,6 +134,118 @@ class FlextTargetOracleModelsResults:
                 validate_default=True,
             ),
         ] = u.Field(default_factory=_default_buffer_status, validate_default=True)
+        stream_statistics: Annotated[
+            t.SequenceOf[FlextTargetOracleModelsResults.LoadStatisticsModel],
+            u.Field(
+                ...,
+                description="Per-stream load statistics including rejected rows",
+                validate_default=True,
+            ),
+        ] = u.Field(default_factory=tuple, validate_default=True)
+        unswapped_shadows: Annotated[
+            t.StrSequence,
+            u.Field(
+                ...,
+                description="Shadow tables of versions that were never activated",
+                validate_default=True,
+            ),
+        ] = u.Field(default_factory=tuple, validate_default=True)
+
+    class LatencySummary(m.ArbitraryTypesModel):
+        """Quantile summary of one latency histogram, in milliseconds."""
+
+        count: Annotated[
+            t.NonNegativeInt,
+            u.Field(..., description="Observations recorded", validate_default=True),
+        ]
+        total_ms: Annotated[
+            float, u.Field(..., description="Sum of observations", validate_default=True)
+        ]
+        min_ms: Annotated[
+            float, u.Field(..., description="Smallest observation", validate_default=True)
+        ]
+        max_ms: Annotated[
+            float, u.Field(..., description="Largest observation", validate_default=True)
+        ]
+        p50_ms: Annotated[
+            float, u.Field(..., description="Median observation", validate_default=True)
+        ]
+        p90_ms: Annotated[
+            float,
+            u.Field(..., description="90th percentile observation", validate_default=True),
+        ]
+        p99_ms: Annotated[
+            float,
+            u.Field(..., description="99th percentile observation", validate_default=True),
+        ]
+
+    class StreamMetrics(m.ArbitraryTypesModel):
+        """Counters and latency summaries recorded for one stream."""
+
+        stream_name: Annotated[
+            str, u.Field(..., description="Stream identifier", validate_default=True)
+        ]
+        counters: Annotated[
+            t.MappingKV[str, int],
+            u.Field(
+                ...,
+                description="Counter values (rows_in, loaded, bytes_in, flushes, ...)",
+                validate_default=True,
+            ),
+        ]
+        latencies: Annotated[
+            t.MappingKV[str, FlextTargetOracleModelsResults.LatencySummary],
+            u.Field(
+                ...,
+                description="Latency summaries by phase (parse, execute, ...)",
+                validate_default=True,
+            ),
+        ]
+
+    class MetricsSnapshot(m.ArbitraryTypesModel):
+        """Point-in-time copy of the loader metrics registry."""
+
+        uptime_seconds: Annotated[
+            float,
+            u.Field(
+                ..., description="Seconds since the registry started", validate_default=True
+            ),
+        ]
+        streams: Annotated[
+            t.SequenceOf[FlextTargetOracleModelsResults.StreamMetrics],
+            u.Field(..., description="Per-stream metrics", validate_default=True),
+        ] = u.Field(default_factory=tuple, validate_default=True)
+
+    class RejectedRow(m.ArbitraryTypesModel):
+        """Row rejected by Oracle array DML and routed to quarantine."""
+
+        stream_name: Annotated[
+            str, u.Field(..., description="Stream identifier", validate_default=True)
+        ]
+        batch_offset: Annotated[
+            t.NonNegativeInt,
+            u.Field(
+                ...,
+                description="Row offset inside the failed batch",
+                validate_default=True,
+            ),
+        ]
+        error_code: Annotated[
+            str,
+            u.Field(
+                ...,
+                description="Oracle error code (ORA-NNNNN) when available",
+                validate_default=True,
+            ),
+        ] = ""
+        error_message: Annotated[
+            str,
+            u.Field(..., description="Oracle error message", validate_default=True),
+        ]
+        row: Annotated[
+            t.JsonMapping,
+            u.Field(..., description="Bound row values", validate_default=True),
+        ]
 
     class ImplementationMetrics(m.ArbitraryTypesModel):
         """Oracle target implementation metrics."""
@@ -179,6 +291,30 @@ class FlextTargetOracleModelsResults:
             t.NonNegativeInt,
             u.Field(..., description="Processed batch count", validate_default=True),
         ]
+        rejected_records: Annotated[
+            t.NonNegativeInt,
+            u.Field(
+                ...,
+                description="Rows rejected by Oracle and routed to quarantine",
+                validate_default=True,
+            ),
+        ] = 0
+        collapsed_records: Annotated[
+            t.NonNegativeInt,
+            u.Field(
+                ...,
+                description="Buffered rows replaced by a later row with the same key",
+                validate_default=True,
+            ),
+        ] = 0
+        unchanged_records: Annotated[
+            t.NonNegativeInt,
+            u.Field(
+                ...,
+                description="Rows skipped because their row hash was unchanged",
+                validate_default=True,
+            ),
+        ] = 0
 
         def finalize(self) -> Self:
             """Finalize statistics and return self."""
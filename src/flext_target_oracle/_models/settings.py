@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from flext_meltano import m, t, u
 
@@ -87,3 +87,78 @@ class FlextTargetOracleModelsSettings:
         table_suffix: str = u.Field(
             ..., description="Target table name suffix", validate_default=True
         )
+
+    class TablePartitioning(m.ArbitraryTypesModel):
+        """Per-stream interval partitioning for created target tables."""
+
+        interval: Annotated[
+            Literal["day", "month"],
+            u.Field(
+                ...,
+                description="Interval partition granularity",
+                validate_default=True,
+            ),
+        ] = "day"
+        column: Annotated[
+            str,
+            u.Field(
+                ...,
+                description=(
+                    "TIMESTAMP column the table is partitioned on; it is created "
+                    "NOT NULL, so records without a value are rejected"
+                ),
+                validate_default=True,
+            ),
+        ] = "_SDC_LOADED_AT"
+        retention: Annotated[
+            t.PositiveInt | None,
+            u.Field(
+                ...,
+                description="Intervals kept before partitions are dropped",
+                validate_default=True,
+            ),
+        ] = None
+
+    class TableOptions(m.ArbitraryTypesModel):
+        """Per-stream storage clauses for created target tables."""
+
+        compression: Annotated[
+            Literal["none", "basic", "advanced"],
+            u.Field(
+                ...,
+                description="Table row store compression",
+                validate_default=True,
+            ),
+        ] = "none"
+        securefile: Annotated[
+            bool,
+            u.Field(
+                ...,
+                description="Store LOB columns as SECUREFILE",
+                validate_default=True,
+            ),
+        ] = False
+        lob_compression: Annotated[
+            Literal["none", "low", "medium", "high"],
+            u.Field(
+                ...,
+                description="SECUREFILE LOB compression level",
+                validate_default=True,
+            ),
+        ] = "none"
+        lob_deduplicate: Annotated[
+            bool,
+            u.Field(
+                ...,
+                description="Deduplicate identical SECUREFILE LOB values",
+                validate_default=True,
+            ),
+        ] = False
+        lob_cache: Annotated[
+            Literal["default", "cache", "nocache"],
+            u.Field(
+                ...,
+                description="LOB buffer cache mode",
+                validate_default=True,
+            ),
+        ] = "default"
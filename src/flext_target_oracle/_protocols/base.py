@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import date, time, timedelta
+    from decimal import Decimal
 
     from flext_meltano import p
     from flext_target_oracle import m, t
@@ -32,6 +34,22 @@ class FlextTargetOracleProtocolsBase:
             """The error value if the operation failed, else None."""
             ...
 
+    @runtime_checkable
+    class ColumnarBatch(Protocol):
+        """Protocol for Arrow-style columnar batches (``Table``/``RecordBatch``)."""
+
+        def to_pydict(
+            self,
+        ) -> t.MappingKV[
+            str, t.SequenceOf[t.JsonValue | date | time | timedelta | Decimal]
+        ]:
+            """Return the batch as a column-name to column-values mapping.
+
+            Arrow hands temporal and decimal columns back as Python
+            ``datetime``/``date``/``time``/``timedelta`` and ``Decimal``.
+            """
+            ...
+
     @runtime_checkable
     class Target(Protocol):
         """Protocol for Oracle target operations."""
@@ -11,7 +11,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Literal
 
 from pydantic_settings import SettingsConfigDict
 
@@ -54,7 +54,15 @@ class FlextTargetOracleSettings(FlextSettings):
             int, m.Field(default=30, ge=1, description="Transaction timeout (s)")
         ]
         parallel_degree: Annotated[
-            int, m.Field(default=1, ge=1, description="Oracle parallel degree")
+            int,
+            m.Field(
+                default=1,
+                ge=1,
+                description=(
+                    "Parallel DML degree for the set-based duplicate-key "
+                    "DELETE of merge bulk loads; array-bound writes stay serial"
+                ),
+            ),
         ]
         table_prefix: Annotated[
             str, m.Field(default="", description="Table name prefix")
@@ -74,6 +82,144 @@ class FlextTargetOracleSettings(FlextSettings):
         json_column_name: Annotated[
             str, m.Field(default="DATA", description="JSON payload column")
         ]
+        json_column_type: Annotated[
+            str,
+            m.Field(
+                default="CLOB",
+                description=(
+                    "JSON payload column type: CLOB, or JSON (native type on 21c+, "
+                    "BLOB IS JSON otherwise) bound as UTF-8 bytes"
+                ),
+            ),
+        ]
+        on_batch_error: Annotated[
+            Literal["fail", "quarantine"],
+            m.Field(
+                default="fail",
+                description=(
+                    "Failed array DML handling: fail the batch, or roll it back "
+                    "and bisect it so only the rejected rows are quarantined"
+                ),
+            ),
+        ]
+        quarantine_dir: Annotated[
+            str,
+            m.Field(
+                default="quarantine",
+                description="Directory for per-stream rejected-row JSONL files",
+            ),
+        ]
+        preflight_validation: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Check bound rows against the column widths (in the "
+                    "column's BYTE or CHAR semantics), numeric types and "
+                    "nullability Oracle reports before sending a batch"
+                ),
+            ),
+        ]
+        row_hash_enabled: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Store a row hash in _SDC_ROW_HASH and MERGE only rows "
+                    "whose hash changed"
+                ),
+            ),
+        ]
+        row_hash_cache: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Seed a local key-to-hash cache from the table and skip "
+                    "unchanged rows before sending them"
+                ),
+            ),
+        ]
+        row_hash_cache_size: Annotated[
+            int,
+            m.Field(
+                default=100_000,
+                ge=1,
+                description=(
+                    "Maximum keys held in the row hash cache per stream; the "
+                    "least recently used keys are evicted first"
+                ),
+            ),
+        ]
+        sort_batches_by_key: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Sort each flushed batch by key columns so index blocks "
+                    "are visited in order"
+                ),
+            ),
+        ]
+        sparse_bind_groups: Annotated[
+            int,
+            m.Field(
+                default=0,
+                ge=0,
+                description=(
+                    "Maximum number of present-column signatures inserted with "
+                    "narrower statements per batch (0 binds every column); "
+                    "direct-path bulk loads always bind every column"
+                ),
+            ),
+        ]
+        full_table_swap: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Load versioned RECORD messages into a shadow table and swap "
+                    "it in on the matching ACTIVATE_VERSION. The swap is two "
+                    "renames, so readers briefly miss the table; triggers, foreign "
+                    "keys, comments and statistics of the old table are dropped"
+                ),
+            ),
+        ]
+        truncate_empty_versions: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Truncate the live table when a full_table_swap version is "
+                    "opened and activated without any records"
+                ),
+            ),
+        ]
+        initial_load_mode: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Create new tables without primary key or custom indexes, "
+                    "load them direct-path and build the indexes at finalize"
+                ),
+            ),
+        ]
+        index_parallel_degree: Annotated[
+            int,
+            m.Field(
+                default=4,
+                ge=1,
+                description="Parallel degree for deferred index builds",
+            ),
+        ]
+        index_nologging: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Build deferred indexes with NOLOGGING",
+            ),
+        ]
         truncate_before_load: Annotated[
             bool, m.Field(default=False, description="Truncate before load")
         ]
@@ -100,6 +246,127 @@ class FlextTargetOracleSettings(FlextSettings):
                 default="{}", description="Per-stream custom index definitions (JSON)"
             ),
         ]
+        table_partitioning: Annotated[
+            str,
+            m.Field(
+                default="{}",
+                description=(
+                    "Per-stream interval partitioning and retention for created "
+                    "tables (JSON)"
+                ),
+            ),
+        ]
+        table_options: Annotated[
+            str,
+            m.Field(
+                default="{}",
+                description=(
+                    "Per-stream row compression and LOB storage options for "
+                    "created tables (JSON)"
+                ),
+            ),
+        ]
+        singer_metrics: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description=(
+                    "Write Singer SDK-style METRIC lines (record_count, "
+                    "batch_processing_time) through the target logger"
+                ),
+            ),
+        ]
+        singer_metrics_interval: Annotated[
+            float,
+            m.Field(
+                default=60.0,
+                ge=0,
+                description=(
+                    "Minimum seconds between record_count METRIC lines, "
+                    "checked when a batch is flushed (0 emits one per batch)"
+                ),
+            ),
+        ]
+        prometheus_port: Annotated[
+            int,
+            m.Field(
+                default=0,
+                ge=0,
+                le=65535,
+                description="Serve Prometheus /metrics on this port (0 disables)",
+            ),
+        ]
+        prometheus_host: Annotated[
+            str,
+            m.Field(
+                default="127.0.0.1",
+                description="Interface the Prometheus endpoint binds to",
+            ),
+        ]
+        prometheus_textfile: Annotated[
+            str,
+            m.Field(
+                default="",
+                description=(
+                    "Rewrite this node_exporter textfile (*.prom) after every "
+                    "flush (empty disables)"
+                ),
+            ),
+        ]
+        profile_signal: Annotated[
+            str,
+            m.Field(
+                default="",
+                description=(
+                    "Signal name (e.g. SIGUSR2) that opens a CPU and allocation "
+                    "profiling window (empty disables)"
+                ),
+            ),
+        ]
+        profile_on_start: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Open a profiling window as soon as the loader starts",
+            ),
+        ]
+        profile_seconds: Annotated[
+            float,
+            m.Field(default=30.0, gt=0, description="Length of one profiling window"),
+        ]
+        profile_interval: Annotated[
+            float,
+            m.Field(
+                default=0.005, gt=0, description="CPU seconds between stack samples"
+            ),
+        ]
+        profile_dir: Annotated[
+            str,
+            m.Field(
+                default="profiles",
+                description="Directory for folded-stack CPU and allocation profiles",
+            ),
+        ]
+        trace_export_file: Annotated[
+            str,
+            m.Field(
+                default="",
+                description=(
+                    "Append statement timing spans as OTLP/JSON lines to this "
+                    "file (empty disables)"
+                ),
+            ),
+        ]
+        trace_export_endpoint: Annotated[
+            str,
+            m.Field(
+                default="",
+                description=(
+                    "POST statement timing spans to this OTLP/HTTP traces URL, "
+                    "e.g. http://localhost:4318/v1/traces (empty disables)"
+                ),
+            ),
+        ]
         use_bulk_operations: Annotated[
             bool, m.Field(default=True, description="Use bulk operations")
         ]
@@ -6,6 +6,8 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from flext_meltano import m, t
 
 
@@ -14,6 +16,16 @@ class FlextTargetOracleTypesBase:
 
     FLAT_CONTAINER_MAP_ADAPTER: m.TypeAdapter[t.JsonMapping] = t.json_mapping_adapter()
     STR_MAP_ADAPTER: m.TypeAdapter[t.StrMapping] = t.str_mapping_adapter()
+    JSON_LIST_ADAPTER: m.TypeAdapter[list[t.JsonValue]] = m.TypeAdapter(
+        list[t.JsonValue]
+    )
+
+    type BindValue = t.JsonValue | bytes
+    type BindRow = t.MappingKV[str, BindValue]
+    type BindTuple = tuple[BindValue, ...]
+    type OffsetRow = tuple[int, BindTuple]
+    type BindColumns = t.MappingKV[str, t.SequenceOf[BindValue]]
+    type ColumnCheck = Callable[[t.SequenceOf[BindValue]], dict[int, str]]
 
 
 __all__: list[str] = ["FlextTargetOracleTypesBase"]
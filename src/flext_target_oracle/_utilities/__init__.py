@@ -12,10 +12,19 @@ if TYPE_CHECKING:
     from .client import FlextTargetOracle as FlextTargetOracle
     from .errors import FlextTargetOracleErrorMetadata as FlextTargetOracleErrorMetadata
     from .errors import FlextTargetOracleExceptions as FlextTargetOracleExceptions
+    from .generator import (
+        FlextTargetOracleSingerGenerator as FlextTargetOracleSingerGenerator,
+    )
     from .loader import FlextTargetOracleLoader as FlextTargetOracleLoader
+    from .metrics import FlextTargetOracleMetrics as FlextTargetOracleMetrics
     from .observability import (
         FlextTargetOracleUtilitiesObservability as FlextTargetOracleUtilitiesObservability,
     )
+    from .profiling import FlextTargetOracleProfiler as FlextTargetOracleProfiler
+    from .prometheus import (
+        FlextTargetOracleMetricsExporter as FlextTargetOracleMetricsExporter,
+    )
+    from .quarantine import FlextTargetOracleQuarantine as FlextTargetOracleQuarantine
     from .services import FlextTargetOracleBatchService as FlextTargetOracleBatchService
     from .services import (
         FlextTargetOracleConnectionService as FlextTargetOracleConnectionService,
@@ -26,19 +35,30 @@ if TYPE_CHECKING:
     from .services import (
         FlextTargetOracleSchemaService as FlextTargetOracleSchemaService,
     )
+    from .tracing import FlextTargetOracleSpanExporter as FlextTargetOracleSpanExporter
+    from .validation import (
+        FlextTargetOracleRowValidator as FlextTargetOracleRowValidator,
+    )
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".base": ("FlextTargetOracleUtilitiesBase",),
     ".client": ("FlextTargetOracle",),
     ".errors": ("FlextTargetOracleErrorMetadata", "FlextTargetOracleExceptions"),
+    ".generator": ("FlextTargetOracleSingerGenerator",),
     ".loader": ("FlextTargetOracleLoader",),
+    ".metrics": ("FlextTargetOracleMetrics",),
     ".observability": ("FlextTargetOracleUtilitiesObservability",),
+    ".profiling": ("FlextTargetOracleProfiler",),
+    ".prometheus": ("FlextTargetOracleMetricsExporter",),
+    ".quarantine": ("FlextTargetOracleQuarantine",),
     ".services": (
         "FlextTargetOracleBatchService",
         "FlextTargetOracleConnectionService",
         "FlextTargetOracleRecordService",
         "FlextTargetOracleSchemaService",
     ),
+    ".tracing": ("FlextTargetOracleSpanExporter",),
+    ".validation": ("FlextTargetOracleRowValidator",),
 }
 
 
@@ -56,8 +76,15 @@ _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextTargetOracleErrorMetadata",
     "FlextTargetOracleExceptions",
     "FlextTargetOracleLoader",
+    "FlextTargetOracleMetrics",
+    "FlextTargetOracleMetricsExporter",
+    "FlextTargetOracleProfiler",
+    "FlextTargetOracleQuarantine",
     "FlextTargetOracleRecordService",
+    "FlextTargetOracleRowValidator",
     "FlextTargetOracleSchemaService",
+    "FlextTargetOracleSingerGenerator",
+    "FlextTargetOracleSpanExporter",
     "FlextTargetOracleUtilitiesBase",
     "FlextTargetOracleUtilitiesObservability",
 )
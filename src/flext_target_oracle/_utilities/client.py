@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, ClassVar
 
 from flext_meltano import u
@@ -11,15 +12,22 @@ from flext_target_oracle._utilities.loader import FlextTargetOracleLoader
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
+    from flext_db_oracle import FlextDbOracleApi
+    from flext_target_oracle._utilities.metrics import FlextTargetOracleMetrics
+
 
 class FlextTargetOracle:
     """Singer target client that coordinates schema and record loading."""
 
     logger: ClassVar[p.Logger] = u.fetch_logger(__name__)
 
-    def __init__(self, settings: FlextTargetOracleSettings) -> None:
+    def __init__(
+        self,
+        settings: FlextTargetOracleSettings,
+        oracle_api: FlextDbOracleApi | None = None,
+    ) -> None:
         """Create target with validated settings and loader dependencies."""
-        self.loader = FlextTargetOracleLoader(settings)
+        self.loader = FlextTargetOracleLoader(settings, oracle_api)
         self.schemas: MutableMapping[str, m.Meltano.SingerSchemaMessage] = {}
         self.state_message: m.Meltano.SingerStateMessage = m.Meltano.SingerStateMessage(
             type="STATE", value={}
@@ -96,11 +104,19 @@ class FlextTargetOracle:
 
     def _execute_payload(self, payload: str) -> p.Result[bool]:
         """Parse and process one Singer JSON line."""
+        parse_started = time.perf_counter_ns()
         message_result = self._parse_singer_payload(payload)
         if message_result.failure:
             return r[bool].fail(message_result.error or "Invalid Singer payload")
         message = message_result.value
-        process_result = self.process_singer_message(message)
+        if isinstance(message, m.Meltano.SingerRecordMessage):
+            self._record_parse(message.stream, payload, parse_started)
+        process_result = (
+            self._handle_record(message, raw_record=self._raw_record_json(payload))
+            if isinstance(message, m.Meltano.SingerRecordMessage)
+            and self.loader.accepts_raw_record(message.stream)
+            else self.process_singer_message(message)
+        )
         if process_result.failure:
             return r[bool].fail(process_result.error or "Singer message failed")
         if isinstance(message, m.Meltano.SingerRecordMessage):
@@ -129,6 +145,24 @@ class FlextTargetOracle:
                 | m.Meltano.SingerActivateVersionMessage
             ].fail(f"Invalid Singer payload: {exc}")
 
+    @staticmethod
+    def _raw_record_json(payload: str) -> str | None:
+        """Slice the ``record`` object verbatim out of one Singer JSON line.
+
+        Only the top-level scalar members around ``record`` are matched, so the
+        slice is exact or ``None`` (callers then fall back to re-serializing).
+        """
+        prefix_match = c.TargetOracle.SINGER_RECORD_PREFIX_RE.match(payload)
+        if prefix_match is None:
+            return None
+        record_start = prefix_match.end()
+        record_end = payload.rfind("}", record_start, payload.rfind("}")) + 1
+        if not record_end or not c.TargetOracle.SINGER_RECORD_SUFFIX_RE.fullmatch(
+            payload, record_end
+        ):
+            return None
+        return payload[record_start:record_end]
+
     def _parse_singer_mapping(
         self, raw: t.JsonMapping
     ) -> p.Result[
@@ -164,6 +198,15 @@ class FlextTargetOracle:
         """Flush remaining batches and return loader statistics."""
         return self.loader.finalize_all_streams()
 
+    @property
+    def metrics(self) -> FlextTargetOracleMetrics:
+        """Return the live per-stream metrics registry of the loader."""
+        return self.loader.metrics
+
+    def metrics_snapshot(self) -> m.TargetOracle.MetricsSnapshot:
+        """Return a point-in-time copy of the per-stream metrics."""
+        return self.loader.metrics.snapshot()
+
     def get_implementation_metrics(self) -> m.TargetOracle.ImplementationMetrics:
         """Return static target metrics."""
         return m.TargetOracle.ImplementationMetrics(
@@ -232,11 +275,30 @@ class FlextTargetOracle:
     def write_record(self, record_data: str) -> p.Result[bool]:
         """Write one Singer record payload to Oracle."""
         try:
+            parse_started = time.perf_counter_ns()
             payload = m.Meltano.SingerRecordMessage.model_validate_json(record_data)
-            return self.loader.load_record(payload.stream, payload.record)
+            self._record_parse(payload.stream, record_data, parse_started)
+            raw_record = (
+                self._raw_record_json(record_data)
+                if self.loader.accepts_raw_record(payload.stream)
+                else None
+            )
+            return self.loader.load_record(
+                payload.stream, payload.record, raw_record, payload.version
+            )
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
             return r[bool].fail(f"Invalid record payload: {exc}")
 
+    def _record_parse(self, stream_name: str, payload: str, started_ns: int) -> None:
+        """Count the raw payload size and add to the batch's parse time."""
+        metrics = self.loader.metrics
+        metrics.increment(stream_name, "bytes_in", len(payload))
+        metrics.accumulate(
+            c.TargetOracle.METRIC_PHASE_PARSE,
+            stream_name,
+            time.perf_counter_ns() - started_ns,
+        )
+
     def _handle_activate_version(
         self, activate_message: m.Meltano.SingerActivateVersionMessage
     ) -> p.Result[bool]:
@@ -245,13 +307,23 @@ class FlextTargetOracle:
             stream=activate_message.stream,
             version=activate_message.version,
         )
+        activate_result = self.loader.activate_version(
+            activate_message.stream, activate_message.version
+        )
+        if activate_result.failure:
+            return r[bool].fail(activate_result.error or "Failed to activate version")
         return r[bool].ok(True)
 
     def _handle_record(
-        self, record_message: m.Meltano.SingerRecordMessage
+        self,
+        record_message: m.Meltano.SingerRecordMessage,
+        raw_record: str | None = None,
     ) -> p.Result[bool]:
         load_result = self.loader.load_record(
-            record_message.stream, record_message.record
+            record_message.stream,
+            record_message.record,
+            raw_record,
+            record_message.version,
         )
         if load_result.failure:
             return r[bool].fail(load_result.error or "Failed to load record")
@@ -0,0 +1,187 @@
+"""Seeded synthetic Singer streams for load, benchmark and scaling runs.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, TextIO
+
+from flext_meltano import p
+from flext_target_oracle import c, m, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class FlextTargetOracleSingerGenerator:
+    """Deterministic Singer SCHEMA/RECORD/STATE lines from one generate command.
+
+    Scalar values are drawn from per-column pools built once per run, so the
+    cost per line is dominated by JSON encoding. The same command (including
+    ``seed``) always yields byte-identical output.
+    """
+
+    FIELD_TYPES: tuple[str, ...] = ("string", "integer", "number", "boolean", "date")
+    BASE_TIMESTAMP = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def __init__(self, command: m.TargetOracle.OracleTargetGenerateCommand) -> None:
+        """Bind the generation parameters; nothing is drawn until iteration."""
+        self.command = command
+        self.stream_names: tuple[str, ...] = tuple(
+            f"{c.TargetOracle.GENERATOR_STREAM_PREFIX}_{index:02d}"
+            for index in range(command.streams)
+        )
+
+    def schema_message(self, stream_name: str) -> t.JsonMapping:
+        """Return the SCHEMA message describing one generated stream."""
+        properties: dict[str, t.JsonValue] = {"id": {"type": "integer"}}
+        for index in range(self.command.columns):
+            field_type = self.FIELD_TYPES[index % len(self.FIELD_TYPES)]
+            properties[f"col_{index:02d}"] = (
+                {"type": ["null", "string"], "format": "date-time"}
+                if field_type == "date"
+                else {"type": ["null", field_type]}
+            )
+        for index in range(self.command.nested_objects):
+            properties[f"obj_{index:02d}"] = {
+                "type": "object",
+                "properties": {
+                    "code": {"type": "string"},
+                    "value": {"type": "number"},
+                },
+            }
+        if self.command.array_length:
+            properties["items"] = {"type": "array", "items": {"type": "integer"}}
+        if self.command.clob_size:
+            properties["payload"] = {"type": "string"}
+        properties["updated_at"] = {"type": "string", "format": "date-time"}
+        return {
+            "type": "SCHEMA",
+            "stream": stream_name,
+            "schema": {"type": "object", "properties": properties},
+            "key_properties": ["id"],
+        }
+
+    def lines(self) -> Iterator[str]:
+        """Yield every Singer line: schemas first, then interleaved records."""
+        command = self.command
+        rng = random.Random(command.seed)
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        pools = self._value_pools(rng)
+        pool_bits = c.TargetOracle.GENERATOR_VALUE_POOL_SIZE.bit_length() - 1
+        clob_pool = tuple(
+            self._random_text(rng, command.clob_size)
+            for _ in range(c.TargetOracle.GENERATOR_CLOB_POOL_SIZE)
+            if command.clob_size
+        )
+        for stream_name in self.stream_names:
+            yield encode(self.schema_message(stream_name))
+        emitted = 0
+        for sequence in range(command.records):
+            updated_at = self._timestamp(sequence)
+            for stream_name in self.stream_names:
+                record: dict[str, t.JsonValue] = {
+                    "id": self._record_key(rng, sequence)
+                }
+                for column_name, pool in pools:
+                    record[column_name] = pool[rng.getrandbits(pool_bits)]
+                for index in range(command.nested_objects):
+                    record[f"obj_{index:02d}"] = {
+                        "code": f"C{rng.randrange(1000):03d}",
+                        "value": round(rng.random() * 1000, 3),
+                    }
+                if command.array_length:
+                    record["items"] = [
+                        rng.randrange(1_000_000) for _ in range(command.array_length)
+                    ]
+                if command.clob_size:
+                    record["payload"] = clob_pool[rng.randrange(len(clob_pool))]
+                record["updated_at"] = updated_at
+                yield encode({
+                    "type": "RECORD",
+                    "stream": stream_name,
+                    "record": record,
+                })
+                emitted += 1
+                if command.state_every and emitted % command.state_every == 0:
+                    yield encode(self._state_message(sequence))
+
+    def write(self, handle: TextIO) -> p.Result[int]:
+        """Write all lines to ``handle`` in large chunks; return the line count."""
+        written = 0
+        chunk: list[str] = []
+        try:
+            for line in self.lines():
+                chunk.append(line)
+                if len(chunk) >= c.TargetOracle.GENERATOR_WRITE_CHUNK_LINES:
+                    handle.write("\n".join(chunk) + "\n")
+                    written += len(chunk)
+                    chunk.clear()
+            if chunk:
+                handle.write("\n".join(chunk) + "\n")
+                written += len(chunk)
+            handle.flush()
+        except OSError as exc:
+            return r[int].fail_op("write synthetic Singer stream", exc)
+        return r[int].ok(written)
+
+    def _state_message(self, sequence: int) -> t.JsonMapping:
+        """Return a STATE message bookmarking every stream at ``sequence``."""
+        bookmark = {"replication_key_value": self._timestamp(sequence)}
+        return {
+            "type": "STATE",
+            "value": {"bookmarks": dict.fromkeys(self.stream_names, bookmark)},
+        }
+
+    def _record_key(self, rng: random.Random, sequence: int) -> int:
+        """Return the key for one record honouring cardinality and duplicates."""
+        cardinality = self.command.key_cardinality
+        key = sequence % cardinality if cardinality else sequence
+        if (
+            sequence
+            and self.command.duplicate_rate
+            and rng.random() < self.command.duplicate_rate
+        ):
+            key = rng.randrange(min(sequence, cardinality) if cardinality else sequence)
+        return key
+
+    def _value_pools(
+        self, rng: random.Random
+    ) -> tuple[tuple[str, tuple[t.JsonValue, ...]], ...]:
+        """Draw the per-column value pools for this run."""
+        draw: dict[str, Callable[[], t.JsonValue]] = {
+            "string": lambda: self._random_text(rng, self.command.string_length),
+            "integer": lambda: rng.randrange(-1_000_000, 1_000_000),
+            "number": lambda: round(rng.uniform(-1e6, 1e6), 4),
+            "boolean": lambda: rng.random() < 0.5,
+            "date": lambda: self._timestamp(rng.randrange(10_000_000)),
+        }
+        return tuple(
+            (
+                f"col_{index:02d}",
+                tuple(
+                    draw[self.FIELD_TYPES[index % len(self.FIELD_TYPES)]]()
+                    for _ in range(c.TargetOracle.GENERATOR_VALUE_POOL_SIZE)
+                ),
+            )
+            for index in range(self.command.columns)
+        )
+
+    @staticmethod
+    def _random_text(rng: random.Random, length: int) -> str:
+        """Return ``length`` characters from the generator alphabet."""
+        return "".join(rng.choices(c.TargetOracle.GENERATOR_STRING_ALPHABET, k=length))
+
+    @classmethod
+    def _timestamp(cls, offset_seconds: int) -> str:
+        """Return an ISO-8601 UTC timestamp ``offset_seconds`` after the base."""
+        return (cls.BASE_TIMESTAMP + timedelta(seconds=offset_seconds)).isoformat()
+
+
+__all__: list[str] = ["FlextTargetOracleSingerGenerator"]
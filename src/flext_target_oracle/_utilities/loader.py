@@ -10,16 +10,33 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 import json
-from collections.abc import Mapping, Sequence
-from datetime import datetime
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from decimal import Decimal, InvalidOperation
 from operator import itemgetter
-from typing import ClassVar, override
+from typing import TYPE_CHECKING, ClassVar, override
 
 from flext_db_oracle import FlextDbOracleApi, FlextDbOracleSettings
 from flext_meltano import FlextMeltanoServiceBase, u
 from flext_target_oracle import FlextTargetOracleSettings, c, m, p, r, t
 from flext_target_oracle._utilities.errors import FlextTargetOracleExceptions as e
+from flext_target_oracle._utilities.metrics import FlextTargetOracleMetrics
+from flext_target_oracle._utilities.observability import (
+    FlextTargetOracleUtilitiesObservability,
+)
+from flext_target_oracle._utilities.profiling import FlextTargetOracleProfiler
+from flext_target_oracle._utilities.prometheus import FlextTargetOracleMetricsExporter
+from flext_target_oracle._utilities.quarantine import FlextTargetOracleQuarantine
+from flext_target_oracle._utilities.tracing import FlextTargetOracleSpanExporter
+from flext_target_oracle._utilities.validation import FlextTargetOracleRowValidator
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
 
 
 class FlextTargetOracleLoader(FlextMeltanoServiceBase):
@@ -50,6 +67,43 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         default_factory=dict
     )
     _stream_key_columns: dict[str, t.StrSequence] = u.PrivateAttr(default_factory=dict)
+    _stream_key_fields: t.MutableStrPairTupleMapping = u.PrivateAttr(
+        default_factory=dict
+    )
+    _buffer_key_slots: dict[str, dict[tuple[t.JsonValue, ...], int]] = u.PrivateAttr(
+        default_factory=dict
+    )
+    _stream_validators: dict[str, FlextTargetOracleRowValidator] = u.PrivateAttr(
+        default_factory=dict
+    )
+    _raw_record_buffers: dict[str, list[str | None]] = u.PrivateAttr(
+        default_factory=dict
+    )
+    _raw_record_streams: set[str] = u.PrivateAttr(default_factory=set)
+    _binary_json_streams: set[str] = u.PrivateAttr(default_factory=set)
+    _row_hash_streams: set[str] = u.PrivateAttr(default_factory=set)
+    _stream_nested_fields: dict[str, t.StrSequence] = u.PrivateAttr(
+        default_factory=dict
+    )
+    _shadow_tables: dict[str, tuple[int, str]] = u.PrivateAttr(default_factory=dict)
+    _opened_versions: dict[str, int] = u.PrivateAttr(default_factory=dict)
+    _deferred_index_streams: set[str] = u.PrivateAttr(default_factory=set)
+    _row_hash_cache: dict[str, dict[tuple[str, ...], str]] = u.PrivateAttr(
+        default_factory=dict
+    )
+    _oracle_major_version: int | None = u.PrivateAttr(default=None)
+    _database_character_set: str | None = u.PrivateAttr(default=None)
+    _last_loaded_at: datetime | None = u.PrivateAttr(default=None)
+    _metrics: FlextTargetOracleMetrics = u.PrivateAttr(
+        default_factory=FlextTargetOracleMetrics
+    )
+    _quarantine: FlextTargetOracleQuarantine = u.PrivateAttr()
+    _span_exporter: FlextTargetOracleSpanExporter = u.PrivateAttr()
+    _singer_metrics_due: float = u.PrivateAttr(default=0.0)
+    _metrics_exporter: FlextTargetOracleMetricsExporter | None = u.PrivateAttr(
+        default=None
+    )
+    _profiler: FlextTargetOracleProfiler | None = u.PrivateAttr(default=None)
     _total_records: int = u.PrivateAttr(default_factory=lambda: 0)
     _sdc_timestamp_columns: ClassVar[t.StrSequence] = (
         "_SDC_EXTRACTED_AT",
@@ -67,22 +121,121 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         if isinstance(value, str) and value:
             try:
                 parsed: datetime = datetime.fromisoformat(value)
-                return parsed.replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S.%f")
+                return parsed.replace(tzinfo=None).strftime(
+                    c.TargetOracle.ORACLE_TIMESTAMP_TEXT_FORMAT
+                )
             except ValueError:
                 return value
         generated_at: datetime = u.generate_datetime_utc()
-        return generated_at.replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S.%f")
+        return generated_at.replace(tzinfo=None).strftime(
+            c.TargetOracle.ORACLE_TIMESTAMP_TEXT_FORMAT
+        )
 
-    @classmethod
-    def _with_oracle_timestamp_binds(cls, sql: str) -> str:
-        """Wrap owner-managed SDC timestamp binds with Oracle conversion."""
-        converted_sql = sql
-        for column_name in cls._sdc_timestamp_columns:
-            converted_sql = converted_sql.replace(
-                f":{column_name}",
-                f"TO_TIMESTAMP(:{column_name}, 'YYYY-MM-DD\"T\"HH24:MI:SS.FF6')",
+    def _next_loaded_at(self) -> str:
+        """Return a ``_SDC_LOADED_AT`` stamp later than every earlier one.
+
+        Deferred-key dedup keeps the row with the latest stamp per key, so two
+        writes of this loader must never share a stamp or run backwards.
+        """
+        loaded_at = u.generate_datetime_utc().replace(tzinfo=None)
+        if self._last_loaded_at is not None and loaded_at <= self._last_loaded_at:
+            loaded_at = self._last_loaded_at + timedelta(microseconds=1)
+        self._last_loaded_at = loaded_at
+        return loaded_at.strftime(c.TargetOracle.ORACLE_TIMESTAMP_TEXT_FORMAT)
+
+    @staticmethod
+    def _canonical_text(value: t.TargetOracle.BindValue | datetime | Decimal) -> str:
+        """Return a type-stable text form of one value.
+
+        Numbers compare by value (``1``, ``1.0`` and ``Decimal("1.00")`` agree)
+        and datetimes use the Oracle timestamp text the loader binds.
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (int, float, Decimal)):
+            return format(Decimal(str(value)).normalize(), "f")
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=None).strftime(
+                c.TargetOracle.ORACLE_TIMESTAMP_TEXT_FORMAT
             )
-        return converted_sql
+        if isinstance(value, bytes):
+            return value.decode(c.DEFAULT_ENCODING, errors="replace")
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+    @classmethod
+    def _cache_key_text(
+        cls, value: t.TargetOracle.BindValue | datetime | Decimal, data_type: str
+    ) -> str:
+        """Normalize one key value alike for bound rows and rows read back.
+
+        Text bound into a NUMBER or TIMESTAMP column is read back as a number
+        or datetime, so it is parsed the way Oracle would before comparing.
+        """
+        if isinstance(value, str) and value:
+            type_name = data_type.upper()
+            if type_name.startswith(c.TargetOracle.ORACLE_TEMPORAL_TYPE_PREFIXES):
+                return cls._oracle_timestamp_text(value)
+            if type_name.startswith(c.TargetOracle.ORACLE_NUMERIC_TYPE_PREFIXES):
+                try:
+                    return cls._canonical_text(Decimal(value.strip()))
+                except InvalidOperation:
+                    return value
+        return cls._canonical_text(value)
+
+    @classmethod
+    def _bind_placeholder(cls, column_name: str, position: int) -> str:
+        """Return the positional bind for one column, converting SDC timestamps."""
+        if column_name in cls._sdc_timestamp_columns:
+            return f"TO_TIMESTAMP(:{position}, 'YYYY-MM-DD\"T\"HH24:MI:SS.FF6')"
+        return f":{position}"
+
+    @classmethod
+    def _insert_statement(
+        cls,
+        schema_name: str,
+        table_name: str,
+        column_names: t.StrSequence,
+        *,
+        direct_path: bool = False,
+    ) -> str:
+        """Render an array INSERT binding ``:1..:n`` in ``column_names`` order.
+
+        A bound VALUES insert is never parallelized by Oracle, so a
+        direct-path INSERT only carries the APPEND_VALUES hint.
+        """
+        hint = f"{c.TargetOracle.DIRECT_PATH_INSERT_HINT} " if direct_path else ""
+        insert_list = ", ".join(f'"{name}"' for name in column_names)
+        values_list = ", ".join(
+            cls._bind_placeholder(name, position)
+            for position, name in enumerate(column_names, 1)
+        )
+        return (
+            f"INSERT {hint}INTO {schema_name}.{table_name} ({insert_list}) "
+            f"VALUES ({values_list})"
+        )
+
+    def _stream_table_name(self, stream_name: str) -> str:
+        """Return the configured Oracle table name for one Singer stream."""
+        return (
+            f"{self.target_config.TargetOracle.table_prefix}{(stream_name).replace(chr(45), chr(95)).replace(chr(46), chr(95))}{self.target_config.TargetOracle.table_suffix}"
+        ).upper()
+
+    def _target_table_name(self, stream_name: str) -> str:
+        """Return the table a stream currently loads into (shadow or live)."""
+        shadow_table = self._shadow_tables.get(stream_name)
+        if shadow_table is not None:
+            return shadow_table[1]
+        return self._stream_table_name(stream_name)
+
+    @staticmethod
+    def _derived_table_name(table_name: str, suffix: str) -> str:
+        """Return a suffixed table name within the identifier length limit."""
+        return (
+            f"{table_name[: c.TargetOracle.MAX_IDENTIFIER_LENGTH - len(suffix)]}"
+            f"{suffix}"
+        )
 
     def _loader_columns(
         self,
@@ -150,22 +303,120 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
                 json_storage_enabled=json_storage_enabled,
                 type_mapping=type_mapping_result.value,
             )
+        self._binary_json_streams.discard(stream_name)
         if json_storage_enabled:
+            json_column_result = self._json_payload_column()
+            if json_column_result.failure:
+                return r[tuple[m.DbOracle.Column, ...]].fail(
+                    json_column_result.error or "Failed to resolve JSON column type"
+                )
+            columns.append(json_column_result.value)
+            if json_column_result.value.data_type != c.DbOracle.DataType.CLOB.value:
+                self._binary_json_streams.add(stream_name)
+        columns.extend(self._sdc_columns())
+        if self.target_config.TargetOracle.row_hash_enabled:
             columns.append(
                 m.DbOracle.Column(
-                    name=self.target_config.TargetOracle.json_column_name.upper(),
-                    data_type=c.DbOracle.DataType.CLOB.value,
+                    name=c.TargetOracle.ROW_HASH_COLUMN,
+                    data_type=c.TargetOracle.ROW_HASH_DATA_TYPE,
                     nullable=True,
                 )
             )
-        columns.extend(self._sdc_columns())
+            self._row_hash_streams.add(stream_name)
+            if self.target_config.TargetOracle.row_hash_cache:
+                self._row_hash_cache.setdefault(stream_name, {})
+        else:
+            self._row_hash_streams.discard(stream_name)
+        mapped_sources = frozenset(source_name for source_name, _ in field_mappings)
+        self._stream_nested_fields[stream_name] = tuple(
+            source_name
+            for source_name in properties
+            if source_name not in mapped_sources
+            and source_name not in ignored_columns
+            and not source_name.startswith("_sdc_")
+        )
+        partitioning_result = self._stream_partitioning(stream_name)
+        if partitioning_result.failure:
+            return r[tuple[m.DbOracle.Column, ...]].fail(
+                partitioning_result.error or "Invalid partitioning"
+            )
+        if partitioning_result.value is not None:
+            # Interval partitioning cannot place a NULL key (ORA-14400); a
+            # NOT NULL column turns it into a per-row ORA-01400 that
+            # pre-flight validation catches before the batch is sent.
+            partition_column = partitioning_result.value.column.upper()
+            columns = [
+                column.model_copy(update={"nullable": False})
+                if column.name == partition_column
+                else column
+                for column in columns
+            ]
         ordered_columns = self._ordered_columns(columns)
         cached_columns = tuple(ordered_columns)
         self._stream_columns[stream_name] = cached_columns
         self._stream_field_mappings[stream_name] = tuple(field_mappings)
         self._stream_key_columns[stream_name] = key_columns
+        self._stream_key_fields[stream_name] = tuple(
+            (source_name, target_name)
+            for source_name, target_name in field_mappings
+            if target_name.upper() in key_columns
+        )
+        self._stream_validators[stream_name] = FlextTargetOracleRowValidator(
+            cached_columns
+        )
+        if json_storage_enabled and not stream_mappings and not ignored_columns:
+            self._raw_record_streams.add(stream_name)
+        else:
+            self._raw_record_streams.discard(stream_name)
         return r[tuple[m.DbOracle.Column, ...]].ok(cached_columns)
 
+    def _json_payload_column(self) -> p.Result[m.DbOracle.Column]:
+        """Return the JSON payload column for the configured column type.
+
+        ``JSON`` resolves to the native type on Oracle 21c+ and to a
+        ``BLOB ... IS JSON`` column on older releases; both bind UTF-8 bytes.
+        """
+        column_name = self.target_config.TargetOracle.json_column_name.upper()
+        if (
+            self.target_config.TargetOracle.json_column_type.upper()
+            != c.TargetOracle.JSON_COLUMN_TYPE_JSON
+        ):
+            return r[m.DbOracle.Column].ok(
+                m.DbOracle.Column(
+                    name=column_name,
+                    data_type=c.DbOracle.DataType.CLOB.value,
+                    nullable=True,
+                )
+            )
+        version_result = self._resolve_oracle_major_version()
+        if version_result.failure:
+            return r[m.DbOracle.Column].fail(
+                version_result.error or "Failed to read Oracle version"
+            )
+        data_type = (
+            c.TargetOracle.JSON_COLUMN_TYPE_JSON
+            if version_result.value >= c.TargetOracle.NATIVE_JSON_MIN_VERSION
+            else f'{c.TargetOracle.JSON_FALLBACK_DATA_TYPE} CHECK ("{column_name}" IS JSON)'
+        )
+        return r[m.DbOracle.Column].ok(
+            m.DbOracle.Column(name=column_name, data_type=data_type, nullable=True)
+        )
+
+    def _resolve_oracle_major_version(self) -> p.Result[int]:
+        """Return the cached Oracle server major release number."""
+        if self._oracle_major_version is not None:
+            return r[int].ok(self._oracle_major_version)
+        with self.oracle_api as connected_api:
+            version_result = connected_api.oracle_services.execute_query(
+                'SELECT version AS "version" FROM product_component_version '
+                "WHERE product LIKE 'Oracle%'"
+            )
+        if version_result.failure or not version_result.value:
+            return r[int].fail_op("read Oracle version", version_result.error)
+        version_text = str(version_result.value[0].root["version"])
+        self._oracle_major_version = int(version_text.split(".", 1)[0])
+        return r[int].ok(self._oracle_major_version)
+
     @staticmethod
     def _schema_field_type(definition: t.JsonMapping) -> str:
         """Return the effective non-null Singer field type."""
@@ -294,15 +545,28 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             for column in grouped_columns.get(group_name, ())
         ]
 
-    def __init__(self, settings: FlextTargetOracleSettings, **_data: t.Scalar) -> None:
-        """Initialize loader with Oracle API using flext-db-oracle correctly."""
+    def __init__(
+        self,
+        settings: FlextTargetOracleSettings,
+        oracle_api: FlextDbOracleApi | None = None,
+        **_data: t.Scalar,
+    ) -> None:
+        """Initialize loader with Oracle API using flext-db-oracle correctly.
+
+        ``oracle_api`` replaces the API built from ``settings``; benchmarks pass
+        an in-process stand-in so the load path runs without a database.
+        """
         try:
-            self._init_oracle_loader(settings)
+            self._init_oracle_loader(settings, oracle_api)
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
             msg = f"Failed to create Oracle API: {exc}"
             raise e.OracleConnectionError(msg) from exc
 
-    def _init_oracle_loader(self, settings: FlextTargetOracleSettings) -> None:
+    def _init_oracle_loader(
+        self,
+        settings: FlextTargetOracleSettings,
+        oracle_api: FlextDbOracleApi | None = None,
+    ) -> None:
         """Initialize mutable loader state."""
         super().__init__()
         # NOTE (multi-agent): mro-rn88 — FlextDbOracleSettings namespaces its scalars under
@@ -317,12 +581,83 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             }
         })
         self._target_config = settings
-        self._oracle_api = FlextDbOracleApi(oracle_config)
+        self._oracle_api = (
+            oracle_api if oracle_api is not None else FlextDbOracleApi(oracle_config)
+        )
         self._record_buffers = self._default_record_buffers()
         self._stream_columns = {}
         self._stream_field_mappings = {}
         self._stream_key_columns = {}
+        self._stream_key_fields = {}
+        self._buffer_key_slots = {}
+        self._stream_validators = {}
+        self._raw_record_buffers = {}
+        self._raw_record_streams = set()
+        self._binary_json_streams = set()
+        self._row_hash_streams = set()
+        self._shadow_tables = {}
+        self._opened_versions = {}
+        self._deferred_index_streams = set()
+        self._row_hash_cache = {}
+        self._oracle_major_version = None
+        self._database_character_set = None
+        self._last_loaded_at = None
+        self._metrics = FlextTargetOracleMetrics()
+        self._quarantine = FlextTargetOracleQuarantine(
+            settings.TargetOracle.quarantine_dir
+        )
+        self._span_exporter = FlextTargetOracleSpanExporter(
+            settings.TargetOracle.trace_export_file,
+            settings.TargetOracle.trace_export_endpoint,
+        )
+        self._singer_metrics_due = (
+            time.monotonic() + settings.TargetOracle.singer_metrics_interval
+        )
         self._total_records = 0
+        self._metrics_exporter = None
+        if (
+            settings.TargetOracle.prometheus_port
+            or settings.TargetOracle.prometheus_textfile
+        ):
+            self._metrics_exporter = FlextTargetOracleMetricsExporter(
+                self._metrics, self.buffer_depths
+            )
+        if self._metrics_exporter is not None and settings.TargetOracle.prometheus_port:
+            start_result = self._metrics_exporter.start(
+                settings.TargetOracle.prometheus_host,
+                settings.TargetOracle.prometheus_port,
+            )
+            if start_result.failure:
+                self.log_error(
+                    "Prometheus endpoint disabled", error=str(start_result.error)
+                )
+        self._profiler = None
+        if settings.TargetOracle.profile_signal or settings.TargetOracle.profile_on_start:
+            self._profiler = self._build_profiler(settings)
+
+    def _build_profiler(
+        self, settings: FlextTargetOracleSettings
+    ) -> FlextTargetOracleProfiler:
+        """Create the profiler, arm its signal and open a window if requested."""
+        profiler = FlextTargetOracleProfiler(
+            settings.TargetOracle.profile_dir,
+            settings.TargetOracle.profile_seconds,
+            settings.TargetOracle.profile_interval,
+            phases=(
+                FlextTargetOracleLoader._load_record_unchecked.__code__,
+                FlextTargetOracleLoader._build_batch_parameters.__code__,
+                FlextTargetOracleLoader._flush_batch_unchecked.__code__,
+            ),
+        )
+        results: list[p.Result[bool]] = []
+        if settings.TargetOracle.profile_signal:
+            results.append(profiler.install_signal(settings.TargetOracle.profile_signal))
+        if settings.TargetOracle.profile_on_start:
+            results.append(profiler.start())
+        for result in results:
+            if result.failure:
+                self.log_error("Profiling unavailable", error=str(result.error))
+        return profiler
 
     @property
     def oracle_api(self) -> FlextDbOracleApi:
@@ -336,6 +671,14 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         """Access record buffers."""
         return self._record_buffers
 
+    def accepts_raw_record(self, stream_name: str) -> bool:
+        """Return whether raw record JSON is bound verbatim for a stream.
+
+        Only ``json``/``hybrid`` storage streams without column mappings or
+        ignored columns store the record payload unchanged.
+        """
+        return stream_name in self._raw_record_streams
+
     @property
     def target_config(self) -> FlextTargetOracleSettings:
         """Access target configuration."""
@@ -346,6 +689,162 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         """Access total records count."""
         return self._total_records
 
+    @property
+    def quarantine(self) -> FlextTargetOracleQuarantine:
+        """Access the rejected-row quarantine writer."""
+        return self._quarantine
+
+    @property
+    def metrics(self) -> FlextTargetOracleMetrics:
+        """Access the per-stream counters and latency histograms."""
+        return self._metrics
+
+    @property
+    def span_exporter(self) -> FlextTargetOracleSpanExporter:
+        """Access the statement span exporter."""
+        return self._span_exporter
+
+    @property
+    def metrics_exporter(self) -> FlextTargetOracleMetricsExporter | None:
+        """Access the Prometheus exporter; ``None`` unless configured."""
+        return self._metrics_exporter
+
+    @property
+    def profiler(self) -> FlextTargetOracleProfiler | None:
+        """Access the profiler; ``None`` unless profiling is configured."""
+        return self._profiler
+
+    def buffer_depths(self) -> t.MappingKV[str, int]:
+        """Return the number of buffered, unflushed records per stream."""
+        return {
+            stream_name: len(records)
+            for stream_name, records in tuple(self.record_buffers.items())
+        }
+
+    def _close_metrics_endpoint(self) -> None:
+        """Stop the Prometheus endpoint; the last scrape sees the final counts."""
+        if self._metrics_exporter is not None:
+            self._metrics_exporter.close()
+
+    def _write_metrics_textfile(self) -> None:
+        """Refresh the Prometheus textfile when one is configured."""
+        textfile = self.target_config.TargetOracle.prometheus_textfile
+        if self._metrics_exporter is None or not textfile:
+            return
+        write_result = self._metrics_exporter.write_textfile(textfile)
+        if write_result.failure:
+            self.log_error(
+                "Failed to write Prometheus textfile", error=str(write_result.error)
+            )
+
+    def stream_statistics(self) -> tuple[m.TargetOracle.LoadStatisticsModel, ...]:
+        """Return per-stream write statistics, including quarantined rows."""
+        return tuple(
+            m.TargetOracle.LoadStatisticsModel(
+                stream_name=stream_name,
+                total_records_processed=counters["processed"],
+                successful_records=counters["loaded"],
+                failed_records=counters["failed"] + counters["rejected"],
+                rejected_records=counters["rejected"],
+                collapsed_records=counters["collapsed"],
+                unchanged_records=counters["unchanged"],
+                batches_processed=counters["batches"],
+            )
+            for stream_name in self._metrics.streams
+            if (counters := self._metrics.counters(stream_name))
+        )
+
+    def _count_rows(self, stream_name: str, **counts: int) -> None:
+        """Accumulate per-stream write counters."""
+        self._metrics.update(stream_name, **counts)
+
+    def _emit_singer_metric(self, line: str) -> None:
+        """Log one METRIC line with no extra fields.
+
+        The message is the bare ``METRIC: <json>`` text, so Meltano and SDK
+        log parsers find it in whatever format the logger writes.
+        """
+        self.logger.info(line)
+
+    def _emit_record_counts(self, stream_names: t.StrSequence) -> None:
+        """Emit a record_count counter for records received since the last one."""
+        for stream_name in stream_names:
+            received = self._metrics.unreported(stream_name, "rows_in")
+            if received:
+                self._emit_singer_metric(
+                    self._metrics.singer_metric(
+                        c.TargetOracle.SINGER_METRIC_COUNTER,
+                        c.TargetOracle.SINGER_METRIC_RECORD_COUNT,
+                        received,
+                        {"stream": stream_name},
+                    )
+                )
+
+    def _statement_span(
+        self, sql: str, bind_count: int
+    ) -> AbstractContextManager[FlextTargetOracleSpanExporter.Span]:
+        """Open a timing span named after the statement verb and table."""
+        table_match = c.TargetOracle.SQL_STATEMENT_TABLE_RE.search(sql)
+        return FlextTargetOracleUtilitiesObservability.target_oracle_monitor_query_performance(
+            table_match.group(1) if table_match else "",
+            sql.split(maxsplit=1)[0].upper(),
+            statement=sql,
+            bind_count=bind_count,
+            exporter=self._span_exporter,
+        )
+
+    def _export_spans(self) -> None:
+        """Ship queued statement spans; a failed export is logged, not raised."""
+        export_result = self._span_exporter.flush()
+        if export_result.failure:
+            self.log_error(
+                "Failed to export trace spans", error=str(export_result.error)
+            )
+
+    def _execute_sql(
+        self,
+        connected_api: FlextDbOracleApi,
+        sql: str,
+        params: t.JsonMapping | None = None,
+    ) -> p.Result[int]:
+        """Run one DDL/DML statement, inside a timing span when tracing."""
+        if not self._span_exporter.enabled:
+            return (
+                connected_api.execute_sql(sql, params)
+                if params is not None
+                else connected_api.execute_sql(sql)
+            )
+        with self._statement_span(sql, len(params or {})) as span:
+            result = (
+                connected_api.execute_sql(sql, params)
+                if params is not None
+                else connected_api.execute_sql(sql)
+            )
+            if result.success:
+                span.rows_affected = result.value or 0
+            else:
+                span.error = str(result.error)
+            return result
+
+    def _execute_many(
+        self,
+        connected_api: FlextDbOracleApi,
+        sql: str,
+        rows: t.SequenceOf[t.TargetOracle.BindTuple],
+    ) -> p.Result[int]:
+        """Run one positionally bound array statement, traced when enabled."""
+        if not self._span_exporter.enabled:
+            return connected_api.execute_many(sql, rows)
+        with self._statement_span(
+            sql, len(rows) * len(rows[0]) if rows else 0
+        ) as span:
+            result = connected_api.execute_many(sql, rows)
+            if result.success:
+                span.rows_affected = result.value or 0
+            else:
+                span.error = str(result.error)
+            return result
+
     def _run_connection_operation(
         self, *, operation_name: str, result: p.TargetOracle.ConnectionOperationResult
     ) -> p.Result[bool]:
@@ -370,6 +869,7 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
 
     def disconnect(self) -> p.Result[bool]:
         """Disconnect underlying FlextDbOracleApi (exposed for tests)."""
+        self._close_metrics_endpoint()
         return self._run_connection_operation(
             operation_name="Disconnect", result=self.oracle_api.disconnect()
         )
@@ -396,9 +896,7 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         key_properties: t.StrSequence | None,
     ) -> p.Result[bool]:
         """Ensure a table exists after exception handling has been delegated."""
-        table_name = (
-            f"{self.target_config.TargetOracle.table_prefix}{(stream_name).replace(chr(45), chr(95)).replace(chr(46), chr(95))}{self.target_config.TargetOracle.table_suffix}"
-        ).upper()
+        table_name = self._stream_table_name(stream_name)
         stream_columns_result = self._loader_columns(
             stream_name, schema, key_properties
         )
@@ -414,19 +912,37 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
                 return r[bool].fail(f"Failed to check tables: {tables_result.error}")
             existing_tables = [table.upper() for table in tables_result.value or []]
             if table_name.upper() in existing_tables:
-                return self._prepare_existing_table(connected_api, table_name)
-            ddl_result = connected_api.oracle_services.create_table_ddl(
+                return self._prepare_existing_table(
+                    connected_api, stream_name, table_name
+                )
+            initial_load = self.target_config.TargetOracle.initial_load_mode
+            create_result = self._create_table(
+                connected_api,
+                stream_name,
                 table_name,
-                stream_columns_result.value,
-                schema=self.target_config.TargetOracle.default_target_schema,
+                [
+                    column.model_copy(update={"primary_key": False})
+                    for column in stream_columns_result.value
+                ]
+                if initial_load
+                else stream_columns_result.value,
             )
-            if ddl_result.failure:
-                return r[bool].fail(
-                    f"Failed to build create table SQL: {ddl_result.error}"
+            if create_result.failure:
+                return create_result
+            limits_result = self._sync_column_limits(
+                connected_api, stream_name, table_name
+            )
+            if limits_result.failure:
+                return limits_result
+            if initial_load:
+                mark_result = self._mark_keys_pending(
+                    connected_api, table_name, pending=True
                 )
-            exec_result = connected_api.execute_sql(ddl_result.value)
-            if exec_result.failure:
-                return r[bool].fail(f"Failed to create table: {exec_result.error}")
+                if mark_result.failure:
+                    return mark_result
+                self._deferred_index_streams.add(stream_name)
+                self.log_info(f"Created table {table_name} for initial load")
+                return r[bool].ok(value=True)
             index_result = self._create_custom_indexes(
                 connected_api, stream_name, table_name
             )
@@ -435,115 +951,1038 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             self.log_info(f"Created table {table_name}")
             return r[bool].ok(value=True)
 
-    def _prepare_existing_table(
-        self, connected_api: FlextDbOracleApi, table_name: str
+    def _create_table(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        columns: t.SequenceOf[m.DbOracle.Column],
     ) -> p.Result[bool]:
-        """Prepare an existing table before loading records."""
-        if self.target_config.TargetOracle.truncate_before_load:
-            truncate_sql = (
-                f"TRUNCATE TABLE "
-                f"{self.target_config.TargetOracle.default_target_schema}.{table_name}"
-            )
-            truncate_result = connected_api.execute_sql(truncate_sql)
-            if truncate_result.failure:
-                return r[bool].fail(
-                    f"Failed to truncate table: {truncate_result.error}"
-                )
-            self.log_info(f"Truncated table {table_name}")
-        self.log_info(f"Table {table_name} already exists")
+        """Build and run the CREATE TABLE DDL for one column layout."""
+        ddl_result = connected_api.oracle_services.create_table_ddl(
+            table_name,
+            list(columns),
+            schema=self.target_config.TargetOracle.default_target_schema,
+        )
+        if ddl_result.failure:
+            return r[bool].fail(f"Failed to build create table SQL: {ddl_result.error}")
+        table_ddl_result = self._decorate_table_ddl(
+            stream_name, ddl_result.value, columns
+        )
+        if table_ddl_result.failure:
+            return r[bool].fail(table_ddl_result.error or "Invalid table options")
+        exec_result = self._execute_sql(connected_api, table_ddl_result.value)
+        if exec_result.failure:
+            return r[bool].fail(f"Failed to create table: {exec_result.error}")
         return r[bool].ok(value=True)
 
-    def _create_custom_indexes(
-        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
-    ) -> p.Result[bool]:
-        """Create configured custom indexes for a stream table."""
-        for raw_index in json.loads(
-            self.target_config.TargetOracle.custom_indexes or "{}"
-        ).get(stream_name, ()):
-            index_columns_result = self._custom_index_columns(raw_index, stream_name)
-            if index_columns_result.failure:
-                return r[bool].fail(index_columns_result.error or "Invalid index")
-            raw_index_name = raw_index.get("name") or raw_index.get("index_name")
-            index_name = str(
-                raw_index_name or f"{table_name}_{index_columns_result.value[0]}_IDX"
-            )[:30]
-            index_payload = t.json_mapping_adapter().validate_python({
-                "table_name": table_name,
-                "index_name": index_name,
-                "columns": index_columns_result.value,
-                "unique": bool(raw_index.get("unique", False)),
-                "schema_name": self.target_config.TargetOracle.default_target_schema,
-            })
-            index_sql_result = (
-                connected_api.oracle_services.build_create_index_statement(
-                    index_payload
-                )
+    def _decorate_table_ddl(
+        self,
+        stream_name: str,
+        ddl: str,
+        columns: t.SequenceOf[m.DbOracle.Column],
+    ) -> p.Result[str]:
+        """Append the configured per-stream physical clauses to CREATE TABLE."""
+        options_result = self._stream_table_options(stream_name)
+        if options_result.failure:
+            return r[str].fail(options_result.error or "Invalid table options")
+        storage_clause = self._table_storage_clause(options_result.value, columns)
+        if storage_clause:
+            ddl = f"{ddl.rstrip().rstrip(';')} {storage_clause}"
+        partitioning_result = self._stream_partitioning(stream_name)
+        if partitioning_result.failure:
+            return r[str].fail(partitioning_result.error or "Invalid partitioning")
+        partitioning = partitioning_result.value
+        if partitioning is None:
+            return r[str].ok(ddl)
+        partition_column = partitioning.column.upper()
+        if not any(
+            column.name == partition_column
+            and column.data_type.startswith(c.DbOracle.DataType.TIMESTAMP.value)
+            for column in columns
+        ):
+            return r[str].fail(
+                f"Partition column {partition_column} of {stream_name} "
+                "must be a TIMESTAMP column"
             )
-            if index_sql_result.failure:
-                return r[bool].fail(
-                    f"Failed to build create index SQL: {index_sql_result.error}"
-                )
-            index_exec_result = connected_api.execute_sql(index_sql_result.value)
-            if index_exec_result.failure:
-                return r[bool].fail(
-                    f"Failed to create index: {index_exec_result.error}"
-                )
-        return r[bool].ok(value=True)
+        return r[str].ok(
+            f"{ddl.rstrip().rstrip(';')} "
+            f'PARTITION BY RANGE ("{partition_column}") '
+            f"INTERVAL ({c.TargetOracle.PARTITION_INTERVAL_EXPRESSIONS[partitioning.interval]}) "
+            f"(PARTITION P_INITIAL VALUES LESS THAN "
+            f"({c.TargetOracle.PARTITION_INITIAL_BOUND}))"
+        )
 
     @staticmethod
-    def _custom_index_columns(
-        raw_index: t.JsonMapping, stream_name: str
-    ) -> p.Result[list[str]]:
-        """Normalize custom index columns."""
-        columns_value = raw_index.get("columns", ())
-        if isinstance(columns_value, str) or not isinstance(columns_value, Sequence):
-            return r[list[str]].fail(
-                f"Custom index columns must be a sequence for {stream_name}"
+    def _table_storage_clause(
+        options: m.TargetOracle.TableOptions | None,
+        columns: t.SequenceOf[m.DbOracle.Column],
+    ) -> str:
+        """Render row compression and LOB storage clauses for CREATE TABLE."""
+        if options is None:
+            return ""
+        clauses: list[str] = []
+        if options.compression != "none":
+            clauses.append(f"ROW STORE COMPRESS {options.compression.upper()}")
+        lob_parameters = [
+            *(
+                (f"COMPRESS {options.lob_compression.upper()}",)
+                if options.lob_compression != "none"
+                else ()
+            ),
+            *(("DEDUPLICATE",) if options.lob_deduplicate else ()),
+            *((options.lob_cache.upper(),) if options.lob_cache != "default" else ()),
+        ]
+        securefile = (
+            options.securefile
+            or options.lob_compression != "none"
+            or options.lob_deduplicate
+        )
+        if securefile or lob_parameters:
+            clauses.extend(
+                f'LOB ("{column.name}") STORE AS '
+                f"{'SECUREFILE ' if securefile else ''}"
+                f"({' '.join(lob_parameters) or 'ENABLE STORAGE IN ROW'})"
+                for column in columns
+                if column.data_type.split(" ", 1)[0] in c.TargetOracle.LOB_DATA_TYPES
             )
-        index_columns = [str(column).upper() for column in columns_value]
-        if not index_columns:
-            return r[list[str]].fail(
-                f"Custom index requires at least one column for {stream_name}"
+        return " ".join(clauses)
+
+    def _stream_table_options(
+        self, stream_name: str
+    ) -> p.Result[m.TargetOracle.TableOptions | None]:
+        """Return the configured storage options for one stream."""
+        raw_options = json.loads(
+            self.target_config.TargetOracle.table_options or "{}"
+        ).get(stream_name)
+        if raw_options is None:
+            return r[m.TargetOracle.TableOptions | None].ok(None)
+        try:
+            return r[m.TargetOracle.TableOptions | None].ok(
+                m.TargetOracle.TableOptions.model_validate(raw_options)
+            )
+        except c.ValidationError as exc:
+            return r[m.TargetOracle.TableOptions | None].fail(
+                f"Invalid table options for {stream_name}: {exc}"
             )
-        return r[list[str]].ok(index_columns)
 
-    @override
-    def execute(self) -> p.Result[t.JsonMapping]:
-        """Execute domain service - returns connection test result."""
-        connection_result = self.test_connection()
-        if connection_result.failure:
-            return r[t.JsonMapping].fail_op(
-                "Oracle connection", connection_result.error
+    def _stream_partitioning(
+        self, stream_name: str
+    ) -> p.Result[m.TargetOracle.TablePartitioning | None]:
+        """Return the configured interval partitioning for one stream."""
+        raw_partitioning = json.loads(
+            self.target_config.TargetOracle.table_partitioning or "{}"
+        ).get(stream_name)
+        if raw_partitioning is None:
+            return r[m.TargetOracle.TablePartitioning | None].ok(None)
+        try:
+            return r[m.TargetOracle.TablePartitioning | None].ok(
+                m.TargetOracle.TablePartitioning.model_validate(raw_partitioning)
+            )
+        except c.ValidationError as exc:
+            return r[m.TargetOracle.TablePartitioning | None].fail(
+                f"Invalid table partitioning for {stream_name}: {exc}"
             )
-        return r[t.JsonMapping].ok({
-            "status": "ready",
-            "host": self.target_config.TargetOracle.oracle_host,
-            "service": self.target_config.TargetOracle.oracle_service_name,
-            "schema": self.target_config.TargetOracle.default_target_schema,
-        })
 
-    def finalize_all_streams(self) -> p.Result[m.TargetOracle.LoaderFinalizeResult]:
-        """Finalize all streams and return stats using standardized models."""
+    def purge_expired_partitions(self, stream_name: str) -> p.Result[int]:
+        """Drop interval partitions older than the stream retention window.
+
+        Partitions are dropped as metadata operations instead of DELETEs; the
+        initial range partition is never dropped. Loads never purge; only this
+        call, behind ``target-oracle purge``, does. Returns the dropped count.
+        """
         try:
-            return self._finalize_all_streams_unchecked()
+            return self._purge_expired_partitions_unchecked(stream_name)
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
-            self.log_error("Failed to finalize streams", error=str(exc))
-            return r[m.TargetOracle.LoaderFinalizeResult].fail_op(
-                "finalize streams", exc
+            self.log_error("Failed to purge partitions", error=str(exc))
+            return r[int].fail_op("purge partitions", exc)
+
+    def _purge_expired_partitions_unchecked(self, stream_name: str) -> p.Result[int]:
+        """Drop expired partitions after exception handling has been delegated."""
+        with self.oracle_api as connected_api:
+            return self._drop_expired_partitions(connected_api, stream_name)
+
+    def _drop_expired_partitions(
+        self, connected_api: FlextDbOracleApi, stream_name: str
+    ) -> p.Result[int]:
+        """Drop interval partitions whose upper bound is before the cutoff."""
+        partitioning_result = self._stream_partitioning(stream_name)
+        if partitioning_result.failure:
+            return r[int].fail(partitioning_result.error or "Invalid partitioning")
+        partitioning = partitioning_result.value
+        if partitioning is None or partitioning.retention is None:
+            return r[int].ok(0)
+        now = u.generate_datetime_utc().replace(tzinfo=None)
+        if partitioning.interval == "month":
+            month_index = now.year * 12 + now.month - 1 - partitioning.retention
+            cutoff = datetime(month_index // 12, month_index % 12 + 1, 1)
+        else:
+            cutoff = datetime(now.year, now.month, now.day) - timedelta(
+                days=partitioning.retention
+            )
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        table_name = self._stream_table_name(stream_name)
+        dropped = 0
+        partitions_result = connected_api.oracle_services.execute_query(
+            'SELECT partition_name AS "partition_name", '
+            'high_value AS "high_value" FROM all_tab_partitions '
+            "WHERE table_owner = :owner AND table_name = :table_name "
+            "AND interval = 'YES'",
+            m.ConfigMap(
+                root={"owner": schema_name.upper(), "table_name": table_name}
+            ),
+        )
+        if partitions_result.failure:
+            return r[int].fail_op("read partitions", partitions_result.error)
+        for row in partitions_result.value:
+            bound_match = c.TargetOracle.PARTITION_HIGH_VALUE_RE.search(
+                str(row.root["high_value"])
             )
+            if bound_match is None or (
+                datetime.fromisoformat(bound_match.group(1)) > cutoff
+            ):
+                continue
+            drop_result = self._execute_sql(
+                connected_api,
+                f"ALTER TABLE {schema_name}.{table_name} DROP PARTITION "
+                f'"{row.root["partition_name"]}" UPDATE GLOBAL INDEXES'
+            )
+            if drop_result.failure:
+                return r[int].fail_op("drop partition", drop_result.error)
+            dropped += 1
+        if dropped:
+            self.log_info(f"Dropped {dropped} expired partitions of {table_name}")
+        return r[int].ok(dropped)
 
-    def _finalize_all_streams_unchecked(
-        self,
-    ) -> p.Result[m.TargetOracle.LoaderFinalizeResult]:
-        """Finalize streams after exception handling has been delegated."""
-        started_at = str(u.now())
-        records_failed = 0
-        for stream_name, records in self.record_buffers.items():
-            if records:
-                result = self._flush_batch(stream_name)
+    def activate_version(self, stream_name: str, version: int) -> p.Result[bool]:
+        """Apply Singer ACTIVATE_VERSION full-table semantics for one stream.
+
+        With ``full_table_swap`` the RECORD messages of a version opened by
+        an ACTIVATE_VERSION in this run load into an index-free shadow table,
+        and the ACTIVATE_VERSION that follows them swaps the shadow in by
+        rename. Records of a version that was not opened here load into the
+        live table, so a tap that sends just the closing message leaves no
+        shadow behind. A version opened and closed without records empties
+        the live table only with ``truncate_empty_versions``. Readers keep
+        seeing the previous table until the new version is complete, apart
+        from the gap between the two renames of the swap.
+        """
+        try:
+            return self._activate_version_unchecked(stream_name, version)
+        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+            self.log_error("Failed to activate version", error=str(exc))
+            return r[bool].fail_op("activate version", exc)
+
+    def _activate_version_unchecked(
+        self, stream_name: str, version: int
+    ) -> p.Result[bool]:
+        """Complete or mark a version after exception handling is delegated."""
+        if not self.target_config.TargetOracle.full_table_swap:
+            return r[bool].ok(value=True)
+        if not self._stream_columns.get(stream_name, ()):
+            return r[bool].fail(f"No registered schema for stream {stream_name}")
+        active_shadow = self._shadow_tables.get(stream_name)
+        if active_shadow is not None and active_shadow[0] == version:
+            return self._swap_shadow_table(stream_name)
+        if self._opened_versions.get(stream_name) == version:
+            del self._opened_versions[stream_name]
+            if not self.target_config.TargetOracle.truncate_empty_versions:
+                self.log_info(
+                    f"Version {version} of {stream_name} is empty; "
+                    "live table left unchanged"
+                )
+                return r[bool].ok(value=True)
+            return self._truncate_live_table(stream_name, version)
+        self._opened_versions[stream_name] = version
+        self.log_info(f"Opened version {version} of {stream_name}")
+        return r[bool].ok(value=True)
+
+    def _route_record_version(self, stream_name: str, version: int) -> p.Result[bool]:
+        """Send a versioned record to the shadow table of its version.
+
+        Only a version opened by ACTIVATE_VERSION in this run gets a shadow;
+        any other version keeps loading into the table it loads into now.
+        """
+        if not self.target_config.TargetOracle.full_table_swap:
+            return r[bool].ok(value=True)
+        active_shadow = self._shadow_tables.get(stream_name)
+        if active_shadow is not None and active_shadow[0] == version:
+            return r[bool].ok(value=True)
+        if self._opened_versions.get(stream_name) != version:
+            return r[bool].ok(value=True)
+        return self._start_shadow_table(stream_name, version)
+
+    def _start_shadow_table(self, stream_name: str, version: int) -> p.Result[bool]:
+        """Create the shadow table a new version loads into.
+
+        Buffered rows are flushed to their current table first. A shadow left
+        by a version that never completed is dropped and replaced.
+        """
+        stream_columns = self._stream_columns.get(stream_name, ())
+        if not stream_columns:
+            return r[bool].fail(f"No registered schema for stream {stream_name}")
+        flush_result = self._flush_batch(stream_name)
+        if flush_result.failure:
+            return flush_result
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        shadow_name = self._derived_table_name(
+            self._stream_table_name(stream_name), c.TargetOracle.SHADOW_TABLE_SUFFIX
+        )
+        with self.oracle_api as connected_api:
+            tables_result = connected_api.fetch_tables(schema=schema_name)
+            if tables_result.failure:
+                return r[bool].fail(f"Failed to check tables: {tables_result.error}")
+            if shadow_name in {table.upper() for table in tables_result.value or []}:
+                drop_result = self._execute_sql(
+                    connected_api, f"DROP TABLE {schema_name}.{shadow_name} PURGE"
+                )
+                if drop_result.failure:
+                    return r[bool].fail(
+                        f"Failed to drop stale shadow table: {drop_result.error}"
+                    )
+            create_result = self._create_table(
+                connected_api,
+                stream_name,
+                shadow_name,
+                [
+                    column.model_copy(update={"primary_key": False})
+                    for column in stream_columns
+                ],
+            )
+            if create_result.failure:
+                return create_result
+        self._shadow_tables[stream_name] = (version, shadow_name)
+        self._opened_versions.pop(stream_name, None)
+        self.log_info(f"Loading {stream_name} version {version} into {shadow_name}")
+        return r[bool].ok(value=True)
+
+    def _swap_shadow_table(self, stream_name: str) -> p.Result[bool]:
+        """Swap a completed shadow table in place of the live stream table.
+
+        The shadow gets its deduplicated primary key, custom indexes and the
+        live table's grants first, so the table is complete the moment it is
+        renamed in. The two renames run back to back but are two DDL
+        statements, so a reader between them gets ORA-00942; if the second
+        one fails the live table is renamed back. Indexes take their live
+        names once the retired table is gone. A partitioned table is swapped
+        whole by rename, not by partition exchange. Triggers, foreign keys,
+        comments and optimizer statistics of the live table are not carried
+        over; triggers and foreign keys it has are logged before it is
+        dropped.
+        """
+        flush_result = self._flush_batch(stream_name)
+        if flush_result.failure:
+            return flush_result
+        version, shadow_name = self._shadow_tables.pop(stream_name)
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        table_name = self._stream_table_name(stream_name)
+        retired_name = self._derived_table_name(
+            table_name, c.TargetOracle.RETIRED_TABLE_SUFFIX
+        )
+        with self.oracle_api as connected_api:
+            index_result = self._build_table_indexes(
+                connected_api, stream_name, shadow_name, live_table_name=table_name
+            )
+            if index_result.failure:
+                return index_result
+            grant_result = self._copy_table_grants(
+                connected_api, table_name, shadow_name
+            )
+            if grant_result.failure:
+                return grant_result
+            self._warn_retired_dependents(connected_api, stream_name, table_name)
+            retire_result = self._execute_sql(
+                connected_api,
+                f"ALTER TABLE {schema_name}.{table_name} RENAME TO {retired_name}",
+            )
+            if retire_result.failure:
+                return r[bool].fail_op("retire live table", retire_result.error)
+            activate_result = self._execute_sql(
+                connected_api,
+                f"ALTER TABLE {schema_name}.{shadow_name} RENAME TO {table_name}",
+            )
+            if activate_result.failure:
+                _ = self._execute_sql(
+                    connected_api,
+                    f"ALTER TABLE {schema_name}.{retired_name} RENAME TO {table_name}",
+                )
+                return r[bool].fail_op("swap shadow table", activate_result.error)
+            drop_result = self._execute_sql(
+                connected_api, f"DROP TABLE {schema_name}.{retired_name} PURGE"
+            )
+            if drop_result.failure:
+                return r[bool].fail_op("drop retired table", drop_result.error)
+            for index_name in self._table_index_names(stream_name, table_name):
+                shadow_index = self._derived_table_name(
+                    index_name, c.TargetOracle.SHADOW_TABLE_SUFFIX
+                )
+                rename_result = self._execute_sql(
+                    connected_api,
+                    f"ALTER INDEX {schema_name}.{shadow_index} RENAME TO {index_name}",
+                )
+                if rename_result.failure:
+                    return r[bool].fail_op("rename shadow index", rename_result.error)
+        if stream_name in self._row_hash_cache:
+            self._row_hash_cache[stream_name] = {}
+        self.log_info(f"Activated version {version} of {stream_name} as {table_name}")
+        return r[bool].ok(value=True)
+
+    def _warn_retired_dependents(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> None:
+        """Log the triggers and foreign keys a swap drops with the live table."""
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        dependents_result = connected_api.oracle_services.execute_query(
+            "SELECT 'trigger ' || trigger_name AS \"dependent\" FROM all_triggers "
+            "WHERE table_owner = :owner AND table_name = :table_name "
+            "UNION ALL SELECT 'foreign key ' || constraint_name FROM all_constraints "
+            "WHERE owner = :owner AND table_name = :table_name "
+            "AND constraint_type = 'R'",
+            m.ConfigMap(
+                root={"owner": schema_name.upper(), "table_name": table_name}
+            ),
+        )
+        if dependents_result.failure:
+            self.logger.warning(
+                "Cannot list dependents of %s before the swap of %s: %s",
+                table_name,
+                stream_name,
+                dependents_result.error,
+            )
+            return
+        dependents = [str(row.root["dependent"]) for row in dependents_result.value]
+        if dependents:
+            self.logger.warning(
+                "Swapping %s drops %s of %s",
+                stream_name,
+                ", ".join(dependents),
+                table_name,
+            )
+
+    def _truncate_live_table(self, stream_name: str, version: int) -> p.Result[bool]:
+        """Empty the live table for a version that completed without records."""
+        flush_result = self._flush_batch(stream_name)
+        if flush_result.failure:
+            return flush_result
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        table_name = self._stream_table_name(stream_name)
+        with self.oracle_api as connected_api:
+            truncate_result = self._execute_sql(
+                connected_api, f"TRUNCATE TABLE {schema_name}.{table_name}"
+            )
+            if truncate_result.failure:
+                return r[bool].fail_op("truncate live table", truncate_result.error)
+        if stream_name in self._row_hash_cache:
+            self._row_hash_cache[stream_name] = {}
+        self.log_info(
+            f"Version {version} of {stream_name} is empty; truncated {table_name}"
+        )
+        return r[bool].ok(value=True)
+
+    def _copy_table_grants(
+        self, connected_api: FlextDbOracleApi, table_name: str, shadow_name: str
+    ) -> p.Result[bool]:
+        """Grant on the shadow table every object privilege the live table has."""
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        grants_result = connected_api.oracle_services.execute_query(
+            'SELECT grantee AS "grantee", privilege AS "privilege", '
+            'grantable AS "grantable" FROM all_tab_privs '
+            "WHERE table_schema = :owner AND table_name = :table_name",
+            m.ConfigMap(
+                root={"owner": schema_name.upper(), "table_name": table_name}
+            ),
+        )
+        if grants_result.failure:
+            return r[bool].fail_op("read table grants", grants_result.error)
+        for row in grants_result.value:
+            grantee = str(row.root["grantee"])
+            grant_result = self._execute_sql(
+                connected_api,
+                f"GRANT {row.root['privilege']} ON {schema_name}.{shadow_name} TO "
+                + (
+                    grantee
+                    if c.TargetOracle.SIMPLE_IDENTIFIER_RE.fullmatch(grantee)
+                    else f'"{grantee}"'
+                )
+                + (" WITH GRANT OPTION" if row.root.get("grantable") == "YES" else ""),
+            )
+            if grant_result.failure:
+                return r[bool].fail_op("copy table grant", grant_result.error)
+        return r[bool].ok(value=True)
+
+    def _table_index_names(self, stream_name: str, table_name: str) -> list[str]:
+        """Return the primary key and custom index names a stream table gets."""
+        index_names = (
+            [
+                self._derived_table_name(
+                    table_name, c.TargetOracle.PRIMARY_KEY_INDEX_SUFFIX
+                )
+            ]
+            if self._stream_key_columns.get(stream_name)
+            else []
+        )
+        for raw_index in json.loads(
+            self.target_config.TargetOracle.custom_indexes or "{}"
+        ).get(stream_name, ()):
+            index_columns_result = self._custom_index_columns(raw_index, stream_name)
+            if index_columns_result.success:
+                index_names.append(
+                    self._custom_index_name(
+                        raw_index, table_name, index_columns_result.value
+                    )
+                )
+        return index_names
+
+    def _build_table_indexes(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        *,
+        live_table_name: str | None = None,
+    ) -> p.Result[bool]:
+        """Build the primary key and custom indexes of a bulk-loaded table.
+
+        Indexes are built with ``index_parallel_degree`` (and NOLOGGING when
+        configured), then reset to NOPARALLEL so later DML stays serial. For
+        merge loads, duplicate keys left by the unindexed load are first
+        reduced, with a ``parallel_degree`` parallel DELETE, to the row with
+        the latest ``_SDC_LOADED_AT``; writes never
+        share a stamp and each write carries a key once, so that row is the
+        last one written. On a shadow table of
+        ``live_table_name`` the index names carry the shadow suffix, so they
+        do not collide with the live table's indexes.
+        """
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        key_columns = self._stream_key_columns.get(stream_name, ())
+        build_clause = self._index_build_clause()
+        if key_columns:
+            key_list = ", ".join(f'"{name}"' for name in key_columns)
+            index_name = self._derived_table_name(
+                live_table_name or table_name, c.TargetOracle.PRIMARY_KEY_INDEX_SUFFIX
+            )
+            if live_table_name is not None:
+                index_name = self._derived_table_name(
+                    index_name, c.TargetOracle.SHADOW_TABLE_SUFFIX
+                )
+            key_statements = [
+                f"CREATE UNIQUE INDEX {schema_name}.{index_name} ON "
+                f"{schema_name}.{table_name} ({key_list}) {build_clause}",
+                f"ALTER INDEX {schema_name}.{index_name} NOPARALLEL",
+                f"ALTER TABLE {schema_name}.{table_name} ADD PRIMARY KEY "
+                f"({key_list}) USING INDEX {schema_name}.{index_name}",
+            ]
+            if self._merge_enabled():
+                degree = self._parallel_dml_degree(connected_api)
+                hint = (
+                    c.TargetOracle.PARALLEL_HINT_TEMPLATE.format(degree=degree) + " "
+                    if degree > 1
+                    else ""
+                )
+                key_statements.insert(
+                    0,
+                    f"DELETE {hint}FROM {schema_name}.{table_name} WHERE ROWID IN "
+                    f"(SELECT row_id FROM (SELECT ROWID AS row_id, ROW_NUMBER() "
+                    f"OVER (PARTITION BY {key_list} "
+                    f'ORDER BY "_SDC_LOADED_AT" DESC NULLS LAST) '
+                    f"AS row_rank FROM {schema_name}.{table_name}) "
+                    f"WHERE row_rank > 1)",
+                )
+            for key_sql in key_statements:
+                key_result = self._execute_sql(connected_api, key_sql)
+                if key_result.failure:
+                    return r[bool].fail_op("build primary key", key_result.error)
+        return self._create_custom_indexes(
+            connected_api,
+            stream_name,
+            table_name,
+            build_clause=build_clause,
+            live_table_name=live_table_name,
+        )
+
+    def _index_build_clause(self) -> str:
+        """Return the PARALLEL/NOLOGGING clause for bulk index builds."""
+        return " ".join((
+            f"PARALLEL {self.target_config.TargetOracle.index_parallel_degree}",
+            *(("NOLOGGING",) if self.target_config.TargetOracle.index_nologging else ()),
+        ))
+
+    def _parallel_dml_degree(self, connected_api: FlextDbOracleApi) -> int:
+        """Enable parallel DML for a set-based statement and return its degree.
+
+        Only the set-based statements of an index build ask for this, so a
+        flush never pays for it. The degree is ``parallel_degree`` as
+        configured: Oracle lowers it itself when fewer parallel servers are
+        free, so no privileged parameter lookup is needed. When the session
+        refuses parallel DML the statement runs serially.
+        """
+        degree = self.target_config.TargetOracle.parallel_degree
+        if degree <= 1:
+            return 1
+        enable_result = self._execute_sql(
+            connected_api, "ALTER SESSION ENABLE PARALLEL DML"
+        )
+        if enable_result.failure:
+            self.log_error(
+                "Parallel DML disabled for session", error=str(enable_result.error)
+            )
+            return 1
+        return degree
+
+    def _bulk_load_stream(self, stream_name: str) -> bool:
+        """Return whether a stream loads direct-path into an unindexed table."""
+        return (
+            stream_name in self._shadow_tables
+            or stream_name in self._deferred_index_streams
+        )
+
+    def _prepare_existing_table(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> p.Result[bool]:
+        """Prepare an existing table before loading records."""
+        binding_result = self._sync_json_payload_binding(
+            connected_api, stream_name, table_name
+        )
+        if binding_result.failure:
+            return binding_result
+        limits_result = self._sync_column_limits(connected_api, stream_name, table_name)
+        if limits_result.failure:
+            return limits_result
+        if self.target_config.TargetOracle.truncate_before_load:
+            truncate_sql = (
+                f"TRUNCATE TABLE "
+                f"{self.target_config.TargetOracle.default_target_schema}.{table_name}"
+            )
+            truncate_result = self._execute_sql(connected_api, truncate_sql)
+            if truncate_result.failure:
+                return r[bool].fail(
+                    f"Failed to truncate table: {truncate_result.error}"
+                )
+            self.log_info(f"Truncated table {table_name}")
+        key_result = self._restore_primary_key(connected_api, stream_name, table_name)
+        if key_result.failure:
+            return key_result
+        if stream_name in self._row_hash_streams:
+            row_hash_result = self._prepare_row_hash_column(
+                connected_api, stream_name, table_name
+            )
+            if row_hash_result.failure:
+                return row_hash_result
+        self.log_info(f"Table {table_name} already exists")
+        return r[bool].ok(value=True)
+
+    def _restore_primary_key(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> p.Result[bool]:
+        """Rebuild the primary key an interrupted initial load never built.
+
+        Only tables still carrying the keys-pending comment the initial load
+        set are touched; any other keyed table without a primary key is left
+        as it is, with a warning. For a pending table under
+        ``initial_load_mode`` the stream keeps loading direct-path and the key
+        is built at finalize; otherwise duplicates are collapsed and the key
+        is built now, before merge deletes rely on it. A unique index left by
+        a build that stopped halfway is dropped first.
+        """
+        if (
+            not self._stream_key_columns.get(stream_name)
+            or stream_name in self._deferred_index_streams
+        ):
+            return r[bool].ok(value=True)
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        constraint_result = connected_api.oracle_services.execute_query(
+            'SELECT constraint_name AS "constraint_name" FROM all_constraints '
+            "WHERE owner = :owner AND table_name = :table_name "
+            "AND constraint_type = 'P'",
+            m.ConfigMap(root={"owner": schema_name.upper(), "table_name": table_name}),
+        )
+        if constraint_result.failure:
+            return r[bool].fail_op("read primary key", constraint_result.error)
+        if constraint_result.value:
+            return r[bool].ok(value=True)
+        comment_result = connected_api.oracle_services.execute_query(
+            'SELECT comments AS "comments" FROM all_tab_comments '
+            "WHERE owner = :owner AND table_name = :table_name",
+            m.ConfigMap(root={"owner": schema_name.upper(), "table_name": table_name}),
+        )
+        if comment_result.failure:
+            return r[bool].fail_op("read table comment", comment_result.error)
+        if not any(
+            row.root.get("comments") == c.TargetOracle.KEYS_PENDING_TABLE_COMMENT
+            for row in comment_result.value
+        ):
+            self.logger.warning(
+                "Table %s has no primary key; loading it without one", table_name
+            )
+            return r[bool].ok(value=True)
+        if self.target_config.TargetOracle.initial_load_mode:
+            self._deferred_index_streams.add(stream_name)
+            self.log_info(f"Table {table_name} has no primary key; deferring it")
+            return r[bool].ok(value=True)
+        index_name = self._derived_table_name(
+            table_name, c.TargetOracle.PRIMARY_KEY_INDEX_SUFFIX
+        )
+        index_result = connected_api.oracle_services.execute_query(
+            'SELECT index_name AS "index_name" FROM all_indexes '
+            "WHERE owner = :owner AND index_name = :index_name",
+            m.ConfigMap(root={"owner": schema_name.upper(), "index_name": index_name}),
+        )
+        if index_result.failure:
+            return r[bool].fail_op("read primary key index", index_result.error)
+        if index_result.value:
+            drop_result = self._execute_sql(
+                connected_api, f"DROP INDEX {schema_name}.{index_name}"
+            )
+            if drop_result.failure:
+                return r[bool].fail_op("drop partial primary key", drop_result.error)
+        build_result = self._build_table_indexes(connected_api, stream_name, table_name)
+        if build_result.failure:
+            return build_result
+        self.log_info(f"Rebuilt missing primary key of {table_name}")
+        return self._mark_keys_pending(connected_api, table_name, pending=False)
+
+    def _mark_keys_pending(
+        self, connected_api: FlextDbOracleApi, table_name: str, *, pending: bool
+    ) -> p.Result[bool]:
+        """Set or clear the comment of a table whose keys are not built yet."""
+        comment = c.TargetOracle.KEYS_PENDING_TABLE_COMMENT if pending else ""
+        comment_result = self._execute_sql(
+            connected_api,
+            f"COMMENT ON TABLE "
+            f"{self.target_config.TargetOracle.default_target_schema}.{table_name} "
+            f"IS '{comment}'",
+        )
+        if comment_result.failure:
+            return r[bool].fail_op("comment table", comment_result.error)
+        return r[bool].ok(value=True)
+
+    def _prepare_row_hash_column(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> p.Result[bool]:
+        """Add the row hash column to an existing table and seed the hash cache."""
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        hash_column = c.TargetOracle.ROW_HASH_COLUMN
+        column_result = connected_api.oracle_services.execute_query(
+            'SELECT COUNT(*) AS "count" FROM all_tab_columns '
+            "WHERE owner = :owner AND table_name = :table_name "
+            "AND column_name = :column_name",
+            m.ConfigMap(
+                root={
+                    "owner": schema_name.upper(),
+                    "table_name": table_name,
+                    "column_name": hash_column,
+                }
+            ),
+        )
+        if column_result.failure or not column_result.value:
+            return r[bool].fail_op("read row hash column", column_result.error)
+        if not int(str(column_result.value[0].root["count"])):
+            alter_result = self._execute_sql(
+                connected_api,
+                f'ALTER TABLE {schema_name}.{table_name} ADD ("{hash_column}" '
+                f"{c.TargetOracle.ROW_HASH_DATA_TYPE})"
+            )
+            if alter_result.failure:
+                return r[bool].fail(
+                    f"Failed to add row hash column: {alter_result.error}"
+                )
+            return r[bool].ok(value=True)
+        key_columns = self._stream_key_columns.get(stream_name, ())
+        hash_cache = self._row_hash_cache.get(stream_name)
+        if hash_cache is None or not key_columns:
+            return r[bool].ok(value=True)
+        select_list = ", ".join(f'"{name}" AS "{name}"' for name in key_columns)
+        seed_result = connected_api.oracle_services.execute_query(
+            f'SELECT {select_list}, "{hash_column}" AS "{hash_column}" '
+            f'FROM {schema_name}.{table_name} WHERE "{hash_column}" IS NOT NULL '
+            'ORDER BY "_SDC_LOADED_AT" DESC FETCH FIRST :limit ROWS ONLY',
+            m.ConfigMap(
+                root={"limit": self.target_config.TargetOracle.row_hash_cache_size}
+            ),
+        )
+        if seed_result.failure:
+            return r[bool].fail_op("seed row hash cache", seed_result.error)
+        data_types = {
+            column.name: column.data_type
+            for column in self._stream_columns.get(stream_name, ())
+        }
+        # Newest rows come first; store them last so they are evicted last.
+        self._cache_row_hashes(
+            hash_cache,
+            (
+                (
+                    tuple(
+                        self._cache_key_text(row.root[name], data_types.get(name, ""))
+                        for name in key_columns
+                    ),
+                    str(row.root[hash_column]),
+                )
+                for row in reversed(seed_result.value)
+            ),
+        )
+        self.log_info(f"Seeded {len(hash_cache)} row hashes for {table_name}")
+        return r[bool].ok(value=True)
+
+    def _sync_json_payload_binding(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> p.Result[bool]:
+        """Bind the JSON payload as text or bytes to match the existing column."""
+        if self.target_config.TargetOracle.storage_mode not in {
+            c.TargetOracle.STORAGE_MODE_JSON,
+            c.TargetOracle.STORAGE_MODE_HYBRID,
+        }:
+            return r[bool].ok(value=True)
+        column_result = connected_api.oracle_services.execute_query(
+            'SELECT data_type AS "data_type" FROM all_tab_columns '
+            "WHERE owner = :owner AND table_name = :table_name "
+            "AND column_name = :column_name",
+            m.ConfigMap(
+                root={
+                    "owner": self.target_config.TargetOracle.default_target_schema.upper(),
+                    "table_name": table_name,
+                    "column_name": self.target_config.TargetOracle.json_column_name.upper(),
+                }
+            ),
+        )
+        if column_result.failure:
+            return r[bool].fail(
+                f"Failed to read JSON column type: {column_result.error}"
+            )
+        if column_result.value:
+            data_type = str(column_result.value[0].root["data_type"])
+            if data_type == c.DbOracle.DataType.CLOB.value:
+                self._binary_json_streams.discard(stream_name)
+            else:
+                self._binary_json_streams.add(stream_name)
+        return r[bool].ok(value=True)
+
+    def _sync_column_limits(
+        self, connected_api: FlextDbOracleApi, stream_name: str, table_name: str
+    ) -> p.Result[bool]:
+        """Rebuild the stream's pre-flight checks from the table's real layout.
+
+        Widths come from ``char_length`` and ``char_used``, so BYTE and CHAR
+        semantics match the column Oracle created, and byte widths are
+        measured in the database character set.
+        """
+        if not self.target_config.TargetOracle.preflight_validation:
+            return r[bool].ok(value=True)
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        columns_result = connected_api.oracle_services.execute_query(
+            'SELECT column_name AS "column_name", data_type AS "data_type", '
+            'char_length AS "char_length", char_used AS "char_used", '
+            'data_precision AS "data_precision", data_scale AS "data_scale", '
+            'nullable AS "nullable" FROM all_tab_columns '
+            "WHERE owner = :owner AND table_name = :table_name",
+            m.ConfigMap(
+                root={"owner": schema_name.upper(), "table_name": table_name}
+            ),
+        )
+        if columns_result.failure:
+            return r[bool].fail_op("read column limits", columns_result.error)
+        stream_columns = {
+            column.name for column in self._stream_columns.get(stream_name, ())
+        }
+        columns = tuple(
+            self._reported_column(row.root)
+            for row in columns_result.value
+            if str(row.root["column_name"]) in stream_columns
+        )
+        if columns:
+            self._stream_validators[stream_name] = FlextTargetOracleRowValidator(
+                columns, self._database_encoding(connected_api)
+            )
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _reported_column(row: t.JsonMapping) -> m.DbOracle.Column:
+        """Return a column definition from one ``all_tab_columns`` row."""
+        data_type = str(row["data_type"])
+        precision = row.get("data_precision")
+        if data_type in c.TargetOracle.ORACLE_CHARACTER_TYPE_NAMES:
+            semantics = "CHAR" if row.get("char_used") == "C" else "BYTE"
+            data_type = f"{data_type}({row['char_length']} {semantics})"
+        elif data_type == "NUMBER" and precision is not None:
+            data_type = f"NUMBER({precision},{row.get('data_scale') or 0})"
+        return m.DbOracle.Column(
+            name=str(row["column_name"]),
+            data_type=data_type,
+            nullable=row.get("nullable") != "N",
+        )
+
+    def _database_encoding(self, connected_api: FlextDbOracleApi) -> str | None:
+        """Return the codec that measures byte widths in the database charset.
+
+        ``None`` means widths are counted in characters: exact for the
+        single-byte character sets and a lower bound for other multi-byte
+        ones, so the check never rejects a row Oracle would accept.
+        """
+        if self._database_character_set is None:
+            charset_result = connected_api.oracle_services.execute_query(
+                'SELECT value AS "value" FROM nls_database_parameters '
+                "WHERE parameter = 'NLS_CHARACTERSET'"
+            )
+            if charset_result.failure or not charset_result.value:
+                return c.DEFAULT_ENCODING
+            self._database_character_set = str(charset_result.value[0].root["value"])
+        return c.TargetOracle.ORACLE_CHARACTER_SET_ENCODINGS.get(
+            self._database_character_set
+        )
+
+    def _create_custom_indexes(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        build_clause: str = "",
+        *,
+        live_table_name: str | None = None,
+    ) -> p.Result[bool]:
+        """Create configured custom indexes for a stream table.
+
+        On a shadow table of ``live_table_name`` each index is named after
+        the live table's index plus the shadow suffix.
+        """
+        for raw_index in json.loads(
+            self.target_config.TargetOracle.custom_indexes or "{}"
+        ).get(stream_name, ()):
+            index_columns_result = self._custom_index_columns(raw_index, stream_name)
+            if index_columns_result.failure:
+                return r[bool].fail(index_columns_result.error or "Invalid index")
+            index_name = self._custom_index_name(
+                raw_index, live_table_name or table_name, index_columns_result.value
+            )
+            if live_table_name is not None:
+                index_name = self._derived_table_name(
+                    index_name, c.TargetOracle.SHADOW_TABLE_SUFFIX
+                )
+            index_payload = t.json_mapping_adapter().validate_python({
+                "table_name": table_name,
+                "index_name": index_name,
+                "columns": index_columns_result.value,
+                "unique": bool(raw_index.get("unique", False)),
+                "schema_name": self.target_config.TargetOracle.default_target_schema,
+            })
+            index_sql_result = (
+                connected_api.oracle_services.build_create_index_statement(
+                    index_payload
+                )
+            )
+            if index_sql_result.failure:
+                return r[bool].fail(
+                    f"Failed to build create index SQL: {index_sql_result.error}"
+                )
+            index_exec_result = self._execute_sql(
+                connected_api,
+                f"{index_sql_result.value.rstrip().rstrip(';')} {build_clause}"
+                if build_clause
+                else index_sql_result.value
+            )
+            if index_exec_result.failure:
+                return r[bool].fail(
+                    f"Failed to create index: {index_exec_result.error}"
+                )
+            if build_clause:
+                reset_result = self._execute_sql(
+                    connected_api,
+                    f"ALTER INDEX {self.target_config.TargetOracle.default_target_schema}"
+                    f".{index_name} NOPARALLEL"
+                )
+                if reset_result.failure:
+                    return r[bool].fail_op("reset index parallelism", reset_result.error)
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _custom_index_columns(
+        raw_index: t.JsonMapping, stream_name: str
+    ) -> p.Result[list[str]]:
+        """Normalize custom index columns."""
+        columns_value = raw_index.get("columns", ())
+        if isinstance(columns_value, str) or not isinstance(columns_value, Sequence):
+            return r[list[str]].fail(
+                f"Custom index columns must be a sequence for {stream_name}"
+            )
+        index_columns = [str(column).upper() for column in columns_value]
+        if not index_columns:
+            return r[list[str]].fail(
+                f"Custom index requires at least one column for {stream_name}"
+            )
+        return r[list[str]].ok(index_columns)
+
+    @staticmethod
+    def _custom_index_name(
+        raw_index: t.JsonMapping, table_name: str, index_columns: t.StrSequence
+    ) -> str:
+        """Return the configured index name, or one derived from the table."""
+        raw_index_name = raw_index.get("name") or raw_index.get("index_name")
+        return str(raw_index_name or f"{table_name}_{index_columns[0]}_IDX")[
+            : c.TargetOracle.MAX_IDENTIFIER_LENGTH
+        ]
+
+    @override
+    def execute(self) -> p.Result[t.JsonMapping]:
+        """Execute domain service - returns connection test result."""
+        connection_result = self.test_connection()
+        if connection_result.failure:
+            return r[t.JsonMapping].fail_op(
+                "Oracle connection", connection_result.error
+            )
+        return r[t.JsonMapping].ok({
+            "status": "ready",
+            "host": self.target_config.TargetOracle.oracle_host,
+            "service": self.target_config.TargetOracle.oracle_service_name,
+            "schema": self.target_config.TargetOracle.default_target_schema,
+        })
+
+    def finalize_all_streams(self) -> p.Result[m.TargetOracle.LoaderFinalizeResult]:
+        """Finalize all streams and return stats using standardized models."""
+        try:
+            return self._finalize_all_streams_unchecked()
+        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+            self.log_error("Failed to finalize streams", error=str(exc))
+            return r[m.TargetOracle.LoaderFinalizeResult].fail_op(
+                "finalize streams", exc
+            )
+
+    def _finalize_all_streams_unchecked(
+        self,
+    ) -> p.Result[m.TargetOracle.LoaderFinalizeResult]:
+        """Finalize streams after exception handling has been delegated."""
+        started_at = str(u.now())
+        records_failed = 0
+        for stream_name, records in self.record_buffers.items():
+            if records:
+                rejected_before = self._metrics.counters(stream_name)["rejected"]
+                result = self._flush_batch(stream_name)
                 if result.failure:
                     records_failed += len(records)
                     self.log_error(f"Failed to flush {stream_name}: {result.error}")
+                    continue
+                records_failed += (
+                    self._metrics.counters(stream_name)["rejected"] - rejected_before
+                )
+        index_result = self._build_deferred_indexes()
+        if index_result.failure:
+            return r[m.TargetOracle.LoaderFinalizeResult].fail(
+                index_result.error or "Failed to build deferred indexes"
+            )
+        unswapped_shadows = tuple(
+            shadow_name for _version, shadow_name in self._shadow_tables.values()
+        )
+        for stream_name, (version, shadow_name) in self._shadow_tables.items():
+            self.logger.warning(
+                "Version %s of %s was never activated; its rows stay in %s "
+                "until the next version of the stream replaces it",
+                version,
+                stream_name,
+                shadow_name,
+            )
+        if self.target_config.TargetOracle.singer_metrics:
+            self._emit_record_counts(self._metrics.streams)
+        self._write_metrics_textfile()
+        self._close_metrics_endpoint()
+        self._close_profile_window(finished=True)
+        self._export_spans()
         finalize_result = m.TargetOracle.LoaderFinalizeResult(
             total_records=self.total_records,
             streams_processed=len(self.record_buffers),
@@ -558,11 +1997,43 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             buffer_status={
                 stream: len(records) for stream, records in self.record_buffers.items()
             },
+            stream_statistics=self.stream_statistics(),
+            unswapped_shadows=unswapped_shadows,
         )
         return r[m.TargetOracle.LoaderFinalizeResult].ok(finalize_result)
 
+    def _build_deferred_indexes(self) -> p.Result[bool]:
+        """Build indexes for initial-load tables whose buffers are drained."""
+        ready_streams = [
+            stream_name
+            for stream_name in sorted(self._deferred_index_streams)
+            if not self.record_buffers.get(stream_name)
+            and stream_name not in self._shadow_tables
+        ]
+        if not ready_streams:
+            return r[bool].ok(value=True)
+        with self.oracle_api as connected_api:
+            for stream_name in ready_streams:
+                table_name = self._stream_table_name(stream_name)
+                index_result = self._build_table_indexes(
+                    connected_api, stream_name, table_name
+                )
+                if index_result.failure:
+                    return index_result
+                mark_result = self._mark_keys_pending(
+                    connected_api, table_name, pending=False
+                )
+                if mark_result.failure:
+                    return mark_result
+                self._deferred_index_streams.discard(stream_name)
+                self.log_info(f"Built deferred indexes for {table_name}")
+        return r[bool].ok(value=True)
+
     def insert_records(
-        self, stream_name: str, records: t.SequenceOf[t.JsonMapping]
+        self,
+        stream_name: str,
+        records: t.SequenceOf[t.JsonMapping],
+        version: int | None = None,
     ) -> p.Result[bool]:
         """Insert multiple records - convenience wrapper used by tests.
 
@@ -570,7 +2041,7 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         """
         try:
             for record in records:
-                load_res = self.load_record(stream_name, record)
+                load_res = self.load_record(stream_name, record, version=version)
                 if load_res.failure:
                     return r[bool].fail(f"Failed to load record: {load_res.error}")
             return self._flush_batch(stream_name)
@@ -578,26 +2049,332 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             self.log_error("Failed to insert records", error=str(exc))
             return r[bool].fail_op("insert records", exc)
 
+    def load_columns(
+        self,
+        stream_name: str,
+        batch: p.TargetOracle.ColumnarBatch | t.MappingKV[str, t.SequenceOf[t.JsonValue]],
+    ) -> p.Result[int]:
+        """Load a columnar batch straight into the stream table.
+
+        Accepts a PyArrow ``Table``/``RecordBatch`` (anything exposing
+        ``to_pydict``) or a mapping of Singer column name to values. Columns are
+        mapped onto the compiled stream layout and bound column-wise, bypassing
+        the per-record buffer. Returns the number of rows written.
+        """
+        try:
+            return self._load_columns_unchecked(stream_name, batch)
+        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+            self.log_error("Failed to load columns", error=str(exc))
+            return r[int].fail_op("load columns", exc)
+
+    def _load_columns_unchecked(
+        self,
+        stream_name: str,
+        batch: p.TargetOracle.ColumnarBatch | t.MappingKV[str, t.SequenceOf[t.JsonValue]],
+    ) -> p.Result[int]:
+        """Load one columnar batch after exception handling has been delegated."""
+        column_data = (
+            self._arrow_column_data(batch)
+            if isinstance(batch, p.TargetOracle.ColumnarBatch)
+            else batch
+        )
+        row_counts = {len(values) for values in column_data.values()}
+        if len(row_counts) > 1:
+            return r[int].fail(f"Columnar batch for {stream_name} has ragged columns")
+        row_count = row_counts.pop() if row_counts else 0
+        if not row_count:
+            return r[int].ok(0)
+        table_name = self._target_table_name(stream_name)
+        schema_name = self.target_config.TargetOracle.default_target_schema
+        if not c.TargetOracle.QUALIFIED_IDENTIFIER_RE.fullmatch(
+            f"{schema_name}.{table_name}"
+        ):
+            return r[int].fail_op("validate Oracle table identifier")
+        flush_result = self._flush_batch(stream_name)
+        if flush_result.failure:
+            return r[int].fail(flush_result.error or "Failed to flush buffered records")
+        self._total_records += row_count
+        self._metrics.increment(stream_name, "rows_in", row_count)
+        batch_size = self.target_config.TargetOracle.batch_size
+        with self.oracle_api as connected_api:
+            for start in range(0, row_count, batch_size):
+                # Each slice is its own write, so it gets its own load stamp.
+                binds_result = self._build_column_binds(
+                    stream_name,
+                    {
+                        column_name: values[start : start + batch_size]
+                        for column_name, values in column_data.items()
+                    },
+                    min(batch_size, row_count - start),
+                    self._next_loaded_at(),
+                )
+                if binds_result.failure:
+                    return r[int].fail(binds_result.error or "Failed to bind columns")
+                write_result = self._write_batch(
+                    connected_api,
+                    stream_name,
+                    table_name,
+                    schema_name,
+                    binds_result.value,
+                    first_offset=start,
+                )
+                if write_result.failure:
+                    return r[int].fail(write_result.error or "Columnar insert failed")
+                commit_result = self._commit_batch(connected_api, stream_name)
+                if commit_result.failure:
+                    return r[int].fail(commit_result.error or "Columnar commit failed")
+        self.log_info(f"Loaded {row_count} columnar rows to {table_name}")
+        return r[int].ok(row_count)
+
+    @staticmethod
+    def _arrow_json_value(
+        value: t.JsonValue | date | dt_time | timedelta | Decimal,
+    ) -> t.JsonValue:
+        """Return one Arrow scalar as the JSON value a Singer record carries.
+
+        Temporal scalars become ISO text, durations seconds and decimals their
+        exact text, the forms a RECORD has for those fields.
+        """
+        if isinstance(value, (date, dt_time)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        if isinstance(value, timedelta):
+            return value.total_seconds()
+        return value
+
+    @classmethod
+    def _arrow_column_data(
+        cls, batch: p.TargetOracle.ColumnarBatch
+    ) -> dict[str, t.SequenceOf[t.JsonValue]]:
+        """Return an Arrow batch's columns with JSON values only."""
+        return {
+            name: list(map(cls._arrow_json_value, values))
+            for name, values in batch.to_pydict().items()
+        }
+
+    def _build_column_binds(
+        self,
+        stream_name: str,
+        column_data: t.MappingKV[str, t.SequenceOf[t.JsonValue]],
+        row_count: int,
+        loaded_at: str,
+        json_payloads: t.SequenceOf[str] | None = None,
+    ) -> p.Result[t.TargetOracle.BindColumns]:
+        """Bind Singer columns onto the compiled Oracle column layout.
+
+        Buffered records and columnar batches both bind through here, so they
+        share one set of normalizers. Columns come back in stream column
+        order, ready to be zipped into positional rows.
+        """
+        try:
+            return self._build_column_binds_unchecked(
+                stream_name, column_data, row_count, loaded_at, json_payloads
+            )
+        except c.ValidationError as exc:
+            return r[t.TargetOracle.BindColumns].fail(
+                f"Invalid insert parameters for {stream_name}: {exc}"
+            )
+
+    def _build_column_binds_unchecked(
+        self,
+        stream_name: str,
+        column_data: t.MappingKV[str, t.SequenceOf[t.JsonValue]],
+        row_count: int,
+        loaded_at: str,
+        json_payloads: t.SequenceOf[str] | None,
+    ) -> p.Result[t.TargetOracle.BindColumns]:
+        """Build column binds after validation handling has been delegated."""
+        stream_columns = self._stream_columns.get(stream_name, ())
+        if not stream_columns:
+            return r[t.TargetOracle.BindColumns].fail(
+                f"No registered schema for stream {stream_name}"
+            )
+        mapped: dict[str, t.SequenceOf[t.TargetOracle.BindValue]] = {}
+        for source_name, target_name in self._stream_field_mappings.get(
+            stream_name, ()
+        ):
+            values = column_data.get(target_name, column_data.get(source_name))
+            if values is not None:
+                mapped[target_name.upper()] = (
+                    t.TargetOracle.JSON_LIST_ADAPTER.validate_python(values)
+                )
+        hashed_values: dict[str, t.SequenceOf[t.TargetOracle.BindValue]] = {}
+        if stream_name in self._row_hash_streams:
+            hashed_values = {
+                name: values
+                for name, values in mapped.items()
+                if not name.startswith("_SDC_")
+            }
+            for source_name in self._stream_nested_fields.get(stream_name, ()):
+                nested_values = column_data.get(source_name)
+                if nested_values is not None:
+                    hashed_values[source_name] = nested_values
+        if self.target_config.TargetOracle.storage_mode in {
+            c.TargetOracle.STORAGE_MODE_JSON,
+            c.TargetOracle.STORAGE_MODE_HYBRID,
+        }:
+            payloads = (
+                json_payloads
+                if json_payloads is not None
+                else self._column_payloads(column_data)
+            )
+            mapped[self.target_config.TargetOracle.json_column_name.upper()] = (
+                [payload.encode(c.DEFAULT_ENCODING) for payload in payloads]
+                if stream_name in self._binary_json_streams
+                else payloads
+            )
+        extracted_values = column_data.get("_sdc_extracted_at")
+        mapped["_SDC_EXTRACTED_AT"] = (
+            [
+                loaded_at
+                if extracted_at is None
+                else self._oracle_timestamp_text(extracted_at)
+                for extracted_at in extracted_values
+            ]
+            if extracted_values is not None
+            else (loaded_at,) * row_count
+        )
+        mapped["_SDC_LOADED_AT"] = (loaded_at,) * row_count
+        null_column: t.SequenceOf[t.TargetOracle.BindValue] = (None,) * row_count
+        binds: dict[str, t.SequenceOf[t.TargetOracle.BindValue]] = {
+            column.name: mapped.get(column.name, null_column)
+            for column in stream_columns
+        }
+        if stream_name in self._row_hash_streams:
+            binds[c.TargetOracle.ROW_HASH_COLUMN] = self._row_hashes(
+                hashed_values, row_count
+            )
+        return r[t.TargetOracle.BindColumns].ok(binds)
+
+    @staticmethod
+    def _column_payloads(
+        column_data: t.MappingKV[str, t.SequenceOf[t.JsonValue]],
+    ) -> list[str]:
+        """Serialize columnar rows to compact JSON objects without row dicts.
+
+        Each column is encoded once and the encoded fragments are joined per
+        row, which yields the same text as dumping one mapping per row.
+        """
+        keys = [json.dumps(name, ensure_ascii=False) + ":" for name in column_data]
+        encoded_columns = [
+            [
+                json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+                for value in values
+            ]
+            for values in column_data.values()
+        ]
+        return [
+            "{" + ",".join(map(str.__add__, keys, row)) + "}"
+            for row in zip(*encoded_columns, strict=True)
+        ]
+
+    def _record_payloads(
+        self, stream_name: str, records: t.SequenceOf[t.JsonMapping]
+    ) -> list[str]:
+        """Return the JSON payload text of buffered records.
+
+        The raw Singer text is reused when it was buffered; other records are
+        dumped once.
+        """
+        raw_records: t.SequenceOf[str | None] = self._raw_record_buffers.get(
+            stream_name, ()
+        )
+        if len(raw_records) != len(records):
+            raw_records = (None,) * len(records)
+        return [
+            raw_record
+            if raw_record is not None
+            else t.TargetOracle.FLAT_CONTAINER_MAP_ADAPTER.dump_json(record).decode(
+                c.DEFAULT_ENCODING
+            )
+            for record, raw_record in zip(records, raw_records, strict=True)
+        ]
+
+    @classmethod
+    def _row_hashes(
+        cls, hashed_values: t.TargetOracle.BindColumns, row_count: int
+    ) -> list[str]:
+        """Return the blake2b hash of each row's projected field values.
+
+        Only record fields are hashed, never the JSON payload or ``_sdc_*``
+        metadata, and each value is hashed in its canonical text form, so a
+        re-sent row with equal field values keeps its hash across syncs.
+        """
+        hashed_names = sorted(hashed_values)
+        encoded_columns = [
+            [
+                c.TargetOracle.ROW_HASH_NULL_MARKER
+                if value is None
+                else cls._canonical_text(value).encode(c.DEFAULT_ENCODING)
+                for value in hashed_values[name]
+            ]
+            for name in hashed_names
+        ]
+        name_prefixes = [
+            name.encode(c.DEFAULT_ENCODING) + b"=" for name in hashed_names
+        ]
+        if not encoded_columns:
+            empty = hashlib.blake2b(digest_size=c.TargetOracle.ROW_HASH_DIGEST_SIZE)
+            return [empty.hexdigest()] * row_count
+        row_hashes: list[str] = []
+        for row in zip(*encoded_columns, strict=True):
+            digest = hashlib.blake2b(digest_size=c.TargetOracle.ROW_HASH_DIGEST_SIZE)
+            for name_prefix, value in zip(name_prefixes, row, strict=True):
+                digest.update(name_prefix)
+                digest.update(value)
+                digest.update(c.TargetOracle.ROW_HASH_FIELD_SEPARATOR)
+            row_hashes.append(digest.hexdigest())
+        return row_hashes
+
     def load_record(
-        self, stream_name: str, record_data: t.JsonMapping
+        self,
+        stream_name: str,
+        record_data: t.JsonMapping,
+        raw_record: str | None = None,
+        version: int | None = None,
     ) -> p.Result[bool]:
-        """Load record with batching."""
+        """Load record with batching.
+
+        ``raw_record`` is the record object exactly as it appeared on the Singer
+        line; when the stream stores its payload unchanged it is bound as-is
+        instead of re-serializing ``record_data``. With ``full_table_swap`` a
+        record carrying a Singer ``version`` loads into that version's shadow
+        table.
+        """
         try:
-            return self._load_record_unchecked(stream_name, record_data)
+            if version is not None:
+                route_result = self._route_record_version(stream_name, version)
+                if route_result.failure:
+                    return route_result
+            return self._load_record_unchecked(stream_name, record_data, raw_record)
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
             self.log_error("Failed to load record", error=str(exc))
             return r[bool].fail_op("load record", exc)
 
     def _load_record_unchecked(
-        self, stream_name: str, record_data: t.JsonMapping
+        self,
+        stream_name: str,
+        record_data: t.JsonMapping,
+        raw_record: str | None = None,
     ) -> p.Result[bool]:
         """Load one record after exception handling has been delegated."""
         if stream_name not in self.record_buffers:
             empty_records: t.MutableSequenceOf[t.JsonMapping] = []
             self.record_buffers[stream_name] = empty_records
+            self._raw_record_buffers[stream_name] = []
         copied_record = t.json_dict_adapter().validate_python(record_data)
-        self.record_buffers[stream_name].append(copied_record)
+        buffered_raw = raw_record if stream_name in self._raw_record_streams else None
         self._total_records += 1
+        self._metrics.increment(stream_name, "rows_in")
+        buffer_slot = self._buffer_key_slot(stream_name, copied_record)
+        if buffer_slot is not None:
+            self.record_buffers[stream_name][buffer_slot] = copied_record
+            self._raw_record_buffers[stream_name][buffer_slot] = buffered_raw
+            self._count_rows(stream_name, collapsed=1)
+            return r[bool].ok(value=True)
+        self.record_buffers[stream_name].append(copied_record)
+        self._raw_record_buffers.setdefault(stream_name, []).append(buffered_raw)
         if (
             len(self.record_buffers[stream_name])
             >= self.target_config.TargetOracle.batch_size
@@ -605,6 +2382,37 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             return self._flush_batch(stream_name)
         return r[bool].ok(value=True)
 
+    def _buffer_key_slot(self, stream_name: str, record: t.JsonMapping) -> int | None:
+        """Return the buffer slot already holding this record's merge key.
+
+        New keys are indexed against the slot the record is about to take, so
+        later rows with the same key overwrite it (last writer wins) and each
+        key reaches Oracle once per flush.
+        """
+        key_fields = self._stream_key_fields.get(stream_name)
+        if not key_fields or not self._merge_enabled():
+            return None
+        key = tuple(
+            record.get(target_name, record.get(source_name))
+            for source_name, target_name in key_fields
+        )
+        if any(isinstance(value, (Mapping, list)) for value in key):
+            return None
+        key_slots = self._buffer_key_slots.setdefault(stream_name, {})
+        buffer_slot = key_slots.get(key)
+        if buffer_slot is None:
+            key_slots[key] = len(self.record_buffers[stream_name])
+        return buffer_slot
+
+    def _merge_enabled(self) -> bool:
+        """Return whether loads replace existing rows by key."""
+        return (
+            self.target_config.TargetOracle.sdc_mode.lower()
+            == c.TargetOracle.LOAD_METHOD_MERGE.lower()
+            or self.target_config.TargetOracle.load_method
+            in {c.TargetOracle.LOAD_METHOD_MERGE, c.TargetOracle.LOAD_METHOD_BULK_MERGE}
+        )
+
     def log_error(self, message: str, **kwargs: t.Scalar) -> None:
         """Log error message."""
         if not kwargs:
@@ -640,124 +2448,799 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
             self.log_error("Failed to connect to Oracle", error=str(exc))
             return r[bool].fail_op("connect to Oracle", exc)
 
-    def _build_insert_parameters(
-        self, stream_name: str, record: t.JsonMapping, loaded_at: str
-    ) -> p.Result[t.JsonMapping]:
-        """Normalize one record into the owner-managed insert payload shape."""
-        try:
-            return self._build_insert_parameters_unchecked(
-                stream_name, record, loaded_at
-            )
-        except c.ValidationError as exc:
-            return r[t.JsonMapping].fail(
-                f"Invalid insert parameters for {stream_name}: {exc}"
-            )
-
-    def _build_insert_parameters_unchecked(
-        self, stream_name: str, record: t.JsonMapping, loaded_at: str
-    ) -> p.Result[t.JsonMapping]:
-        """Build insert parameters after validation handling has been delegated."""
-        stream_columns = self._stream_columns.get(stream_name, ())
-        if not stream_columns:
-            return r[t.JsonMapping].fail(
-                f"No registered schema for stream {stream_name}"
-            )
-        column_names = frozenset(column.name for column in stream_columns)
-        params: t.MutableJsonMapping = {
-            column.name: None
-            for column in stream_columns
-            if not column.name.startswith("_SDC_")
-        }
-        for source_name, target_name in self._stream_field_mappings.get(
-            stream_name, ()
-        ):
-            column_name = target_name.upper()
-            if column_name in column_names:
-                params[column_name] = record.get(target_name, record.get(source_name))
-        if self.target_config.TargetOracle.storage_mode in {
-            c.TargetOracle.STORAGE_MODE_JSON,
-            c.TargetOracle.STORAGE_MODE_HYBRID,
-        }:
-            params[self.target_config.TargetOracle.json_column_name.upper()] = (
-                t.TargetOracle.FLAT_CONTAINER_MAP_ADAPTER.dump_json(record).decode(
-                    c.DEFAULT_ENCODING
-                )
-            )
-        params["_SDC_EXTRACTED_AT"] = self._oracle_timestamp_text(
-            record.get("_sdc_extracted_at", loaded_at)
-        )
-        params["_SDC_LOADED_AT"] = loaded_at
-        return r[t.JsonMapping].ok(t.json_mapping_adapter().validate_python(params))
-
     def _flush_batch(self, stream_name: str) -> p.Result[bool]:
         """Flush batch using flext-db-oracle API exclusively - NO direct SQLAlchemy."""
+        batch_rows = len(self.record_buffers.get(stream_name, ()))
+        started = time.perf_counter()
         try:
-            return self._flush_batch_unchecked(stream_name)
+            result = self._flush_batch_unchecked(stream_name)
         except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
             self.log_error("Failed to flush batch", error=str(exc))
-            return r[bool].fail_op("flush batch", exc)
+            result = r[bool].fail_op("flush batch", exc)
+        if batch_rows and self.target_config.TargetOracle.singer_metrics:
+            flushed_at = time.monotonic()
+            if flushed_at >= self._singer_metrics_due:
+                self._emit_record_counts(self._metrics.streams)
+                self._singer_metrics_due = (
+                    flushed_at + self.target_config.TargetOracle.singer_metrics_interval
+                )
+            self._emit_singer_metric(
+                self._metrics.singer_metric(
+                    c.TargetOracle.SINGER_METRIC_TIMER,
+                    c.TargetOracle.SINGER_METRIC_BATCH_TIME,
+                    time.perf_counter() - started,
+                    {
+                        "stream": stream_name,
+                        "status": c.TargetOracle.SINGER_METRIC_STATUS_SUCCEEDED
+                        if result.success
+                        else c.TargetOracle.SINGER_METRIC_STATUS_FAILED,
+                        "record_count": str(batch_rows),
+                    },
+                )
+            )
+        if batch_rows:
+            self._write_metrics_textfile()
+            self._export_spans()
+        self._close_profile_window()
+        return result
+
+    def _close_profile_window(self, *, finished: bool = False) -> None:
+        """Write the profile once its window has elapsed, or when ``finished``.
+
+        Called between batches, so the snapshot and file writes never run
+        inside the sampling signal handler.
+        """
+        profiler = self._profiler
+        if profiler is None:
+            return
+        if not (profiler.expired or (finished and profiler.active)):
+            return
+        profile_result = profiler.stop()
+        if profile_result.failure:
+            self.log_error("Failed to write profile", error=str(profile_result.error))
+            return
+        self.log_info(
+            "Profile written",
+            cpu=str(profile_result.value[0]),
+            allocations=str(profile_result.value[1]),
+        )
 
     def _flush_batch_unchecked(self, stream_name: str) -> p.Result[bool]:
         """Flush batch after exception handling has been delegated."""
         records = self.record_buffers.get(stream_name, [])
         if not records:
             return r[bool].ok(value=True)
-        table_name = (
-            f"{self.target_config.TargetOracle.table_prefix}{(stream_name).replace(chr(45), chr(95)).replace(chr(46), chr(95))}{self.target_config.TargetOracle.table_suffix}"
-        ).upper()
+        table_name = self._target_table_name(stream_name)
         schema_name = self.target_config.TargetOracle.default_target_schema
         full_table_name = f"{schema_name}.{table_name}"
         if not c.TargetOracle.QUALIFIED_IDENTIFIER_RE.fullmatch(full_table_name):
             return r[bool].fail_op("validate Oracle table identifier")
-        loaded_at = self._oracle_timestamp_text(u.generate_datetime_utc().isoformat())
+        loaded_at = self._next_loaded_at()
+        flush_started = time.perf_counter_ns()
         with self.oracle_api as connected_api:
-            stream_columns = self._stream_columns.get(stream_name, ())
-            if not stream_columns:
+            if not self._stream_columns.get(stream_name, ()):
                 return r[bool].fail(f"No registered schema for stream {stream_name}")
-            insert_sql_result = connected_api.oracle_services.build_insert_statement(
-                table_name,
-                [column.name for column in stream_columns],
-                schema=schema_name,
-            )
-            if insert_sql_result.failure:
-                return r[bool].fail(
-                    f"Failed to build insert SQL: {insert_sql_result.error}"
-                )
             params_result = self._build_batch_parameters(
                 stream_name, records, loaded_at
             )
+            self._metrics.observe(
+                c.TargetOracle.METRIC_PHASE_PARAM_BUILD,
+                stream_name,
+                time.perf_counter_ns() - flush_started,
+            )
             if params_result.failure:
                 return r[bool].fail(
                     params_result.error or "Failed to build insert parameters"
                 )
+            write_result = self._write_batch(
+                connected_api,
+                stream_name,
+                table_name,
+                schema_name,
+                params_result.value,
+            )
+            if write_result.failure:
+                return write_result
+            commit_result = self._commit_batch(connected_api, stream_name)
+            if commit_result.failure:
+                return commit_result
+            self.record_buffers[stream_name] = list[t.JsonMapping]()
+            self._raw_record_buffers[stream_name] = []
+            self._buffer_key_slots.pop(stream_name, None)
+            self._metrics.increment(stream_name, "flushes")
+            self._metrics.observe_pending(
+                c.TargetOracle.METRIC_PHASE_PARSE, stream_name
+            )
+            self._metrics.increment(
+                stream_name,
+                "bytes_flushed",
+                self._metrics.unreported(stream_name, "bytes_in"),
+            )
+            self._metrics.observe(
+                c.TargetOracle.METRIC_PHASE_FLUSH,
+                stream_name,
+                time.perf_counter_ns() - flush_started,
+            )
+            self.log_info(f"Flushed {len(records)} records to {table_name}")
+            return r[bool].ok(value=True)
+
+    def _write_batch(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        schema_name: str,
+        binds: t.TargetOracle.BindColumns,
+        *,
+        first_offset: int = 0,
+    ) -> p.Result[bool]:
+        """Apply merge deletes and array-write one column-bound batch.
+
+        The columns are zipped once into positional tuples in stream column
+        order; every statement below binds ``:1..:n`` in that order. Each row
+        keeps its position in the flushed buffer (``first_offset`` onwards),
+        so quarantined rows report it whatever order they were written in.
+        One savepoint covers the merge deletes and every sparse group, so a
+        failed write is rolled back whole in either ``on_batch_error`` mode
+        and a retained buffer never rewrites rows an earlier group applied.
+        """
+        column_names = tuple(binds)
+        rows: list[t.TargetOracle.OffsetRow] = list(
+            enumerate(zip(*binds.values(), strict=True), first_offset)
+        )
+        preflight_result = self._preflight_batch(stream_name, binds, rows)
+        if preflight_result.failure:
+            return r[bool].fail(preflight_result.error or "Pre-flight validation failed")
+        rows = self._sorted_batch(
+            stream_name,
+            column_names,
+            self._drop_unchanged_rows(
+                stream_name,
+                column_names,
+                self._collapse_duplicate_keys(
+                    stream_name, column_names, preflight_result.value
+                ),
+            ),
+        )
+        if not rows:
+            return r[bool].ok(value=True)
+        savepoint_result = self._set_batch_savepoint(connected_api)
+        if savepoint_result.failure:
+            return savepoint_result
+        write_sql = self._build_write_statement(
+            stream_name, table_name, schema_name, column_names
+        )
+        write_groups = [(write_sql, column_names, rows)]
+        if (
+            self.target_config.TargetOracle.sparse_bind_groups
+            and not self._row_hash_merge_enabled(stream_name)
+            and not self._bulk_load_stream(stream_name)
+        ):
+            write_groups = self._sparse_write_groups(
+                table_name, schema_name, column_names, rows, write_sql
+            )
+        write_result = self._apply_write_groups(
+            connected_api,
+            stream_name,
+            table_name,
+            schema_name,
+            column_names,
+            rows,
+            write_groups,
+        )
+        if write_result.success:
+            self._count_rows(
+                stream_name, processed=len(rows), loaded=len(rows), batches=1
+            )
+            self._remember_row_hashes(stream_name, column_names, rows)
+            return r[bool].ok(value=True)
+        rollback_result = self._rollback_to_batch_savepoint(connected_api)
+        if rollback_result.failure:
+            self._count_rows(stream_name, processed=len(rows), failed=len(rows))
+            return rollback_result
+        if (
+            self.target_config.TargetOracle.on_batch_error
+            != c.TargetOracle.BATCH_ERROR_MODE_QUARANTINE
+        ):
+            self._count_rows(stream_name, processed=len(rows), failed=len(rows))
+            return write_result
+        return self._quarantine_rejected_rows(
+            connected_api,
+            stream_name,
+            table_name,
+            schema_name,
+            self._build_write_statement(
+                stream_name, table_name, schema_name, column_names, conventional=True
+            ),
+            column_names,
+            rows,
+            str(write_result.error),
+        )
+
+    def _apply_write_groups(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        schema_name: str,
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
+        write_groups: t.SequenceOf[
+            tuple[str, t.StrSequence, t.SequenceOf[t.TargetOracle.OffsetRow]]
+        ],
+    ) -> p.Result[bool]:
+        """Delete the merge keys of ``rows``, then run their write groups.
+
+        The deletes run in the same unit as the writes, so rolling a failed
+        write back also restores the rows its keys had replaced.
+        """
+        if not self._row_hash_merge_enabled(stream_name):
             merge_result = self._delete_merge_rows(
-                connected_api, stream_name, table_name, schema_name, params_result.value
+                connected_api, stream_name, table_name, schema_name, column_names, rows
             )
             if merge_result.failure:
                 return merge_result
-            insert_sql = self._with_oracle_timestamp_binds(insert_sql_result.value)
-            result = connected_api.execute_many(insert_sql, params_result.value)
+        for group_sql, _group_names, group_rows in write_groups:
+            execute_started = time.perf_counter_ns()
+            result = self._execute_many(
+                connected_api, group_sql, [row for _offset, row in group_rows]
+            )
+            self._metrics.observe(
+                c.TargetOracle.METRIC_PHASE_EXECUTE,
+                stream_name,
+                time.perf_counter_ns() - execute_started,
+            )
             if result.failure:
                 return r[bool].fail_op("Batch insert", result.error)
-            self.record_buffers[stream_name] = list[t.JsonMapping]()
-            self.log_info(f"Flushed {len(records)} records to {table_name}")
+        return r[bool].ok(value=True)
+
+    def _sparse_write_groups(
+        self,
+        table_name: str,
+        schema_name: str,
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
+        full_width_sql: str,
+    ) -> list[
+        tuple[str, t.StrSequence, t.SequenceOf[t.TargetOracle.OffsetRow]]
+    ]:
+        """Split a batch into narrower inserts keyed by present-column signature.
+
+        Only non-NULL columns (plus SDC columns) are bound, so column DEFAULTs
+        apply to the rest. The most frequent signatures up to
+        ``sparse_bind_groups`` get their own statement; remaining rows are
+        bound against the full column list. Rows are picked in batch order,
+        so every group keeps the key order of a sorted batch.
+        """
+        sdc_positions = frozenset(
+            position
+            for position, name in enumerate(column_names)
+            if name.startswith("_SDC_")
+        )
+        signatures = [
+            tuple(
+                position
+                for position, value in enumerate(row)
+                if value is not None or position in sdc_positions
+            )
+            for _offset, row in rows
+        ]
+        rows_by_signature: dict[tuple[int, ...], list[t.TargetOracle.OffsetRow]] = {}
+        for signature, offset_row in zip(signatures, rows, strict=True):
+            rows_by_signature.setdefault(signature, []).append(offset_row)
+        ranked_signatures = sorted(
+            rows_by_signature, key=lambda signature: -len(rows_by_signature[signature])
+        )
+        group_limit = self.target_config.TargetOracle.sparse_bind_groups
+        grouped_signatures = frozenset(ranked_signatures[:group_limit])
+        full_width_rows = [
+            offset_row
+            for signature, offset_row in zip(signatures, rows, strict=True)
+            if signature not in grouped_signatures
+        ]
+        write_groups: list[
+            tuple[str, t.StrSequence, t.SequenceOf[t.TargetOracle.OffsetRow]]
+        ] = []
+        for signature in ranked_signatures[:group_limit]:
+            group_names = tuple(column_names[position] for position in signature)
+            # Signatures always hold the SDC timestamp positions, so the
+            # getter returns tuples rather than a bare value.
+            project = itemgetter(*signature)
+            write_groups.append((
+                self._insert_statement(schema_name, table_name, group_names),
+                group_names,
+                [
+                    (offset, project(row))
+                    for offset, row in rows_by_signature[signature]
+                ],
+            ))
+        if full_width_rows:
+            write_groups.append((full_width_sql, column_names, full_width_rows))
+        return write_groups
+
+    def _commit_batch(
+        self, connected_api: FlextDbOracleApi, stream_name: str
+    ) -> p.Result[bool]:
+        """Commit one written batch, timed as the commit phase.
+
+        A batch's merge deletes, array writes and savepoints share one
+        transaction; nothing is durable until this explicit COMMIT, which
+        is also where direct-path writes release their table.
+        """
+        commit_started = time.perf_counter_ns()
+        commit_result = self._execute_sql(connected_api, "COMMIT")
+        self._metrics.observe(
+            c.TargetOracle.METRIC_PHASE_COMMIT,
+            stream_name,
+            time.perf_counter_ns() - commit_started,
+        )
+        if commit_result.failure:
+            return r[bool].fail_op("commit batch", commit_result.error)
+        return r[bool].ok(value=True)
+
+    def _set_batch_savepoint(self, connected_api: FlextDbOracleApi) -> p.Result[bool]:
+        """Mark the point a failed array write is rolled back to."""
+        savepoint_result = self._execute_sql(
+            connected_api, f"SAVEPOINT {c.TargetOracle.BATCH_SAVEPOINT_NAME}"
+        )
+        if savepoint_result.failure:
+            return r[bool].fail_op("set batch savepoint", savepoint_result.error)
+        return r[bool].ok(value=True)
+
+    def _rollback_to_batch_savepoint(
+        self, connected_api: FlextDbOracleApi
+    ) -> p.Result[bool]:
+        """Undo the rows a failed array write applied before its error.
+
+        When the savepoint is gone the whole transaction is rolled back and
+        the batch fails, so the buffered rows are retried as a unit instead
+        of being loaded twice.
+        """
+        rollback_result = self._execute_sql(
+            connected_api,
+            f"ROLLBACK TO SAVEPOINT {c.TargetOracle.BATCH_SAVEPOINT_NAME}",
+        )
+        if rollback_result.success:
             return r[bool].ok(value=True)
+        full_rollback_result = self._execute_sql(connected_api, "ROLLBACK")
+        if full_rollback_result.failure:
+            return r[bool].fail_op("roll back failed batch", full_rollback_result.error)
+        return r[bool].fail_op("roll back to batch savepoint", rollback_result.error)
+
+    def _bisect_rejected_rows(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        schema_name: str,
+        insert_sql: str,
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
+        batch_error: str,
+    ) -> p.Result[list[m.TargetOracle.RejectedRow]]:
+        """Split a failed sub-batch in halves until the rejected rows remain.
+
+        Each half deletes its own merge keys and writes its rows behind the
+        batch savepoint. A failed half is rolled back before it is split
+        again, so neither the rows it applied ahead of its error nor the
+        existing rows its keys replaced are lost or loaded twice.
+        """
+        if len(rows) == 1:
+            batch_offset, row = rows[0]
+            return r[list[m.TargetOracle.RejectedRow]].ok([
+                self._rejected_row(
+                    stream_name, batch_offset, column_names, row, batch_error
+                )
+            ])
+        middle = len(rows) // 2
+        rejected: list[m.TargetOracle.RejectedRow] = []
+        for half in (rows[:middle], rows[middle:]):
+            self._metrics.increment(stream_name, "retries")
+            savepoint_result = self._set_batch_savepoint(connected_api)
+            if savepoint_result.failure:
+                return r[list[m.TargetOracle.RejectedRow]].fail(
+                    savepoint_result.error or "Failed to set batch savepoint"
+                )
+            half_result = self._apply_write_groups(
+                connected_api,
+                stream_name,
+                table_name,
+                schema_name,
+                column_names,
+                half,
+                [(insert_sql, column_names, half)],
+            )
+            if half_result.success:
+                continue
+            rollback_result = self._rollback_to_batch_savepoint(connected_api)
+            if rollback_result.failure:
+                return r[list[m.TargetOracle.RejectedRow]].fail(
+                    rollback_result.error or "Failed to roll back half batch"
+                )
+            half_rejected = self._bisect_rejected_rows(
+                connected_api,
+                stream_name,
+                table_name,
+                schema_name,
+                insert_sql,
+                column_names,
+                half,
+                str(half_result.error),
+            )
+            if half_rejected.failure:
+                return half_rejected
+            rejected.extend(half_rejected.value)
+        return r[list[m.TargetOracle.RejectedRow]].ok(rejected)
+
+    def _rejected_row(
+        self,
+        stream_name: str,
+        batch_offset: int,
+        column_names: t.StrSequence,
+        row: t.TargetOracle.BindTuple,
+        error: str,
+    ) -> m.TargetOracle.RejectedRow:
+        """Build the quarantine entry of one positional row."""
+        return self.quarantine.rejected_row(
+            stream_name, batch_offset, dict(zip(column_names, row, strict=True)), error
+        )
+
+    def _batch_sort_columns(self, stream_name: str) -> t.StrSequence:
+        """Return the columns a flushed batch is ordered by."""
+        if not self.target_config.TargetOracle.sort_batches_by_key:
+            return ()
+        key_columns = tuple(self._stream_key_columns.get(stream_name, ()))
+        partitioning_result = self._stream_partitioning(stream_name)
+        if partitioning_result.failure or partitioning_result.value is None:
+            return key_columns
+        return (partitioning_result.value.column.upper(), *key_columns)
+
+    @staticmethod
+    def _sort_value(value: t.TargetOracle.BindValue) -> tuple[int, float | str]:
+        """Return a total-order sort key for one bound value (NULLs last)."""
+        if value is None:
+            return (2, "")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return (0, value)
+        if isinstance(value, bytes):
+            return (1, value.decode(c.DEFAULT_ENCODING, errors="replace"))
+        return (1, value if isinstance(value, str) else json.dumps(value, default=str))
+
+    def _sorted_batch(
+        self,
+        stream_name: str,
+        column_names: t.StrSequence,
+        rows: list[t.TargetOracle.OffsetRow],
+    ) -> list[t.TargetOracle.OffsetRow]:
+        """Order a batch by its sort columns so index access is sequential."""
+        sort_positions = [
+            column_names.index(name)
+            for name in self._batch_sort_columns(stream_name)
+            if name in column_names
+        ]
+        if not sort_positions or len(rows) < 2:
+            return rows
+        return sorted(
+            rows,
+            key=lambda offset_row: tuple(
+                self._sort_value(offset_row[1][position])
+                for position in sort_positions
+            ),
+        )
+
+    def _row_hash_merge_enabled(self, stream_name: str) -> bool:
+        """Return whether a stream upserts through the row-hash MERGE."""
+        return (
+            stream_name in self._row_hash_streams
+            and not self._bulk_load_stream(stream_name)
+            and self._merge_enabled()
+            and bool(self._stream_key_columns.get(stream_name))
+        )
+
+    def _build_write_statement(
+        self,
+        stream_name: str,
+        table_name: str,
+        schema_name: str,
+        column_names: t.StrSequence,
+        *,
+        conventional: bool = False,
+    ) -> str:
+        """Return the positional array DML statement for a stream batch.
+
+        Bulk-load streams insert direct-path unless ``conventional`` asks for
+        a statement that can run again in the same transaction.
+        """
+        if not self._row_hash_merge_enabled(stream_name):
+            return self._insert_statement(
+                schema_name,
+                table_name,
+                column_names,
+                direct_path=self._bulk_load_stream(stream_name) and not conventional,
+            )
+        key_columns = self._stream_key_columns[stream_name]
+        hash_column = c.TargetOracle.ROW_HASH_COLUMN
+        source_list = ", ".join(
+            f'{self._bind_placeholder(name, position)} AS "{name}"'
+            for position, name in enumerate(column_names, 1)
+        )
+        on_clause = " AND ".join(f'tgt."{name}" = src."{name}"' for name in key_columns)
+        update_list = ", ".join(
+            f'tgt."{name}" = src."{name}"'
+            for name in column_names
+            if name not in key_columns
+        )
+        insert_list = ", ".join(f'"{name}"' for name in column_names)
+        values_list = ", ".join(f'src."{name}"' for name in column_names)
+        return (
+            f"MERGE INTO {schema_name}.{table_name} tgt "
+            f"USING (SELECT {source_list} FROM dual) src ON ({on_clause}) "
+            f"WHEN MATCHED THEN UPDATE SET {update_list} "
+            f'WHERE DECODE(tgt."{hash_column}", src."{hash_column}", 0, 1) = 1 '
+            f"WHEN NOT MATCHED THEN INSERT ({insert_list}) VALUES ({values_list})"
+        )
+
+    def _row_hash_key_specs(
+        self, stream_name: str, column_names: t.StrSequence
+    ) -> tuple[tuple[tuple[int, str], ...], int]:
+        """Return the key (position, data type) pairs and the hash position."""
+        data_types = {
+            column.name: column.data_type
+            for column in self._stream_columns.get(stream_name, ())
+        }
+        return (
+            tuple(
+                (column_names.index(name), data_types.get(name, ""))
+                for name in self._stream_key_columns[stream_name]
+            ),
+            column_names.index(c.TargetOracle.ROW_HASH_COLUMN),
+        )
+
+    def _row_hash_cache_key(
+        self, key_specs: tuple[tuple[int, str], ...], row: t.TargetOracle.BindTuple
+    ) -> tuple[str, ...]:
+        """Return the normalized key used by the local row-hash cache."""
+        return tuple(
+            self._cache_key_text(row[position], data_type)
+            for position, data_type in key_specs
+        )
+
+    def _cache_row_hashes(
+        self,
+        hash_cache: dict[tuple[str, ...], str],
+        entries: Iterable[tuple[tuple[str, ...], str]],
+    ) -> None:
+        """Store key hashes as most recently used and evict beyond the limit.
+
+        The dict keeps insertion order, so re-inserting a key marks it as
+        recent and the oldest keys are the first ones iterated.
+        """
+        for key, row_hash in entries:
+            hash_cache.pop(key, None)
+            hash_cache[key] = row_hash
+        overflow = len(hash_cache) - self.target_config.TargetOracle.row_hash_cache_size
+        if overflow > 0:
+            for key in list(itertools.islice(hash_cache, overflow)):
+                del hash_cache[key]
+
+    def _collapse_duplicate_keys(
+        self,
+        stream_name: str,
+        column_names: t.StrSequence,
+        rows: list[t.TargetOracle.OffsetRow],
+    ) -> list[t.TargetOracle.OffsetRow]:
+        """Keep only the last row of each merge key in one write.
+
+        Buffered records are already collapsed as they arrive; this covers
+        columnar batches, so no write carries a key twice under one load stamp.
+        """
+        key_columns = self._stream_key_columns.get(stream_name)
+        if not key_columns or not self._merge_enabled():
+            return rows
+        key_positions = tuple(column_names.index(name) for name in key_columns)
+        last_rows: dict[tuple[t.TargetOracle.BindValue, ...], int] = {}
+        kept_rows: list[t.TargetOracle.OffsetRow | None] = []
+        for offset, row in rows:
+            key = tuple(row[position] for position in key_positions)
+            if not any(isinstance(value, (Mapping, list)) for value in key):
+                previous_slot = last_rows.get(key)
+                if previous_slot is not None:
+                    kept_rows[previous_slot] = None
+                last_rows[key] = len(kept_rows)
+            kept_rows.append((offset, row))
+        collapsed_rows = [kept_row for kept_row in kept_rows if kept_row is not None]
+        if len(collapsed_rows) < len(rows):
+            self._count_rows(stream_name, collapsed=len(rows) - len(collapsed_rows))
+        return collapsed_rows
+
+    def _drop_unchanged_rows(
+        self,
+        stream_name: str,
+        column_names: t.StrSequence,
+        rows: list[t.TargetOracle.OffsetRow],
+    ) -> list[t.TargetOracle.OffsetRow]:
+        """Skip rows whose hash matches the local cache for their key."""
+        hash_cache = self._row_hash_cache.get(stream_name)
+        if not hash_cache or not self._row_hash_merge_enabled(stream_name):
+            return rows
+        key_specs, hash_position = self._row_hash_key_specs(stream_name, column_names)
+        changed_rows: list[t.TargetOracle.OffsetRow] = []
+        unchanged_keys: list[tuple[tuple[str, ...], str]] = []
+        for offset, row in rows:
+            key = self._row_hash_cache_key(key_specs, row)
+            row_hash = str(row[hash_position])
+            if hash_cache.get(key) == row_hash:
+                unchanged_keys.append((key, row_hash))
+            else:
+                changed_rows.append((offset, row))
+        if unchanged_keys:
+            self._cache_row_hashes(hash_cache, unchanged_keys)
+            self._count_rows(stream_name, unchanged=len(unchanged_keys))
+        return changed_rows
+
+    def _remember_row_hashes(
+        self,
+        stream_name: str,
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
+    ) -> None:
+        """Record the hashes of rows Oracle accepted."""
+        hash_cache = self._row_hash_cache.get(stream_name)
+        if hash_cache is None or not self._row_hash_merge_enabled(stream_name):
+            return
+        key_specs, hash_position = self._row_hash_key_specs(stream_name, column_names)
+        self._cache_row_hashes(
+            hash_cache,
+            (
+                (self._row_hash_cache_key(key_specs, row), str(row[hash_position]))
+                for _offset, row in rows
+            ),
+        )
+
+    def _preflight_batch(
+        self,
+        stream_name: str,
+        binds: t.TargetOracle.BindColumns,
+        rows: list[t.TargetOracle.OffsetRow],
+    ) -> p.Result[list[t.TargetOracle.OffsetRow]]:
+        """Check a batch against the stream column layout before binding it.
+
+        The checks run over ``binds`` column by column. In quarantine mode
+        violating rows are quarantined and the clean ``rows`` returned;
+        otherwise the first violation fails the batch without a server round
+        trip.
+        """
+        validator = self._stream_validators.get(stream_name)
+        if (
+            not self.target_config.TargetOracle.preflight_validation
+            or validator is None
+            or not validator.enabled
+        ):
+            return r[list[t.TargetOracle.OffsetRow]].ok(rows)
+        violations = validator.violations(binds)
+        if not violations:
+            return r[list[t.TargetOracle.OffsetRow]].ok(rows)
+        if (
+            self.target_config.TargetOracle.on_batch_error
+            != c.TargetOracle.BATCH_ERROR_MODE_QUARANTINE
+        ):
+            self._count_rows(stream_name, processed=len(rows), failed=len(rows))
+            batch_index, message = min(violations.items())
+            return r[list[t.TargetOracle.OffsetRow]].fail(
+                f"Pre-flight validation failed for {stream_name} "
+                f"row {rows[batch_index][0]}: {message}"
+            )
+        column_names = tuple(binds)
+        write_result = self.quarantine.write([
+            self._rejected_row(
+                stream_name,
+                rows[batch_index][0],
+                column_names,
+                rows[batch_index][1],
+                message,
+            )
+            for batch_index, message in sorted(violations.items())
+        ])
+        if write_result.failure:
+            return r[list[t.TargetOracle.OffsetRow]].fail(
+                write_result.error or "Failed to quarantine rows"
+            )
+        self._count_rows(
+            stream_name, processed=len(violations), rejected=len(violations)
+        )
+        self.log_error(
+            f"Quarantined {len(violations)} of {len(rows)} rows for "
+            f"{stream_name} before flush",
+            path=str(self.quarantine.quarantine_path(stream_name)),
+        )
+        return r[list[t.TargetOracle.OffsetRow]].ok([
+            offset_row
+            for batch_index, offset_row in enumerate(rows)
+            if batch_index not in violations
+        ])
+
+    def _quarantine_rejected_rows(
+        self,
+        connected_api: FlextDbOracleApi,
+        stream_name: str,
+        table_name: str,
+        schema_name: str,
+        insert_sql: str,
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
+        batch_error: str,
+    ) -> p.Result[bool]:
+        """Isolate the rows of a failed batch and quarantine the rejected ones.
+
+        The caller has already rolled the whole batch, merge deletes
+        included, back to its savepoint. Halves are re-sent recursively, so
+        clean sub-batches still load as arrays and the retries grow with the
+        number of rejected rows, not the batch size. ``insert_sql`` is a
+        conventional statement even for bulk-load streams: after one
+        direct-path half the table takes no more DML in the transaction
+        (ORA-12838). Rows Oracle still rejects are written with their buffer
+        offset and ORA code to the stream quarantine file.
+        """
+        bisect_result = self._bisect_rejected_rows(
+            connected_api,
+            stream_name,
+            table_name,
+            schema_name,
+            insert_sql,
+            column_names,
+            rows,
+            batch_error,
+        )
+        if bisect_result.failure:
+            self._count_rows(stream_name, processed=len(rows), failed=len(rows))
+            return r[bool].fail(bisect_result.error or "Failed to isolate rows")
+        rejected = bisect_result.value
+        write_result = self.quarantine.write(rejected)
+        if write_result.failure:
+            self._count_rows(stream_name, processed=len(rows), failed=len(rejected))
+            return r[bool].fail(write_result.error or "Failed to quarantine rows")
+        self._count_rows(
+            stream_name,
+            processed=len(rows),
+            loaded=len(rows) - len(rejected),
+            rejected=len(rejected),
+            batches=1,
+        )
+        self.log_error(
+            f"Quarantined {len(rejected)} of {len(rows)} rows for {stream_name}",
+            path=str(self.quarantine.quarantine_path(stream_name)),
+        )
+        return r[bool].ok(value=True)
 
     def _build_batch_parameters(
         self, stream_name: str, records: t.SequenceOf[t.JsonMapping], loaded_at: str
-    ) -> p.Result[list[t.JsonMapping]]:
-        """Build validated insert parameters for buffered records."""
-        params_list: list[t.JsonMapping] = []
-        for record in records:
-            params_result = self._build_insert_parameters(
-                stream_name, record, loaded_at
+    ) -> p.Result[t.TargetOracle.BindColumns]:
+        """Bind buffered records through the shared column binder."""
+        column_data: dict[str, t.SequenceOf[t.JsonValue]] = {
+            target_name: [
+                record.get(target_name, record.get(source_name)) for record in records
+            ]
+            for source_name, target_name in self._stream_field_mappings.get(
+                stream_name, ()
             )
-            if params_result.failure:
-                return r[list[t.JsonMapping]].fail(
-                    params_result.error or "Failed to build insert parameters"
-                )
-            params_list.append(params_result.value)
-        return r[list[t.JsonMapping]].ok(params_list)
+        }
+        column_data["_sdc_extracted_at"] = [
+            record.get("_sdc_extracted_at") for record in records
+        ]
+        if stream_name in self._row_hash_streams:
+            for source_name in self._stream_nested_fields.get(stream_name, ()):
+                column_data[source_name] = [
+                    record.get(source_name) for record in records
+                ]
+        json_payloads = (
+            self._record_payloads(stream_name, records)
+            if self.target_config.TargetOracle.storage_mode
+            in {c.TargetOracle.STORAGE_MODE_JSON, c.TargetOracle.STORAGE_MODE_HYBRID}
+            else None
+        )
+        return self._build_column_binds(
+            stream_name, column_data, len(records), loaded_at, json_payloads
+        )
 
     def _delete_merge_rows(
         self,
@@ -765,34 +3248,31 @@ class FlextTargetOracleLoader(FlextMeltanoServiceBase):
         stream_name: str,
         table_name: str,
         schema_name: str,
-        params_list: t.SequenceOf[t.JsonMapping],
+        column_names: t.StrSequence,
+        rows: t.SequenceOf[t.TargetOracle.OffsetRow],
     ) -> p.Result[bool]:
-        """Delete existing merge rows before inserting updated records."""
-        merge_enabled = (
-            self.target_config.TargetOracle.sdc_mode.lower()
-            == c.TargetOracle.LOAD_METHOD_MERGE.lower()
-            or self.target_config.TargetOracle.load_method
-            in {c.TargetOracle.LOAD_METHOD_MERGE, c.TargetOracle.LOAD_METHOD_BULK_MERGE}
-        )
+        """Delete existing merge rows, array-bound by key, before inserting."""
         key_columns = self._stream_key_columns.get(stream_name)
-        if not merge_enabled or not key_columns:
+        if (
+            not self._merge_enabled()
+            or not key_columns
+            or self._bulk_load_stream(stream_name)
+        ):
             return r[bool].ok(value=True)
-        delete_sql_result = connected_api.oracle_services.build_delete_statement(
-            table_name, key_columns, schema=schema_name
+        key_positions = tuple(column_names.index(name) for name in key_columns)
+        where_clause = " AND ".join(
+            f'"{name}" = :{position}' for position, name in enumerate(key_columns, 1)
         )
-        if delete_sql_result.failure:
-            return r[bool].fail(
-                f"Failed to build merge delete SQL: {delete_sql_result.error}"
-            )
-        for params in params_list:
-            delete_params = t.json_mapping_adapter().validate_python({
-                key: params[key] for key in key_columns
-            })
-            delete_result = connected_api.execute_sql(
-                delete_sql_result.value, delete_params
-            )
-            if delete_result.failure:
-                return r[bool].fail_op("Merge delete", delete_result.error)
+        delete_result = self._execute_many(
+            connected_api,
+            f"DELETE FROM {schema_name}.{table_name} WHERE {where_clause}",
+            [
+                tuple(row[position] for position in key_positions)
+                for _offset, row in rows
+            ],
+        )
+        if delete_result.failure:
+            return r[bool].fail_op("Merge delete", delete_result.error)
         return r[bool].ok(value=True)
 
 
@@ -0,0 +1,195 @@
+"""Low-overhead runtime metrics for the Oracle loader hot path.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from typing import ClassVar
+
+from flext_target_oracle import c, m, t
+
+
+class FlextTargetOracleMetrics:
+    """Per-stream counters and latency histograms with a snapshot API.
+
+    Recording is a plain dictionary increment plus, for latencies, one bucket
+    index computation; nothing is sorted or aggregated until ``snapshot``.
+    Per-record timings are summed with ``accumulate`` and recorded once per
+    batch by ``observe_pending``.
+    """
+
+    BITS: ClassVar[int] = c.TargetOracle.METRICS_SUB_BUCKET_BITS
+
+    class Histogram:
+        """HDR-style log-linear histogram of nanosecond observations.
+
+        Values below ``2**bits`` are counted exactly; larger values share a
+        bucket with neighbours that agree on their top ``bits`` binary digits.
+        """
+
+        __slots__ = ("_buckets", "count", "maximum", "minimum", "total")
+
+        def __init__(self) -> None:
+            """Start empty."""
+            self._buckets: dict[int, int] = {}
+            self.count = 0
+            self.total = 0
+            self.minimum = -1
+            self.maximum = 0
+
+        def record(self, value_ns: int) -> None:
+            """Count one observation."""
+            bits = FlextTargetOracleMetrics.BITS
+            shift = value_ns.bit_length() - bits
+            if shift < 0:
+                shift = 0
+            index = (shift << bits) | (value_ns >> shift)
+            buckets = self._buckets
+            buckets[index] = buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += value_ns
+            if value_ns > self.maximum:
+                self.maximum = value_ns
+            if value_ns < self.minimum or self.minimum < 0:
+                self.minimum = value_ns
+
+        def quantile(self, fraction: float) -> int:
+            """Return the upper bound of the bucket holding ``fraction``."""
+            if not self.count:
+                return 0
+            bits = FlextTargetOracleMetrics.BITS
+            mask = (1 << bits) - 1
+            rank = max(1, round(fraction * self.count))
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    shift = index >> bits
+                    upper = (((index & mask) + 1) << shift) - 1
+                    return min(upper, self.maximum)
+            return self.maximum
+
+        def summary(self) -> m.TargetOracle.LatencySummary:
+            """Return the histogram as a millisecond quantile summary."""
+            return m.TargetOracle.LatencySummary(
+                count=self.count,
+                total_ms=self.total / 1e6,
+                min_ms=max(self.minimum, 0) / 1e6,
+                max_ms=self.maximum / 1e6,
+                p50_ms=self.quantile(0.5) / 1e6,
+                p90_ms=self.quantile(0.9) / 1e6,
+                p99_ms=self.quantile(0.99) / 1e6,
+            )
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._counters: dict[str, dict[str, int]] = {}
+        self._histograms: dict[str, dict[str, FlextTargetOracleMetrics.Histogram]] = {}
+        self._reported: dict[tuple[str, str], int] = {}
+        self._pending: dict[tuple[str, str], int] = {}
+        self._started = time.monotonic()
+
+    @property
+    def streams(self) -> tuple[str, ...]:
+        """Return every stream with at least one counter or latency."""
+        return tuple(dict.fromkeys((*self._counters, *self._histograms)))
+
+    def counters(self, stream_name: str) -> Counter[str]:
+        """Return a copy of one stream's counters; unknown names read as 0."""
+        return Counter(self._counters.get(stream_name, {}))
+
+    def increment(self, stream_name: str, name: str, value: int = 1) -> None:
+        """Add ``value`` to one counter."""
+        counters = self._counters.get(stream_name)
+        if counters is None:
+            counters = self._counters[stream_name] = {}
+        counters[name] = counters.get(name, 0) + value
+
+    def update(self, stream_name: str, **counts: int) -> None:
+        """Add several counters at once."""
+        for name, value in counts.items():
+            self.increment(stream_name, name, value)
+
+    def observe(self, phase: str, stream_name: str, elapsed_ns: int) -> None:
+        """Record one latency observation for a phase of a stream."""
+        histograms = self._histograms.get(stream_name)
+        if histograms is None:
+            histograms = self._histograms[stream_name] = {}
+        histogram = histograms.get(phase)
+        if histogram is None:
+            histogram = histograms[phase] = FlextTargetOracleMetrics.Histogram()
+        histogram.record(elapsed_ns)
+
+    def accumulate(self, phase: str, stream_name: str, elapsed_ns: int) -> None:
+        """Add to a phase's pending total without touching its histogram."""
+        key = (stream_name, phase)
+        self._pending[key] = self._pending.get(key, 0) + elapsed_ns
+
+    def observe_pending(self, phase: str, stream_name: str) -> None:
+        """Record a phase's pending total as one observation, if any."""
+        elapsed_ns = self._pending.pop((stream_name, phase), 0)
+        if elapsed_ns:
+            self.observe(phase, stream_name, elapsed_ns)
+
+    def histogram(
+        self, phase: str, stream_name: str
+    ) -> FlextTargetOracleMetrics.Histogram | None:
+        """Return one live histogram, or ``None`` before its first observation."""
+        return self._histograms.get(stream_name, {}).get(phase)
+
+    def snapshot(self) -> m.TargetOracle.MetricsSnapshot:
+        """Return an immutable copy of every counter and latency summary.
+
+        Live dictionaries are copied in single C-level calls, so a scrape
+        thread may take a snapshot while the loader keeps recording.
+        """
+        return m.TargetOracle.MetricsSnapshot(
+            uptime_seconds=time.monotonic() - self._started,
+            streams=tuple(
+                m.TargetOracle.StreamMetrics(
+                    stream_name=stream_name,
+                    counters=dict(self._counters.get(stream_name, {})),
+                    latencies={
+                        phase: histogram.summary()
+                        for phase, histogram in tuple(
+                            self._histograms.get(stream_name, {}).items()
+                        )
+                    },
+                )
+                for stream_name in self.streams
+            ),
+        )
+
+    def unreported(self, stream_name: str, name: str) -> int:
+        """Return a counter's growth since the previous call, then mark it read."""
+        value = self._counters.get(stream_name, {}).get(name, 0)
+        delta = value - self._reported.get((stream_name, name), 0)
+        self._reported[stream_name, name] = value
+        return delta
+
+    @staticmethod
+    def singer_metric(
+        metric_type: str, metric: str, value: float, tags: t.StrMapping
+    ) -> str:
+        """Render one Singer SDK-style ``METRIC:`` log line."""
+        return c.TargetOracle.SINGER_METRIC_PREFIX + json.dumps(
+            {"type": metric_type, "metric": metric, "value": value, "tags": tags},
+            separators=(",", ":"),
+        )
+
+    def reset(self) -> None:
+        """Drop all recorded values and restart the uptime clock."""
+        self._counters.clear()
+        self._histograms.clear()
+        self._reported.clear()
+        self._pending.clear()
+        self._started = time.monotonic()
+
+
+__all__: list[str] = ["FlextTargetOracleMetrics"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, ClassVar
 
@@ -11,6 +12,7 @@ from flext_target_oracle._utilities.errors import (
     FlextTargetOracleErrorMetadata,
     FlextTargetOracleExceptions as e,
 )
+from flext_target_oracle._utilities.tracing import FlextTargetOracleSpanExporter
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -137,19 +139,41 @@ class FlextTargetOracleUtilitiesObservability:
     @staticmethod
     @contextmanager
     def target_oracle_monitor_query_performance(
-        table_name: str, operation: str = "SELECT"
-    ) -> Generator[t.StrMapping]:
-        """Yield a mutable context while timing a query operation."""
-        FlextTargetOracleUtilitiesObservability.logger.debug(
-            "Starting query performance monitor"
+        table_name: str,
+        operation: str = "SELECT",
+        *,
+        statement: str = "",
+        bind_count: int = 0,
+        exporter: FlextTargetOracleSpanExporter | None = None,
+    ) -> Generator[FlextTargetOracleSpanExporter.Span]:
+        """Time one statement as a span and hand it to ``exporter`` when done.
+
+        The caller sets ``rows_affected`` (and ``error`` for failed results) on
+        the yielded span; an exception escaping the block marks it failed.
+        """
+        span = FlextTargetOracleSpanExporter.Span(
+            table_name, operation, statement, bind_count
         )
-        context_data = {"table_name": table_name, "operation": operation}
+        span.start_unix_ns = time.time_ns()
+        started = time.perf_counter_ns()
         try:
-            yield context_data
+            yield span
+        except Exception as exc:
+            span.error = span.error or str(exc)
+            raise
         finally:
+            span.duration_ns = time.perf_counter_ns() - started
             FlextTargetOracleUtilitiesObservability.logger.debug(
-                "Finished query performance monitor"
+                "Oracle statement finished",
+                table_name=table_name,
+                operation=operation,
+                duration_ms=span.duration_ms,
+                rows_affected=span.rows_affected,
+                bind_count=bind_count,
+                error=span.error,
             )
+            if exporter is not None:
+                exporter.export(span)
 
     @staticmethod
     def configure_oracle_observability(
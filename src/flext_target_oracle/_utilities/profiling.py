@@ -0,0 +1,178 @@
+"""Opt-in sampling CPU and allocation profiling for production loads.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from flext_meltano import p
+from flext_target_oracle import c, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType, FrameType
+
+
+class FlextTargetOracleProfiler:
+    """Sample the main thread's stack and trace allocations for a time window.
+
+    CPU samples come from ``SIGPROF`` fired by ``ITIMER_PROF``, so only time
+    the process spends on CPU is sampled. The handler only folds the stack;
+    the window ends on the wall clock, when the owner sees ``expired`` at a
+    safe point and calls ``stop``. Both outputs are written as folded stacks
+    (``frame;frame;frame count``) readable by ``flamegraph.pl`` and
+    speedscope, and every stack starts with the loader phase it ran under.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        seconds: float,
+        interval: float,
+        phases: t.SequenceOf[CodeType] = (),
+    ) -> None:
+        """Configure the output directory, window, sample interval and phases."""
+        self.directory = Path(directory)
+        self.seconds = seconds
+        self.interval = interval
+        self._phase_codes = {code: code.co_name for code in phases}
+        self._phase_lines = tuple(
+            (
+                code.co_filename,
+                min(line for _, _, line in code.co_lines() if line is not None),
+                max(line for _, _, line in code.co_lines() if line is not None),
+                code.co_name,
+            )
+            for code in phases
+        )
+        self._samples: Counter[str] = Counter()
+        self._deadline = 0.0
+        self._active = False
+        self._owns_tracemalloc = False
+        self._previous_handler: (
+            Callable[[int, FrameType | None], object] | int | None
+        ) = signal.SIG_DFL
+
+    @property
+    def active(self) -> bool:
+        """Return whether a profiling window is open."""
+        return self._active
+
+    @property
+    def expired(self) -> bool:
+        """Return whether an open window has outlived its wall-clock length."""
+        return self._active and time.monotonic() >= self._deadline
+
+    def install_signal(self, signal_name: str) -> p.Result[bool]:
+        """Start a window whenever the process receives ``signal_name``."""
+        try:
+            signal.signal(
+                signal.Signals[signal_name], lambda _signum, _frame: self.start()
+            )
+        except (KeyError, ValueError, OSError) as exc:
+            return r[bool].fail_op(f"install {signal_name} profiling trigger", exc)
+        return r[bool].ok(value=True)
+
+    def start(self) -> p.Result[bool]:
+        """Open a window of ``seconds``; a running window is left alone."""
+        if self._active:
+            return r[bool].ok(value=False)
+        try:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        except (ValueError, OSError) as exc:
+            return r[bool].fail_op("start CPU sampling", exc)
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(c.TargetOracle.PROFILE_TRACEMALLOC_FRAMES)
+        self._samples.clear()
+        self._deadline = time.monotonic() + self.seconds
+        self._active = True
+        return r[bool].ok(value=True)
+
+    def stop(self) -> p.Result[tuple[Path, Path]]:
+        """Close the window and write the CPU and allocation folded stacks."""
+        if not self._active:
+            return r[tuple[Path, Path]].fail("No profiling window is open")
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(
+            signal.SIGPROF,
+            signal.SIG_DFL
+            if self._previous_handler is None
+            else self._previous_handler,
+        )
+        self._active = False
+        allocations = self._allocation_stacks(tracemalloc.take_snapshot())
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        stamp = f"{os.getpid()}-{time.strftime('%Y%m%dT%H%M%S')}"
+        cpu_path = self.directory / f"cpu-{stamp}{c.TargetOracle.PROFILE_FILE_SUFFIX}"
+        alloc_path = (
+            self.directory / f"alloc-{stamp}{c.TargetOracle.PROFILE_FILE_SUFFIX}"
+        )
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            cpu_path.write_text(self._folded(self._samples), encoding=c.DEFAULT_ENCODING)
+            alloc_path.write_text(self._folded(allocations), encoding=c.DEFAULT_ENCODING)
+        except OSError as exc:
+            return r[tuple[Path, Path]].fail_op("write profile", exc)
+        return r[tuple[Path, Path]].ok((cpu_path, alloc_path))
+
+    def _sample(self, _signum: int, frame: FrameType | None) -> None:
+        """Fold the interrupted stack; no I/O and no state changes."""
+        if frame is None or self.expired:
+            return
+        names: list[str] = []
+        phase = c.TargetOracle.PROFILE_PHASE_OTHER
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+            if phase == c.TargetOracle.PROFILE_PHASE_OTHER:
+                phase = self._phase_codes.get(code, phase)
+            frame = frame.f_back
+        names.append(f"phase:{phase}")
+        self._samples[";".join(reversed(names))] += 1
+
+    def _allocation_stacks(self, snapshot: tracemalloc.Snapshot) -> Counter[str]:
+        """Fold live allocations by traceback, weighted by bytes."""
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+            tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+        ))
+        stacks: Counter[str] = Counter()
+        for statistic in snapshot.statistics("traceback"):
+            names: list[str] = []
+            phase = c.TargetOracle.PROFILE_PHASE_OTHER
+            for frame in statistic.traceback:
+                names.append(f"{Path(frame.filename).stem}:{frame.lineno}")
+                phase = next(
+                    (
+                        name
+                        for filename, first, last, name in self._phase_lines
+                        if filename == frame.filename and first <= frame.lineno <= last
+                    ),
+                    phase,
+                )
+            stacks[";".join([f"phase:{phase}", *names])] += statistic.size
+        return stacks
+
+    @staticmethod
+    def _folded(stacks: t.MappingKV[str, int]) -> str:
+        """Render ``stack count`` lines, heaviest first."""
+        return "".join(
+            f"{stack} {count}\n"
+            for stack, count in sorted(stacks.items(), key=lambda item: -item[1])
+        )
+
+
+__all__: list[str] = ["FlextTargetOracleProfiler"]
@@ -0,0 +1,193 @@
+"""Prometheus text exposition of loader metrics over HTTP or a textfile.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from flext_meltano import p
+from flext_target_oracle import c, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from flext_target_oracle._utilities.metrics import FlextTargetOracleMetrics
+
+
+class FlextTargetOracleMetricsExporter:
+    """Render the metrics registry in Prometheus text format 0.0.4.
+
+    Nothing runs until ``start`` (HTTP endpoint on a daemon thread) or
+    ``write_textfile`` (node_exporter textfile collector) is called, so a
+    loader without exporter settings pays nothing.
+    """
+
+    def __init__(
+        self,
+        metrics: FlextTargetOracleMetrics,
+        buffer_depths: Callable[[], t.MappingKV[str, int]],
+    ) -> None:
+        """Read counters from ``metrics`` and live depths from ``buffer_depths``."""
+        self._metrics = metrics
+        self._buffer_depths = buffer_depths
+        self._server: ThreadingHTTPServer | None = None
+        self._previous: dict[str, tuple[float, int]] = {}
+        self._previous_lock = threading.Lock()
+
+    @property
+    def address(self) -> tuple[str, int] | None:
+        """Return the bound ``(host, port)`` while the endpoint is serving."""
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def render(self) -> str:
+        """Return every metric family as Prometheus exposition text."""
+        prefix = c.TargetOracle.PROMETHEUS_METRIC_PREFIX
+        snapshot = self._metrics.snapshot()
+        uptime = max(snapshot.uptime_seconds, 1e-9)
+        depths = dict(self._buffer_depths())
+        families: dict[str, tuple[str, str, list[str]]] = {
+            name: (kind, help_text, [])
+            for name, kind, help_text in c.TargetOracle.PROMETHEUS_FAMILIES
+        }
+        busy_seconds = 0.0
+        for stream in snapshot.streams:
+            labels = f'stream="{self._label(stream.stream_name)}"'
+            counters = stream.counters
+            values = {
+                "buffer_records": depths.get(stream.stream_name, 0),
+                "buffer_bytes": max(
+                    counters.get("bytes_in", 0) - counters.get("bytes_flushed", 0), 0
+                ),
+                "records_received_total": counters.get("rows_in", 0),
+                "records_loaded_total": counters.get("loaded", 0),
+                "records_quarantined_total": counters.get("rejected", 0),
+                "records_per_second": self._loaded_rate(
+                    stream.stream_name, uptime, counters.get("loaded", 0)
+                ),
+            }
+            for name, value in values.items():
+                families[name][2].append(f"{prefix}{name}{{{labels}}} {value}")
+            flush = stream.latencies.get(c.TargetOracle.METRIC_PHASE_FLUSH)
+            if flush is None:
+                continue
+            busy_seconds += flush.total_ms / 1000
+            samples = families["flush_duration_seconds"][2]
+            for quantile, value_ms in (
+                ("0.5", flush.p50_ms),
+                ("0.9", flush.p90_ms),
+                ("0.99", flush.p99_ms),
+            ):
+                samples.append(
+                    f"{prefix}flush_duration_seconds"
+                    f'{{{labels},quantile="{quantile}"}} {value_ms / 1000}'
+                )
+            samples.extend((
+                f"{prefix}flush_duration_seconds_sum{{{labels}}} {flush.total_ms / 1000}",
+                f"{prefix}flush_duration_seconds_count{{{labels}}} {flush.count}",
+            ))
+        families["session_utilization_ratio"][2].append(
+            f"{prefix}session_utilization_ratio {min(busy_seconds / uptime, 1.0)}"
+        )
+        families["uptime_seconds"][2].append(f"{prefix}uptime_seconds {uptime}")
+        lines: list[str] = []
+        for name, (kind, help_text, samples) in families.items():
+            lines.extend((
+                f"# HELP {prefix}{name} {help_text}",
+                f"# TYPE {prefix}{name} {kind}",
+                *samples,
+            ))
+        return "\n".join(lines) + "\n"
+
+    def _loaded_rate(self, stream_name: str, uptime: float, loaded: int) -> float:
+        """Return records loaded per second since the previous render.
+
+        The first render measures from loader start; scrape threads and the
+        textfile writer share the previous sample under a lock.
+        """
+        with self._previous_lock:
+            previous_uptime, previous_loaded = self._previous.get(
+                stream_name, (0.0, 0)
+            )
+            self._previous[stream_name] = (uptime, loaded)
+        elapsed = uptime - previous_uptime
+        if elapsed <= 0:
+            return 0.0
+        return max(loaded - previous_loaded, 0) / elapsed
+
+    def start(self, host: str, port: int) -> p.Result[tuple[str, int]]:
+        """Serve ``/metrics`` on a daemon thread until ``close``."""
+        if self.address is not None:
+            return r[tuple[str, int]].ok(self.address)
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """Answer scrapes with the current exposition text."""
+
+            def do_GET(self) -> None:
+                """Serve the metrics page; every other path is 404."""
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode(c.DEFAULT_ENCODING)
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", c.TargetOracle.PROMETHEUS_CONTENT_TYPE
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            @override
+            def log_message(self, *args: object) -> None:
+                """Keep scrapes out of the Singer log stream."""
+                _ = args
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as exc:
+            return r[tuple[str, int]].fail_op("start Prometheus endpoint", exc)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="flext-target-oracle-metrics",
+            daemon=True,
+        ).start()
+        return r[tuple[str, int]].ok(self.address or (host, port))
+
+    def close(self) -> None:
+        """Stop the HTTP endpoint if it is running."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def write_textfile(self, path: str) -> p.Result[bool]:
+        """Atomically replace ``path`` for node_exporter's textfile collector."""
+        target = Path(path)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(self.render(), encoding=c.DEFAULT_ENCODING)
+            staging.replace(target)
+        except OSError as exc:
+            return r[bool].fail_op("write Prometheus textfile", exc)
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _label(value: str) -> str:
+        """Escape a label value per the exposition format."""
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+__all__: list[str] = ["FlextTargetOracleMetricsExporter"]
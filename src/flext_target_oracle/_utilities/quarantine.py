@@ -0,0 +1,78 @@
+"""Row-level quarantine for records rejected by Oracle array DML.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from flext_meltano import p
+from flext_target_oracle import c, m, r, t
+
+
+class FlextTargetOracleQuarantine:
+    """Append rejected rows to one JSON-lines file per stream."""
+
+    def __init__(self, directory: str) -> None:
+        """Store the quarantine directory; it is created on first write."""
+        self.directory = Path(directory)
+
+    def quarantine_path(self, stream_name: str) -> Path:
+        """Return the quarantine file for one stream."""
+        return self.directory / f"{stream_name}{c.TargetOracle.QUARANTINE_FILE_SUFFIX}"
+
+    @staticmethod
+    def error_code(error: str) -> str:
+        """Extract the first ``ORA-NNNNN`` code from a driver error message."""
+        match = c.TargetOracle.ORA_ERROR_CODE_RE.search(error)
+        return match.group(0) if match else ""
+
+    @classmethod
+    def rejected_row(
+        cls,
+        stream_name: str,
+        batch_offset: int,
+        row: t.TargetOracle.BindRow,
+        error: str,
+    ) -> m.TargetOracle.RejectedRow:
+        """Build a quarantine entry, decoding binary JSON payload binds."""
+        return m.TargetOracle.RejectedRow(
+            stream_name=stream_name,
+            batch_offset=batch_offset,
+            error_code=cls.error_code(error),
+            error_message=error,
+            row={
+                key: value.decode(c.DEFAULT_ENCODING, errors="replace")
+                if isinstance(value, bytes)
+                else value
+                for key, value in row.items()
+            },
+        )
+
+    def write(
+        self, rejected_rows: t.SequenceOf[m.TargetOracle.RejectedRow]
+    ) -> p.Result[int]:
+        """Append rejected rows with one write per stream file."""
+        if not rejected_rows:
+            return r[int].ok(0)
+        lines_by_stream: dict[str, list[str]] = {}
+        for rejected in rejected_rows:
+            lines_by_stream.setdefault(rejected.stream_name, []).append(
+                rejected.model_dump_json()
+            )
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for stream_name, lines in lines_by_stream.items():
+                with self.quarantine_path(stream_name).open(
+                    "a", encoding=c.DEFAULT_ENCODING
+                ) as handle:
+                    handle.write("\n".join(lines) + "\n")
+        except OSError as exc:
+            return r[int].fail_op("write quarantine file", exc)
+        return r[int].ok(len(rejected_rows))
+
+
+__all__: list[str] = ["FlextTargetOracleQuarantine"]
@@ -31,6 +31,7 @@ class FlextTargetOracleConnectionService:
                 service_name=settings.TargetOracle.oracle_service_name,
                 username=settings.TargetOracle.oracle_user,
                 password=settings.TargetOracle.oracle_password,
+                parallel_degree=settings.TargetOracle.parallel_degree,
             )
         )
 
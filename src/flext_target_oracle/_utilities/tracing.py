@@ -0,0 +1,176 @@
+"""Statement timing spans exported as OTLP/JSON.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import urllib.request
+from pathlib import Path
+
+from flext_meltano import p
+from flext_target_oracle import c, r, t
+
+
+class FlextTargetOracleSpanExporter:
+    """Buffer finished statement spans and ship them in OTLP/JSON batches.
+
+    Spans go to a JSON-lines file (one ``ExportTraceServiceRequest`` per line,
+    the layout read by the collector's ``otlpjsonfile`` receiver) and/or are
+    POSTed to an OTLP/HTTP ``/v1/traces`` endpoint. ``export`` only queues;
+    the loader calls ``flush`` after each batch, so no I/O happens while a
+    statement is running.
+    """
+
+    class Span:
+        """One timed statement; the caller fills in rows and errors."""
+
+        __slots__ = (
+            "bind_count",
+            "duration_ns",
+            "error",
+            "operation",
+            "rows_affected",
+            "start_unix_ns",
+            "statement",
+            "table_name",
+        )
+
+        def __init__(
+            self, table_name: str, operation: str, statement: str, bind_count: int
+        ) -> None:
+            """Open a span; timestamps are set by the monitor."""
+            self.table_name = table_name
+            self.operation = operation
+            self.statement = statement
+            self.bind_count = bind_count
+            self.rows_affected = 0
+            self.error = ""
+            self.start_unix_ns = 0
+            self.duration_ns = 0
+
+        @property
+        def duration_ms(self) -> float:
+            """Return the wall time in milliseconds."""
+            return self.duration_ns / 1e6
+
+    def __init__(self, file_path: str = "", endpoint: str = "") -> None:
+        """Configure the sinks; one trace id groups every span of the run."""
+        self.file_path = Path(file_path) if file_path else None
+        self.endpoint = endpoint
+        self.trace_id = secrets.token_hex(16)
+        self._pending: list[FlextTargetOracleSpanExporter.Span] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any sink is configured."""
+        return self.file_path is not None or bool(self.endpoint)
+
+    def export(self, span: FlextTargetOracleSpanExporter.Span) -> None:
+        """Queue one finished span for the next ``flush``."""
+        self._pending.append(span)
+
+    def flush(self) -> p.Result[int]:
+        """Write every queued span, at most one export batch per request."""
+        spans, self._pending = self._pending, []
+        if not spans or not self.enabled:
+            return r[int].ok(0)
+        size = c.TargetOracle.TRACE_EXPORT_BATCH_SPANS
+        try:
+            for start in range(0, len(spans), size):
+                self._send(
+                    json.dumps(
+                        self.otlp_payload(spans[start : start + size]),
+                        separators=(",", ":"),
+                    )
+                )
+        # URLError and HTTPError are OSError subclasses; urlopen raises
+        # ValueError for a malformed endpoint URL.
+        except (OSError, ValueError) as exc:
+            return r[int].fail_op("export trace spans", exc)
+        return r[int].ok(len(spans))
+
+    def _send(self, payload: str) -> None:
+        """Append one request to the file sink and POST it to the endpoint."""
+        if self.file_path is not None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.file_path.open("a", encoding=c.DEFAULT_ENCODING) as handle:
+                handle.write(payload + "\n")
+        if self.endpoint:
+            request = urllib.request.Request(
+                self.endpoint,
+                data=payload.encode(c.DEFAULT_ENCODING),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(
+                request, timeout=c.TargetOracle.TRACE_EXPORT_TIMEOUT_SECONDS
+            ):
+                pass
+
+    def otlp_payload(
+        self, spans: t.SequenceOf[FlextTargetOracleSpanExporter.Span]
+    ) -> t.JsonMapping:
+        """Render spans as an OTLP ``ExportTraceServiceRequest`` JSON object."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            self._attribute(
+                                "service.name", c.TargetOracle.TRACE_SERVICE_NAME
+                            )
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": c.TargetOracle.TRACE_SCOPE_NAME},
+                            "spans": [self._otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _otlp_span(self, span: FlextTargetOracleSpanExporter.Span) -> t.JsonMapping:
+        """Render one span with OpenTelemetry database semantic attributes."""
+        attributes = [
+            self._attribute("db.system", "oracle"),
+            self._attribute("db.operation", span.operation),
+            self._attribute("db.sql.table", span.table_name),
+            self._attribute("db.statement", span.statement),
+            self._attribute("db.oracle.bind_count", span.bind_count),
+            self._attribute("db.oracle.rows_affected", span.rows_affected),
+        ]
+        return {
+            "traceId": self.trace_id,
+            "spanId": secrets.token_hex(8),
+            "name": f"{span.operation} {span.table_name}".strip(),
+            "kind": c.TargetOracle.TRACE_SPAN_KIND_CLIENT,
+            "startTimeUnixNano": str(span.start_unix_ns),
+            "endTimeUnixNano": str(span.start_unix_ns + span.duration_ns),
+            "attributes": attributes,
+            "status": {
+                "code": c.TargetOracle.TRACE_STATUS_ERROR,
+                "message": span.error,
+            }
+            if span.error
+            else {"code": c.TargetOracle.TRACE_STATUS_OK},
+        }
+
+    @staticmethod
+    def _attribute(key: str, value: str | int) -> t.JsonMapping:
+        """Render one OTLP ``KeyValue``; OTLP/JSON encodes int64 as a string."""
+        return {
+            "key": key,
+            "value": {"intValue": str(value)}
+            if isinstance(value, int)
+            else {"stringValue": value},
+        }
+
+
+__all__: list[str] = ["FlextTargetOracleSpanExporter"]
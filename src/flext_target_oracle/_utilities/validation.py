@@ -0,0 +1,188 @@
+"""Pre-flight row validation compiled from Oracle column metadata.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from operator import methodcaller
+
+from flext_target_oracle import c, m, t
+
+
+class FlextTargetOracleRowValidator:
+    """Column-wise checks for widths, numeric types and nullability.
+
+    Checks are compiled once per stream from the column layout Oracle
+    reports and run over a whole column at a time: a bulk screen built on
+    ``map``/``max`` clears a clean column without visiting its values, and
+    only a column that fails the screen is walked to find offending rows.
+    Messages carry the ORA code Oracle would raise for the same value.
+    """
+
+    def __init__(
+        self,
+        columns: t.SequenceOf[m.DbOracle.Column],
+        encoding: str | None = c.DEFAULT_ENCODING,
+    ) -> None:
+        """Compile the checks for every client-bound column.
+
+        ``encoding`` is the Python codec matching the database character
+        set for byte-semantics widths; ``None`` measures characters, which
+        is exact for single-byte character sets and a lower bound otherwise.
+        """
+        self._checks: tuple[tuple[str, t.TargetOracle.ColumnCheck], ...] = tuple(
+            (column.name, check)
+            for column in columns
+            if not column.name.startswith("_SDC_")
+            for check in self._column_checks(column, encoding)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any column carries a check."""
+        return bool(self._checks)
+
+    def violations(self, binds: t.TargetOracle.BindColumns) -> dict[int, str]:
+        """Return the first violation message per offending row offset."""
+        row_count = len(next(iter(binds.values()), ()))
+        violations: dict[int, str] = {}
+        for column_name, check in self._checks:
+            values = binds.get(column_name, (None,) * row_count)
+            for batch_offset, message in check(values).items():
+                violations.setdefault(
+                    batch_offset, f"{message} for column {column_name}"
+                )
+        return violations
+
+    @classmethod
+    def _column_checks(
+        cls, column: m.DbOracle.Column, encoding: str | None
+    ) -> tuple[t.TargetOracle.ColumnCheck, ...]:
+        """Derive the checks that apply to one column definition."""
+        checks: list[t.TargetOracle.ColumnCheck] = []
+        if not column.nullable:
+            checks.append(cls._check_not_null)
+        character_match = c.TargetOracle.ORACLE_CHARACTER_TYPE_RE.match(
+            column.data_type
+        )
+        if character_match is not None:
+            type_name, length, semantics = character_match.groups()
+            char_semantics = type_name.upper().startswith("N") or (
+                (semantics or "").upper() == "CHAR"
+            )
+            checks.append(
+                partial(
+                    cls._check_length,
+                    max_length=int(length),
+                    encoding=None if char_semantics else encoding,
+                )
+            )
+            return tuple(checks)
+        number_match = c.TargetOracle.ORACLE_NUMBER_TYPE_RE.match(column.data_type)
+        if number_match is not None:
+            precision, scale = number_match.groups()
+            max_integer_digits = (
+                int(precision) - int(scale or 0)
+                if precision is not None and precision != "*"
+                else None
+            )
+            checks.append(
+                partial(cls._check_number, max_integer_digits=max_integer_digits)
+            )
+        return tuple(checks)
+
+    @staticmethod
+    def _check_not_null(
+        values: t.SequenceOf[t.TargetOracle.BindValue],
+    ) -> dict[int, str]:
+        """Reject NULL in a NOT NULL column."""
+        if None not in values:
+            return {}
+        return {
+            batch_offset: "ORA-01400: cannot insert NULL"
+            for batch_offset, value in enumerate(values)
+            if value is None
+        }
+
+    @staticmethod
+    def _check_length(
+        values: t.SequenceOf[t.TargetOracle.BindValue],
+        *,
+        max_length: int,
+        encoding: str | None,
+    ) -> dict[int, str]:
+        """Reject character values wider than the declared column width."""
+        present = list(filter(None, values))
+        if set(map(type, present)) <= {str}:
+            widest = max(map(len, present), default=0)
+            if widest <= max_length and (
+                encoding is None
+                or widest * c.TargetOracle.MAX_BYTES_PER_CHARACTER <= max_length
+                or max(map(len, map(methodcaller("encode", encoding), present)))
+                <= max_length
+            ):
+                return {}
+        violations: dict[int, str] = {}
+        for batch_offset, value in enumerate(values):
+            if value is None or isinstance(value, (bytes, bool, dict, list)):
+                continue
+            text = str(value)
+            actual = len(text) if encoding is None else len(text.encode(encoding))
+            if actual > max_length:
+                violations[batch_offset] = (
+                    "ORA-12899: value too large "
+                    f"(actual: {actual}, maximum: {max_length})"
+                )
+        return violations
+
+    @classmethod
+    def _check_number(
+        cls,
+        values: t.SequenceOf[t.TargetOracle.BindValue],
+        *,
+        max_integer_digits: int | None,
+    ) -> dict[int, str]:
+        """Reject non-numeric values and values above the declared precision."""
+        if set(map(type, values)) <= {int, float, type(None)} and (
+            max_integer_digits is None
+            or max(map(abs, filter(None, values)), default=0)
+            < 10**max_integer_digits
+        ):
+            return {}
+        violations: dict[int, str] = {}
+        for batch_offset, value in enumerate(values):
+            message = cls._number_violation(value, max_integer_digits)
+            if message is not None:
+                violations[batch_offset] = message
+        return violations
+
+    @staticmethod
+    def _number_violation(
+        value: t.TargetOracle.BindValue, max_integer_digits: int | None
+    ) -> str | None:
+        """Return the error Oracle would raise binding ``value`` to a NUMBER."""
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, str):
+            if not c.TargetOracle.NUMERIC_TEXT_RE.fullmatch(value):
+                return "ORA-01722: invalid number"
+        elif not isinstance(value, (int, float)):
+            return "ORA-01722: invalid number"
+        if max_integer_digits is None:
+            return None
+        try:
+            number = Decimal(str(value).strip())
+        except InvalidOperation:
+            return "ORA-01722: invalid number"
+        integer_digits = number.adjusted() + 1 if number.is_finite() and number else 0
+        if integer_digits <= max_integer_digits:
+            return None
+        return "ORA-01438: value larger than specified precision"
+
+
+__all__: list[str] = ["FlextTargetOracleRowValidator"]
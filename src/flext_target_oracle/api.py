@@ -10,12 +10,17 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import json
+import sys
+from pathlib import Path
 from typing import Annotated, Never, override
 
 from flext_meltano.services.consumer_bases.target_service_base import (
     FlextMeltanoTargetServiceBase,
 )
-from flext_target_oracle import c, m, p, r, t, u
+from flext_target_oracle import FlextTargetOracleSettings, c, m, p, r, t, u
+from flext_target_oracle.__version__ import __description__, __title__
+from flext_target_oracle._utilities.generator import FlextTargetOracleSingerGenerator
 
 
 class FlextTargetOracleService(FlextMeltanoTargetServiceBase):
@@ -39,16 +44,35 @@ class FlextTargetOracleService(FlextMeltanoTargetServiceBase):
     ) -> p.Result[str]:
         """Return target metadata for the about command message."""
         payload: t.StrMapping = {
-            "name": "flext-target-oracle",
-            "description": "Singer target for Oracle loading",
+            "name": __title__,
+            "description": __description__,
             "format": command.format,
         }
         if command.format == c.TargetOracle.OUTPUT_FORMAT_TEXT:
-            return r[str].ok("flext-target-oracle")
+            return r[str].ok(__title__)
         return r[str].ok(
             t.TargetOracle.STR_MAP_ADAPTER.dump_json(payload).decode(c.DEFAULT_ENCODING)
         )
 
+    def run_generate(
+        self, command: m.TargetOracle.OracleTargetGenerateCommand
+    ) -> p.Result[str]:
+        """Write a seeded synthetic Singer stream to a file or stdout."""
+        generator = FlextTargetOracleSingerGenerator(command)
+        if command.output_file is None:
+            write_result = generator.write(sys.stdout)
+        else:
+            try:
+                with Path(command.output_file).open(
+                    "w", encoding=c.DEFAULT_ENCODING
+                ) as handle:
+                    write_result = generator.write(handle)
+            except OSError as exc:
+                return r[str].fail_op("open generator output", exc)
+        if write_result.failure:
+            return r[str].fail(write_result.error or "Stream generation failed")
+        return r[str].ok(f"generated {write_result.value} Singer messages")
+
     def run_load(
         self, command: m.TargetOracle.OracleTargetLoadCommand
     ) -> p.Result[str]:
@@ -59,6 +83,50 @@ class FlextTargetOracleService(FlextMeltanoTargetServiceBase):
         _ = command.state_file
         return r[str].ok("load_ready")
 
+    def run_purge(
+        self, command: m.TargetOracle.OracleTargetPurgeCommand
+    ) -> p.Result[str]:
+        """Drop expired interval partitions of the configured streams.
+
+        The purge runs on a loader with the metrics endpoint, textfile,
+        profiler and span export switched off, and always disconnects.
+        """
+        settings_result = u.TargetOracle.load_target_settings(command.config_file)
+        if settings_result.failure:
+            return r[str].fail(settings_result.error or "Invalid settings")
+        settings = settings_result.value
+        if not isinstance(settings, FlextTargetOracleSettings):
+            return r[str].fail("Purge requires FlextTargetOracleSettings")
+        stream_names = (
+            [command.stream]
+            if command.stream is not None
+            else sorted(json.loads(settings.TargetOracle.table_partitioning or "{}"))
+        )
+        from flext_target_oracle._utilities.loader import FlextTargetOracleLoader
+
+        loader = FlextTargetOracleLoader(
+            settings.clone(
+                TargetOracle={
+                    "prometheus_port": 0,
+                    "prometheus_textfile": "",
+                    "profile_signal": "",
+                    "profile_on_start": False,
+                    "trace_export_file": "",
+                    "trace_export_endpoint": "",
+                }
+            )
+        )
+        dropped = 0
+        try:
+            for stream_name in stream_names:
+                purge_result = loader.purge_expired_partitions(stream_name)
+                if purge_result.failure:
+                    return r[str].fail(purge_result.error or "Partition purge failed")
+                dropped += purge_result.value
+        finally:
+            _ = loader.disconnect()
+        return r[str].ok(f"dropped {dropped} expired partitions")
+
     def run_validate(
         self, command: m.TargetOracle.OracleTargetValidateCommand
     ) -> p.Result[str]:
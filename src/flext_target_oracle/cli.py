@@ -1,13 +1,21 @@
-"""CLI orchestration for Oracle target."""
+"""CLI orchestration for Oracle target.
+
+``help`` and ``about`` are answered from package metadata alone; the target
+service, its models and the Oracle driver are imported by the commands that
+use them, so those two commands start without loading ``flext_db_oracle``.
+"""
 
 from __future__ import annotations
 
+import json
 import sys
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
+
+from flext_core import r, u
+from flext_target_oracle.__version__ import __description__, __title__
 
-from flext_cli import cli
-from flext_target_oracle import m, p, r, t, u
-from flext_target_oracle.api import FlextTargetOracleService
+if TYPE_CHECKING:
+    from flext_target_oracle import m, p, t
 
 
 class FlextTargetOracleCli:
@@ -33,6 +41,11 @@ class FlextTargetOracleCli:
         if not argv or argv[0] in {"help", "-h", "--help"}:
             return r[str].ok(self._get_help_text())
         command_name = argv[0]
+        if command_name == "about":
+            return r[str].ok(self._about_text())
+        from flext_target_oracle import m
+        from flext_target_oracle.api import FlextTargetOracleService
+
         # NOTE (multi-agent): mro-rn88 — CQRS: CLI composes the pure-data Command DTO and
         # hands it to the service handler; execution no longer lives on the model.
         service = FlextTargetOracleService.fetch_global()
@@ -40,13 +53,89 @@ class FlextTargetOracleCli:
             return service.run_validate(m.TargetOracle.OracleTargetValidateCommand())
         if command_name == "load":
             return service.run_load(m.TargetOracle.OracleTargetLoadCommand())
-        if command_name == "about":
-            return service.run_about(m.TargetOracle.OracleTargetAboutCommand())
+        if command_name == "generate":
+            command_result = self._generate_command(argv[1:])
+            if command_result.failure:
+                return r[str].fail(command_result.error or "Invalid generate options")
+            return service.run_generate(command_result.value)
+        if command_name == "purge":
+            purge_result = self._purge_command(argv[1:])
+            if purge_result.failure:
+                return r[str].fail(purge_result.error or "Invalid purge options")
+            return service.run_purge(purge_result.value)
         return r[str].fail(f"Unknown command: {command_name}")
 
+    @staticmethod
+    def _about_text() -> str:
+        """Return the JSON ``about`` payload the service's ``run_about`` builds."""
+        return json.dumps(
+            {"name": __title__, "description": __description__, "format": "json"},
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def _option_values(options: t.StrSequence) -> p.Result[t.StrMapping]:
+        """Return ``--option value`` pairs keyed by field name."""
+        if len(options) % 2 or not all(
+            option.startswith("--") for option in options[::2]
+        ):
+            return r[t.StrMapping].fail("options must be --name value pairs")
+        return r[t.StrMapping].ok({
+            option.removeprefix("--").replace("-", "_"): value
+            for option, value in zip(options[::2], options[1::2], strict=True)
+        })
+
+    @classmethod
+    def _generate_command(
+        cls,
+        options: t.StrSequence,
+    ) -> p.Result[m.TargetOracle.OracleTargetGenerateCommand]:
+        """Build a generate command from ``--option value`` pairs."""
+        from flext_target_oracle import c, m
+
+        values_result = cls._option_values(options)
+        if values_result.failure:
+            return r[m.TargetOracle.OracleTargetGenerateCommand].fail(
+                f"generate {values_result.error}"
+            )
+        try:
+            return r[m.TargetOracle.OracleTargetGenerateCommand].ok(
+                m.TargetOracle.OracleTargetGenerateCommand.model_validate_strings(
+                    values_result.value
+                )
+            )
+        except c.ValidationError as exc:
+            return r[m.TargetOracle.OracleTargetGenerateCommand].fail(
+                f"Invalid generate options: {exc}"
+            )
+
+    @classmethod
+    def _purge_command(
+        cls,
+        options: t.StrSequence,
+    ) -> p.Result[m.TargetOracle.OracleTargetPurgeCommand]:
+        """Build a purge command from ``--config-file`` and ``--stream`` pairs."""
+        from flext_target_oracle import c, m
+
+        values_result = cls._option_values(options)
+        if values_result.failure:
+            return r[m.TargetOracle.OracleTargetPurgeCommand].fail(
+                f"purge {values_result.error}"
+            )
+        try:
+            return r[m.TargetOracle.OracleTargetPurgeCommand].ok(
+                m.TargetOracle.OracleTargetPurgeCommand.model_validate_strings(
+                    values_result.value
+                )
+            )
+        except c.ValidationError as exc:
+            return r[m.TargetOracle.OracleTargetPurgeCommand].fail(
+                f"Invalid purge options: {exc}"
+            )
+
     def _get_help_text(self) -> str:
         """Return text help for target CLI usage."""
-        return "Usage: target-oracle [validate|load|about]\n  validate  validate settings and connection\n  load      initialize target for loading\n  about     show project information"
+        return "Usage: target-oracle [validate|load|about|generate|purge]\n  validate  validate settings and connection\n  load      initialize target for loading\n  about     show project information\n  generate  write a seeded synthetic Singer stream (--seed, --streams, --records, --columns, --string-length, --nested-objects, --array-length, --key-cardinality, --duplicate-rate, --clob-size, --state-every, --output-file)\n  purge     drop expired interval partitions (--config-file, --stream)"
 
 
 def main() -> int:
@@ -56,6 +145,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    from flext_cli import cli
+
     cli.exit(main())
 
 
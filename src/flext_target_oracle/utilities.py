@@ -7,10 +7,19 @@ from flext_meltano import u
 from flext_target_oracle._utilities.base import FlextTargetOracleUtilitiesBase
 from flext_target_oracle._utilities.client import FlextTargetOracle
 from flext_target_oracle._utilities.errors import FlextTargetOracleExceptions
+from flext_target_oracle._utilities.generator import FlextTargetOracleSingerGenerator
 from flext_target_oracle._utilities.loader import FlextTargetOracleLoader
+from flext_target_oracle._utilities.metrics import FlextTargetOracleMetrics
 from flext_target_oracle._utilities.observability import (
     FlextTargetOracleUtilitiesObservability,
 )
+from flext_target_oracle._utilities.profiling import FlextTargetOracleProfiler
+from flext_target_oracle._utilities.prometheus import (
+    FlextTargetOracleMetricsExporter,
+)
+from flext_target_oracle._utilities.quarantine import FlextTargetOracleQuarantine
+from flext_target_oracle._utilities.tracing import FlextTargetOracleSpanExporter
+from flext_target_oracle._utilities.validation import FlextTargetOracleRowValidator
 
 
 class FlextTargetOracleUtilities(u, FlextDbOracleUtilities):
@@ -28,6 +37,13 @@ __all__: list[str] = [
     "FlextTargetOracle",
     "FlextTargetOracleExceptions",
     "FlextTargetOracleLoader",
+    "FlextTargetOracleMetrics",
+    "FlextTargetOracleMetricsExporter",
+    "FlextTargetOracleProfiler",
+    "FlextTargetOracleQuarantine",
+    "FlextTargetOracleRowValidator",
+    "FlextTargetOracleSingerGenerator",
+    "FlextTargetOracleSpanExporter",
     "FlextTargetOracleUtilities",
     "u",
 ]
@@ -28,6 +28,21 @@ if TYPE_CHECKING:
         TestsFlextTargetOracleServiceBase as TestsFlextTargetOracleServiceBase,
         s as s,
     )
+    from tests.benchmarks.scaling import (
+        TestsFlextTargetOracleScalingSweep as TestsFlextTargetOracleScalingSweep,
+    )
+    from tests.benchmarks.test_loader_benchmarks import (
+        TestsFlextTargetOracleBenchmarks as TestsFlextTargetOracleBenchmarks,
+    )
+    from tests.benchmarks.test_memory import (
+        TestsFlextTargetOracleMemory as TestsFlextTargetOracleMemory,
+    )
+    from tests.benchmarks.test_scaling import (
+        TestsFlextTargetOracleScaling as TestsFlextTargetOracleScaling,
+    )
+    from tests.benchmarks.test_startup import (
+        TestsFlextTargetOracleStartup as TestsFlextTargetOracleStartup,
+    )
     from tests.constants import (
         TestsFlextTargetOracleConstants as TestsFlextTargetOracleConstants,
         c as c,
@@ -59,23 +74,44 @@ if TYPE_CHECKING:
     from tests.unit.test_config import (
         TestsFlextTargetOracleConfig as TestsFlextTargetOracleConfig,
     )
+    from tests.unit.test_generator import (
+        TestsFlextTargetOracleGenerator as TestsFlextTargetOracleGenerator,
+    )
     from tests.unit.test_loader import (
         TestsFlextTargetOracleLoader as TestsFlextTargetOracleLoader,
     )
+    from tests.unit.test_metrics import (
+        TestsFlextTargetOracleMetrics as TestsFlextTargetOracleMetrics,
+    )
     from tests.unit.test_module_governance import (
         TestsFlextTargetOracleModuleGovernance as TestsFlextTargetOracleModuleGovernance,
     )
+    from tests.unit.test_profiling import (
+        TestsFlextTargetOracleProfiler as TestsFlextTargetOracleProfiler,
+    )
+    from tests.unit.test_prometheus import (
+        TestsFlextTargetOracleMetricsExporter as TestsFlextTargetOracleMetricsExporter,
+    )
     from tests.unit.test_target import (
         TestsFlextTargetOracleTarget as TestsFlextTargetOracleTarget,
     )
+    from tests.unit.test_tracing import (
+        TestsFlextTargetOracleTracing as TestsFlextTargetOracleTracing,
+    )
     from tests.utilities import (
         TestsFlextTargetOracleUtilities as TestsFlextTargetOracleUtilities,
         u as u,
     )
 _LAZY_IMPORTS = merge_lazy_imports(
-    (".e2e", ".integration", ".performance", ".unit"),
+    (".benchmarks", ".e2e", ".integration", ".performance", ".unit"),
     build_lazy_import_map({
         ".base": ("TestsFlextTargetOracleServiceBase", "s"),
+        ".benchmarks": ("benchmarks",),
+        ".benchmarks.scaling": ("TestsFlextTargetOracleScalingSweep",),
+        ".benchmarks.test_loader_benchmarks": ("TestsFlextTargetOracleBenchmarks",),
+        ".benchmarks.test_memory": ("TestsFlextTargetOracleMemory",),
+        ".benchmarks.test_scaling": ("TestsFlextTargetOracleScaling",),
+        ".benchmarks.test_startup": ("TestsFlextTargetOracleStartup",),
         ".conftest": ("conftest",),
         ".constants": ("TestsFlextTargetOracleConstants", "c"),
         ".e2e": ("e2e",),
@@ -90,9 +126,14 @@ _LAZY_IMPORTS = merge_lazy_imports(
         ".typings": ("TestsFlextTargetOracleTypes", "t"),
         ".unit": ("unit",),
         ".unit.test_config": ("TestsFlextTargetOracleConfig",),
+        ".unit.test_generator": ("TestsFlextTargetOracleGenerator",),
         ".unit.test_loader": ("TestsFlextTargetOracleLoader",),
+        ".unit.test_metrics": ("TestsFlextTargetOracleMetrics",),
         ".unit.test_module_governance": ("TestsFlextTargetOracleModuleGovernance",),
+        ".unit.test_profiling": ("TestsFlextTargetOracleProfiler",),
+        ".unit.test_prometheus": ("TestsFlextTargetOracleMetricsExporter",),
         ".unit.test_target": ("TestsFlextTargetOracleTarget",),
+        ".unit.test_tracing": ("TestsFlextTargetOracleTracing",),
         ".utilities": ("TestsFlextTargetOracleUtilities", "u"),
         "flext_tests": ("d", "e", "h", "r", "td", "tf", "tk", "tm", "tv", "x"),
     }),
@@ -0,0 +1,35 @@
+# AUTO-GENERATED FILE — Regenerate with: make gen
+"""Benchmarks package."""
+
+from __future__ import annotations
+
+from flext_core.lazy import build_lazy_import_map, install_lazy_exports
+
+_LAZY_IMPORTS = build_lazy_import_map({
+    ".scaling": ("TestsFlextTargetOracleScalingSweep",),
+    ".test_loader_benchmarks": ("TestsFlextTargetOracleBenchmarks",),
+    ".test_memory": ("TestsFlextTargetOracleMemory",),
+    ".test_scaling": ("TestsFlextTargetOracleScaling",),
+    ".test_startup": ("TestsFlextTargetOracleStartup",),
+    "flext_tests": (
+        "c",
+        "d",
+        "e",
+        "h",
+        "m",
+        "p",
+        "r",
+        "s",
+        "t",
+        "td",
+        "tf",
+        "tk",
+        "tm",
+        "tv",
+        "u",
+        "x",
+    ),
+})
+
+
+install_lazy_exports(__name__, globals(), _LAZY_IMPORTS, publish_all=False)
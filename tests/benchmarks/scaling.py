@@ -0,0 +1,322 @@
+"""Scaling sweep over records, column width, streams, batch size and load method.
+
+Every scenario runs in a fresh interpreter so peak RSS belongs to that scenario
+alone. Messages come from the seeded Singer generator and are loaded through
+``FlextTargetOracle.process_singer_messages``::
+
+    python -m tests.benchmarks.scaling --records 10000,100000 --columns 8,64 \\
+        --streams 1,4 --batch-sizes 1000,10000 --load-methods INSERT,BULK_INSERT \\
+        --output .benchmarks/scaling.json --baseline .benchmarks/scaling-base.json
+
+``--backend oracle`` loads into the database named by the ``TEST_ORACLE_*``
+variables instead of the recording double. The exit status is 1 when a
+scenario's rows/s falls more than ``--tolerance`` below its baseline.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import ClassVar
+
+from flext_db_oracle import FlextDbOracleApi, FlextDbOracleSettings
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleSingerGenerator,
+)
+from tests import c, m, t, u
+
+
+class TestsFlextTargetOracleScalingSweep:
+    """Run, compare and summarize the scaling grid."""
+
+    DEFAULT_OPTIONS: ClassVar[t.StrMapping] = {
+        "records": "10000",
+        "columns": "8",
+        "streams": "1",
+        "batch_sizes": "1000",
+        "load_methods": c.TargetOracle.LOAD_METHOD_INSERT,
+        "backend": "fake",
+        "output": ".benchmarks/scaling.json",
+        "baseline": "",
+        "tolerance": "0.10",
+    }
+    MESSAGE_MODELS: ClassVar[
+        t.MappingKV[
+            str,
+            type[
+                m.Meltano.SingerSchemaMessage
+                | m.Meltano.SingerRecordMessage
+                | m.Meltano.SingerStateMessage
+            ],
+        ]
+    ] = {
+        "SCHEMA": m.Meltano.SingerSchemaMessage,
+        "RECORD": m.Meltano.SingerRecordMessage,
+        "STATE": m.Meltano.SingerStateMessage,
+    }
+    SUMMARY_HEADER: ClassVar[tuple[str, ...]] = (
+        "scenario",
+        "rows/s",
+        "peak RSS MB",
+        "p99 flush ms",
+        "baseline rows/s",
+        "",
+    )
+
+    @classmethod
+    def scenarios(
+        cls, options: t.StrMapping
+    ) -> list[m.TargetOracle.Tests.ScalingScenario]:
+        """Expand comma-separated option lists into the scenario grid."""
+        return [
+            m.TargetOracle.Tests.ScalingScenario(
+                records=int(records),
+                columns=int(columns),
+                streams=int(streams),
+                batch_size=int(batch_size),
+                load_method=load_method.upper(),
+            )
+            for records, columns, streams, batch_size, load_method in itertools.product(
+                *(
+                    options[name].split(",")
+                    for name in (
+                        "records",
+                        "columns",
+                        "streams",
+                        "batch_sizes",
+                        "load_methods",
+                    )
+                )
+            )
+        ]
+
+    @staticmethod
+    def settings(
+        scenario: m.TargetOracle.Tests.ScalingScenario, index: int
+    ) -> FlextTargetOracleSettings:
+        """Target settings for one scenario; each writes its own tables."""
+        return FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": os.getenv(
+                    "TEST_ORACLE_HOST", c.TargetOracle.Tests.ORACLE_HOST
+                ),
+                "oracle_port": int(
+                    os.getenv(
+                        "TEST_ORACLE_PORT", str(c.TargetOracle.Tests.ORACLE_PORT)
+                    )
+                ),
+                "oracle_service_name": os.getenv(
+                    "TEST_ORACLE_SERVICE", c.TargetOracle.Tests.ORACLE_SERVICE
+                ),
+                "oracle_user": os.getenv(
+                    "TEST_ORACLE_USER", c.TargetOracle.Tests.TEST_SCHEMA
+                ),
+                "oracle_password": os.getenv("TEST_ORACLE_PASSWORD", ""),
+                "default_target_schema": c.TargetOracle.Tests.TEST_SCHEMA,
+                "batch_size": scenario.batch_size,
+                "load_method": scenario.load_method,
+                "use_bulk_operations": scenario.load_method.startswith("BULK"),
+                "table_prefix": f"SC{index:03d}_",
+                "truncate_before_load": True,
+            }
+        })
+
+    @classmethod
+    def measure(
+        cls,
+        scenario: m.TargetOracle.Tests.ScalingScenario,
+        backend: str,
+        index: int,
+    ) -> m.TargetOracle.Tests.ScalingResult:
+        """Load one scenario in this process and measure it."""
+        settings = cls.settings(scenario, index)
+        oracle_api = (
+            u.TargetOracle.Tests.RecordingOracleApi(settings)
+            if backend == "fake"
+            else FlextDbOracleApi(
+                FlextDbOracleSettings.model_validate({
+                    "DbOracle": {
+                        "host": settings.TargetOracle.oracle_host,
+                        "port": settings.TargetOracle.oracle_port,
+                        "service_name": settings.TargetOracle.oracle_service_name,
+                        "username": settings.TargetOracle.oracle_user,
+                        "password": settings.TargetOracle.oracle_password,
+                    }
+                })
+            )
+        )
+        generator = FlextTargetOracleSingerGenerator(
+            m.TargetOracle.OracleTargetGenerateCommand(
+                seed=c.TargetOracle.Tests.BENCHMARK_SEED,
+                streams=scenario.streams,
+                records=max(1, scenario.records // scenario.streams),
+                columns=scenario.columns,
+            )
+        )
+        messages = [
+            cls.MESSAGE_MODELS[payload["type"]].model_validate(payload)
+            for payload in map(json.loads, generator.lines())
+        ]
+        timer = u.TargetOracle.Tests.FlushTimer(oracle_api)
+        target = FlextTargetOracle(settings, oracle_api=timer)
+        started = time.perf_counter()
+        summary_result = target.process_singer_messages(messages)
+        elapsed = time.perf_counter() - started
+        if summary_result.failure:
+            msg = f"{scenario.key} failed: {summary_result.error}"
+            raise RuntimeError(msg)
+        flushes = timer.flush_seconds
+        loaded = sum(
+            isinstance(message, m.Meltano.SingerRecordMessage) for message in messages
+        )
+        return m.TargetOracle.Tests.ScalingResult(
+            scenario=scenario,
+            backend=backend,
+            elapsed_seconds=elapsed,
+            rows_per_second=loaded / elapsed if elapsed else 0.0,
+            # Linux reports ru_maxrss in KiB.
+            peak_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            flushes=len(flushes),
+            flush_p99_ms=1000
+            * (
+                statistics.quantiles(flushes, n=100, method="inclusive")[98]
+                if len(flushes) > 1
+                else sum(flushes)
+            ),
+        )
+
+    @classmethod
+    def run_isolated(
+        cls,
+        scenario: m.TargetOracle.Tests.ScalingScenario,
+        backend: str,
+        index: int,
+    ) -> m.TargetOracle.Tests.ScalingResult:
+        """Measure one scenario in a child interpreter."""
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tests.benchmarks.scaling",
+                "--scenario",
+                scenario.model_dump_json(),
+                "--backend",
+                backend,
+                "--index",
+                str(index),
+            ],
+            capture_output=True,
+            check=False,
+            cwd=Path(__file__).resolve().parents[2],
+            text=True,
+        )
+        if completed.returncode:
+            msg = f"{scenario.key} exited {completed.returncode}: {completed.stderr}"
+            raise RuntimeError(msg)
+        return m.TargetOracle.Tests.ScalingResult.model_validate_json(
+            completed.stdout.strip().splitlines()[-1]
+        )
+
+    @staticmethod
+    def compare(
+        results: t.SequenceOf[m.TargetOracle.Tests.ScalingResult],
+        baseline_path: str,
+        tolerance: float,
+    ) -> list[m.TargetOracle.Tests.ScalingResult]:
+        """Attach baseline throughput and flag scenarios that fell behind it."""
+        if not baseline_path or not Path(baseline_path).exists():
+            return list(results)
+        baseline = {
+            result.scenario.key: result.rows_per_second
+            for result in map(
+                m.TargetOracle.Tests.ScalingResult.model_validate,
+                json.loads(Path(baseline_path).read_text(encoding="utf-8")),
+            )
+        }
+        return [
+            result.model_copy(
+                update={
+                    "baseline_rows_per_second": baseline.get(result.scenario.key),
+                    "regression": result.scenario.key in baseline
+                    and result.rows_per_second
+                    < baseline[result.scenario.key] * (1 - tolerance),
+                }
+            )
+            for result in results
+        ]
+
+    @classmethod
+    def summary(cls, results: t.SequenceOf[m.TargetOracle.Tests.ScalingResult]) -> str:
+        """Render the results as an aligned plain-text table."""
+        rows = [
+            cls.SUMMARY_HEADER,
+            *(
+                (
+                    result.scenario.key,
+                    f"{result.rows_per_second:,.0f}",
+                    f"{result.peak_rss_mb:,.1f}",
+                    f"{result.flush_p99_ms:,.2f}",
+                    f"{result.baseline_rows_per_second:,.0f}"
+                    if result.baseline_rows_per_second is not None
+                    else "-",
+                    "REGRESSION" if result.regression else "",
+                )
+                for result in results
+            ),
+        ]
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True))
+            .rstrip()
+            for row in rows
+        )
+
+    @classmethod
+    def main(cls, argv: t.StrSequence) -> int:
+        """Run the sweep, or a single ``--scenario`` when called as a child."""
+        options = {
+            **cls.DEFAULT_OPTIONS,
+            **{
+                option.removeprefix("--").replace("-", "_"): value
+                for option, value in zip(argv[::2], argv[1::2], strict=False)
+            },
+        }
+        if "scenario" in options:
+            result = cls.measure(
+                m.TargetOracle.Tests.ScalingScenario.model_validate_json(
+                    options["scenario"]
+                ),
+                options["backend"],
+                int(options.get("index", "0")),
+            )
+            sys.stdout.write(result.model_dump_json() + "\n")
+            return 0
+        results = cls.compare(
+            [
+                cls.run_isolated(scenario, options["backend"], index)
+                for index, scenario in enumerate(cls.scenarios(options))
+            ],
+            options["baseline"],
+            float(options["tolerance"]),
+        )
+        output = Path(options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps([result.model_dump(mode="json") for result in results], indent=2),
+            encoding="utf-8",
+        )
+        sys.stdout.write(cls.summary(results) + "\n")
+        return 1 if any(result.regression for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(TestsFlextTargetOracleScalingSweep.main(sys.argv[1:]))
@@ -0,0 +1,224 @@
+"""Offline load-path benchmarks against the recording Oracle API double.
+
+Run with ``pytest tests/benchmarks --benchmark-enable --benchmark-autosave`` and
+compare against earlier runs with ``--benchmark-compare``; records come from the
+seeded Singer generator so runs are comparable across machines and commits.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleMetrics,
+    FlextTargetOracleSingerGenerator,
+)
+from flext_tests import tm
+from tests import c, m, u
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from tests import t
+
+_STREAM = f"{c.TargetOracle.GENERATOR_STREAM_PREFIX}_00"
+_RECORDS = c.TargetOracle.Tests.BENCHMARK_RECORDS
+_BATCH_SIZE = c.TargetOracle.Tests.BENCHMARK_BATCH_SIZE
+
+
+@pytest.fixture
+def benchmark_config() -> FlextTargetOracleSettings:
+    """Offline settings whose batch size never flushes while buffering."""
+    return FlextTargetOracleSettings.model_validate({
+        "TargetOracle": {
+            "oracle_host": "localhost",
+            "oracle_port": 1521,
+            "oracle_service_name": "XE",
+            "oracle_user": "bench_user",
+            "oracle_password": "bench_password",
+            "default_target_schema": "BENCH",
+            "batch_size": _RECORDS + 1,
+            "use_bulk_operations": True,
+        }
+    })
+
+
+@pytest.fixture(scope="module")
+def generator() -> FlextTargetOracleSingerGenerator:
+    """Seeded single-stream generator shaped like a wide operational table."""
+    return FlextTargetOracleSingerGenerator(
+        m.TargetOracle.OracleTargetGenerateCommand(
+            seed=c.TargetOracle.Tests.BENCHMARK_SEED, records=_RECORDS
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def record_lines(generator: FlextTargetOracleSingerGenerator) -> t.SequenceOf[str]:
+    """Deterministic Singer RECORD lines (the leading SCHEMA line dropped)."""
+    return list(generator.lines())[1:]
+
+
+class TestsFlextTargetOracleBenchmarks:
+    """Parse, buffer, bind-build and flush costs without a database."""
+
+    @staticmethod
+    def _target(
+        settings: FlextTargetOracleSettings,
+        oracle_api: u.TargetOracle.Tests.RecordingOracleApi,
+    ) -> FlextTargetOracle:
+        target = FlextTargetOracle(settings, oracle_api=oracle_api)
+        schema = FlextTargetOracleSingerGenerator(
+            m.TargetOracle.OracleTargetGenerateCommand()
+        ).schema_message(_STREAM)
+        tm.ok(
+            target.process_singer_message(
+                m.Meltano.SingerSchemaMessage.model_validate(schema)
+            )
+        )
+        oracle_api.reset()
+        return target
+
+    @staticmethod
+    def _records(record_lines: t.SequenceOf[str]) -> list[t.JsonMapping]:
+        return [
+            m.Meltano.SingerRecordMessage.model_validate_json(line).record
+            for line in record_lines
+        ]
+
+    def test_parse_record_lines(
+        self, benchmark: BenchmarkFixture, record_lines: t.SequenceOf[str]
+    ) -> None:
+        """Singer line parsing into record messages."""
+        messages = benchmark(self._records, record_lines)
+        tm.that(len(messages), eq=_RECORDS)
+
+    def test_buffer_records(
+        self,
+        benchmark: BenchmarkFixture,
+        benchmark_config: FlextTargetOracleSettings,
+        record_lines: t.SequenceOf[str],
+    ) -> None:
+        """Record validation, copy and buffering with no flush."""
+        records = self._records(record_lines)
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(benchmark_config)
+
+        def setup() -> tuple[tuple[FlextTargetOracle], dict[str, object]]:
+            return (self._target(benchmark_config, oracle_api),), {}
+
+        def buffer_all(target: FlextTargetOracle) -> FlextTargetOracle:
+            for record in records:
+                tm.ok(target.loader.load_record(_STREAM, record))
+            return target
+
+        target = benchmark.pedantic(buffer_all, setup=setup, rounds=5)
+        tm.that(len(target.loader.record_buffers[_STREAM]), eq=_RECORDS)
+        tm.that(oracle_api.rows_written, eq=0)
+
+    def test_build_column_binds(
+        self,
+        benchmark: BenchmarkFixture,
+        benchmark_config: FlextTargetOracleSettings,
+        record_lines: t.SequenceOf[str],
+    ) -> None:
+        """Column-wise bind construction for one columnar batch."""
+        records = self._records(record_lines)
+        columns = {
+            name: [record.get(name) for record in records]
+            for name in records[0]
+        }
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(benchmark_config)
+        target = self._target(benchmark_config, oracle_api)
+
+        def load() -> int:
+            oracle_api.reset()
+            return tm.ok(target.loader.load_columns(_STREAM, columns))
+
+        tm.that(benchmark(load), eq=_RECORDS)
+        tm.that(oracle_api.rows_written, eq=_RECORDS)
+
+    def test_flush_buffered_records(
+        self,
+        benchmark: BenchmarkFixture,
+        benchmark_config: FlextTargetOracleSettings,
+        record_lines: t.SequenceOf[str],
+    ) -> None:
+        """Bind-row build, SQL rendering and array DML for a full buffer."""
+        records = self._records(record_lines)
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(benchmark_config)
+
+        def setup() -> tuple[tuple[FlextTargetOracle], dict[str, object]]:
+            target = self._target(benchmark_config, oracle_api)
+            for record in records:
+                tm.ok(target.loader.load_record(_STREAM, record))
+            return (target,), {}
+
+        def flush(target: FlextTargetOracle) -> m.TargetOracle.LoaderFinalizeResult:
+            return tm.ok(target.finalize())
+
+        result = benchmark.pedantic(flush, setup=setup, rounds=5)
+        tm.that(result.stream_statistics[0].successful_records, eq=_RECORDS)
+        tm.that(oracle_api.rows_written, eq=_RECORDS)
+
+    @pytest.mark.parametrize("call_latency", [0.0, 0.002])
+    def test_write_record_lines_end_to_end(
+        self,
+        benchmark: BenchmarkFixture,
+        benchmark_config: FlextTargetOracleSettings,
+        record_lines: t.SequenceOf[str],
+        call_latency: float,
+    ) -> None:
+        """Full line-to-DML path with batched flushes and injected latency."""
+        settings = benchmark_config.clone(TargetOracle={"batch_size": _BATCH_SIZE})
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(
+            settings, call_latency=call_latency
+        )
+
+        def setup() -> tuple[tuple[FlextTargetOracle], dict[str, object]]:
+            return (self._target(settings, oracle_api),), {}
+
+        def run(target: FlextTargetOracle) -> None:
+            for line in record_lines:
+                tm.ok(target.write_record(line))
+            tm.ok(target.finalize())
+
+        benchmark.pedantic(run, setup=setup, rounds=3)
+        tm.that(oracle_api.rows_written, eq=_RECORDS)
+        tm.that(
+            len(oracle_api.statements("execute_many")), eq=_RECORDS // _BATCH_SIZE
+        )
+
+    def test_metrics_overhead_below_two_percent(
+        self,
+        benchmark_config: FlextTargetOracleSettings,
+        record_lines: t.SequenceOf[str],
+    ) -> None:
+        """Per-record metric recording costs under 2% of the write loop."""
+        settings = benchmark_config.clone(TargetOracle={"batch_size": _BATCH_SIZE})
+        target = self._target(
+            settings, u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+        started = time.perf_counter_ns()
+        for line in record_lines:
+            tm.ok(target.write_record(line))
+        tm.ok(target.finalize())
+        loop_ns = time.perf_counter_ns() - started
+        metrics = FlextTargetOracleMetrics()
+        started = time.perf_counter_ns()
+        for line in record_lines:
+            parse_started = time.perf_counter_ns()
+            metrics.increment(_STREAM, "bytes_in", len(line))
+            metrics.accumulate(
+                c.TargetOracle.METRIC_PHASE_PARSE,
+                _STREAM,
+                time.perf_counter_ns() - parse_started,
+            )
+            metrics.increment(_STREAM, "rows_in")
+        metrics_ns = time.perf_counter_ns() - started
+        tm.that(target.metrics.counters(_STREAM)["rows_in"], eq=_RECORDS)
+        assert metrics_ns < loop_ns * 0.02
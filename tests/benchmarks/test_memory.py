@@ -0,0 +1,122 @@
+"""Memory regression checks for buffered records, measured with tracemalloc.
+
+Each shape buffers ``MEMORY_ROWS`` records through ``write_record`` so every
+buffered row owns freshly parsed values, exactly as on a real Singer stream.
+The peak traced growth per row must stay under the shape's budget, and
+finalizing must hand the buffer back. Raise a budget only together with the
+change that justifies it.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleSingerGenerator,
+)
+from flext_tests import tm
+from tests import c, m, u
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_ROWS = c.TargetOracle.Tests.MEMORY_ROWS
+_STREAM = f"{c.TargetOracle.GENERATOR_STREAM_PREFIX}_00"
+
+
+@pytest.fixture
+def traced() -> Iterator[None]:
+    """Trace allocations for one test, leaving an outer tracer untouched."""
+    owns_tracer = not tracemalloc.is_tracing()
+    if owns_tracer:
+        tracemalloc.start()
+    yield
+    if owns_tracer:
+        tracemalloc.stop()
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(c.TargetOracle.Tests.MEMORY_TIMEOUT_SECONDS)
+@pytest.mark.usefixtures("traced")
+class TestsFlextTargetOracleMemory:
+    """Per-row buffer cost and release after finalize."""
+
+    @staticmethod
+    def _target(shape: str) -> tuple[FlextTargetOracle, list[str]]:
+        """Return a warmed-up target and the distinct RECORD lines for ``shape``."""
+        settings = FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": "localhost",
+                "oracle_port": 1521,
+                "oracle_service_name": "XE",
+                "oracle_user": "memory_user",
+                "oracle_password": "memory_password",
+                "default_target_schema": "MEMORY",
+                "batch_size": _ROWS + 1,
+            }
+        })
+        target = FlextTargetOracle(
+            settings, oracle_api=u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+        schema_line, *record_lines = FlextTargetOracleSingerGenerator(
+            m.TargetOracle.OracleTargetGenerateCommand(
+                seed=c.TargetOracle.Tests.BENCHMARK_SEED,
+                records=c.TargetOracle.Tests.MEMORY_DISTINCT_LINES,
+                **c.TargetOracle.Tests.MEMORY_SHAPES[shape],
+            )
+        ).lines()
+        tm.ok(
+            target.process_singer_message(
+                m.Meltano.SingerSchemaMessage.model_validate(json.loads(schema_line))
+            )
+        )
+        # One full load first, so one-time caches and metric buckets are not
+        # charged to the measured rows.
+        for line in record_lines:
+            tm.ok(target.write_record(line))
+        tm.ok(target.finalize())
+        return target, record_lines
+
+    @staticmethod
+    def _buffer(target: FlextTargetOracle, record_lines: list[str]) -> None:
+        """Buffer ``_ROWS`` records by cycling the distinct lines."""
+        for line in itertools.islice(itertools.cycle(record_lines), _ROWS):
+            tm.ok(target.write_record(line))
+
+    @pytest.mark.parametrize("shape", sorted(c.TargetOracle.Tests.MEMORY_SHAPES))
+    def test_peak_bytes_per_buffered_row(self, shape: str) -> None:
+        """Buffering stays within the shape's per-row budget."""
+        target, record_lines = self._target(shape)
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._buffer(target, record_lines)
+        _, peak = tracemalloc.get_traced_memory()
+        tm.that(len(target.loader.record_buffers[_STREAM]), eq=_ROWS)
+        per_row = (peak - baseline) / _ROWS
+        budget = c.TargetOracle.Tests.MEMORY_ROW_BUDGET_BYTES[shape]
+        assert per_row <= budget, (
+            f"{shape}: {per_row:.0f} bytes per buffered row exceeds {budget}"
+        )
+
+    @pytest.mark.parametrize("shape", sorted(c.TargetOracle.Tests.MEMORY_SHAPES))
+    def test_finalize_releases_buffered_rows(self, shape: str) -> None:
+        """After the final flush only a bounded residue stays allocated."""
+        target, record_lines = self._target(shape)
+        baseline, _ = tracemalloc.get_traced_memory()
+        self._buffer(target, record_lines)
+        buffered, _ = tracemalloc.get_traced_memory()
+        tm.ok(target.finalize())
+        released, _ = tracemalloc.get_traced_memory()
+        tm.that(target.loader.buffer_depths(), eq={_STREAM: 0})
+        assert buffered - baseline > _ROWS * 100
+        residue = released - baseline
+        assert residue <= c.TargetOracle.Tests.MEMORY_RESIDUAL_BYTES, (
+            f"{shape}: {residue} bytes still allocated after finalize"
+        )
@@ -0,0 +1,63 @@
+"""Smoke test for the scaling sweep runner on a one-scenario grid."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from flext_tests import tm
+from tests import m
+from tests.benchmarks.scaling import TestsFlextTargetOracleScalingSweep
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextTargetOracleScaling:
+    """Behavior contract for the scaling sweep runner."""
+
+    def test_sweep_writes_results_and_flags_regressions(self, tmp_path: Path) -> None:
+        """A child run is measured, saved and compared with the baseline."""
+        scenario = m.TargetOracle.Tests.ScalingScenario(
+            records=200, columns=4, streams=2, batch_size=50, load_method="INSERT"
+        )
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            json.dumps([
+                m.TargetOracle.Tests.ScalingResult(
+                    scenario=scenario,
+                    backend="fake",
+                    elapsed_seconds=0.0,
+                    rows_per_second=1e12,
+                    peak_rss_mb=0.0,
+                    flushes=0,
+                    flush_p99_ms=0.0,
+                ).model_dump(mode="json")
+            ]),
+            encoding="utf-8",
+        )
+        output = tmp_path / "scaling.json"
+        exit_code = TestsFlextTargetOracleScalingSweep.main([
+            "--records",
+            "200",
+            "--columns",
+            "4",
+            "--streams",
+            "2",
+            "--batch-sizes",
+            "50",
+            "--output",
+            str(output),
+            "--baseline",
+            str(baseline),
+        ])
+        tm.that(exit_code, eq=1)
+        (result,) = [
+            m.TargetOracle.Tests.ScalingResult.model_validate(payload)
+            for payload in json.loads(output.read_text(encoding="utf-8"))
+        ]
+        tm.that(result.scenario.key, eq=scenario.key)
+        tm.that(result.flushes, eq=4)
+        tm.that(result.regression, eq=True)
+        assert result.rows_per_second > 0
+        assert result.peak_rss_mb > 0
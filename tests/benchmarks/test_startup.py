@@ -0,0 +1,107 @@
+"""Cold-start budget for the ``target-oracle`` console script.
+
+Each command runs in a fresh interpreter under ``python -X importtime``, the
+way the console script calls ``main``. The report is parsed per module, so a
+failure names the import that broke the budget. The budget is a margin over
+a baseline measured the same way on the same machine (importing
+``flext_core``, which the CLI needs anyway), so a slow runner does not fail it.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from flext_target_oracle.api import FlextTargetOracleService
+from flext_target_oracle.cli import FlextTargetOracleCli
+from flext_tests import tm
+from tests import c, m
+
+_ENTRYPOINT = "import sys; from flext_target_oracle.cli import main; sys.exit(main())"
+_BASELINE = "import flext_core"
+
+
+class TestsFlextTargetOracleStartup:
+    """Import cost of the CLI commands that must not touch Oracle."""
+
+    @staticmethod
+    def _import_times(
+        command: str, program: str = _ENTRYPOINT
+    ) -> tuple[int, dict[str, int]]:
+        """Return the exit code and cumulative import microseconds per module.
+
+        Nested imports keep their indentation, so top-level modules are the
+        keys without leading spaces.
+        """
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", program, command],
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+        times: dict[str, int] = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, module = line.removeprefix("import time:").split("|")
+            if cumulative.strip().isdigit():
+                times[module[1:].rstrip()] = int(cumulative)
+        return completed.returncode, times
+
+    @staticmethod
+    def _total_ms(times: dict[str, int]) -> float:
+        """Return the summed cumulative time of the top-level imports."""
+        return (
+            sum(
+                microseconds
+                for module, microseconds in times.items()
+                if not module.startswith(" ")
+            )
+            / 1000
+        )
+
+    @pytest.mark.parametrize("command", ["help", "--help", "about"])
+    def test_help_skips_oracle_imports(self, command: str) -> None:
+        """``help`` and ``about`` load no driver and stay within budget."""
+        _ = self._import_times(command)
+        exit_code, times = self._import_times(command)
+        tm.that(exit_code, eq=0)
+        loaded = {module.strip().split(".", 1)[0] for module in times}
+        tm.that(loaded & c.TargetOracle.Tests.STARTUP_DEFERRED_MODULES, eq=set())
+        _, baseline_times = self._import_times("", _BASELINE)
+        total_ms = self._total_ms(times)
+        budget_ms = (
+            self._total_ms(baseline_times)
+            + c.TargetOracle.Tests.STARTUP_IMPORT_MARGIN_MS
+        )
+        assert total_ms <= budget_ms, (
+            f"{command}: imports took {total_ms:.0f} ms, budget {budget_ms:.0f} ms; "
+            + ", ".join(
+                f"{module.strip()}={microseconds // 1000}ms"
+                for module, microseconds in sorted(
+                    times.items(), key=lambda item: -item[1]
+                )[:5]
+            )
+        )
+
+    @pytest.mark.parametrize("command", ["validate", "purge"])
+    def test_service_commands_load_the_service(self, command: str) -> None:
+        """The Oracle commands import the service on demand."""
+        _, times = self._import_times(command)
+        assert "flext_target_oracle.api" in {module.strip() for module in times}
+
+    def test_about_matches_the_service_payload(self) -> None:
+        """``about`` answers with the payload of the service's ``run_about``."""
+        about = json.loads(tm.ok(FlextTargetOracleCli().run_cli(["about"])))
+        service_about = json.loads(
+            tm.ok(
+                FlextTargetOracleService.fetch_global().run_about(
+                    m.TargetOracle.OracleTargetAboutCommand()
+                )
+            )
+        )
+        tm.that(about, eq=service_about)
+        tm.that(about["name"], eq="flext-target-oracle")
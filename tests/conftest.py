@@ -354,6 +354,7 @@ _PATH_MARKERS: t.MappingKV[str, t.StrSequence] = {
     "integration": ("integration", "oracle"),
     "e2e": ("e2e", "oracle", "slow"),
     "performance": ("performance", "oracle"),
+    "benchmarks": ("performance",),
 }
 
 
@@ -28,6 +28,31 @@ class TestsFlextTargetOracleConstants(FlextTargetOracleConstants, FlextTestsCons
             PROJECT_ROOT_PARENT_DEPTH: Final[int] = 1
             SRC_DIR: Final[str] = "src"
             PACKAGE_DIR: Final[str] = "flext_target_oracle"
+            BENCHMARK_SEED: Final[int] = 20260101
+            BENCHMARK_RECORDS: Final[int] = 10_000
+            BENCHMARK_BATCH_SIZE: Final[int] = 1_000
+            MEMORY_ROWS: Final[int] = 100_000
+            MEMORY_DISTINCT_LINES: Final[int] = 1_000
+            MEMORY_TIMEOUT_SECONDS: Final[int] = 300
+            MEMORY_SHAPES: Final[dict[str, dict[str, int]]] = {
+                "narrow": {"columns": 4},
+                "wide": {"columns": 48},
+                "json_heavy": {"columns": 4, "nested_objects": 8, "array_length": 32},
+            }
+            MEMORY_ROW_BUDGET_BYTES: Final[dict[str, int]] = {
+                "narrow": 1_024,
+                "wide": 8_192,
+                "json_heavy": 8_192,
+            }
+            MEMORY_RESIDUAL_BYTES: Final[int] = 1_048_576
+            STARTUP_IMPORT_MARGIN_MS: Final[float] = 500.0
+            STARTUP_DEFERRED_MODULES: Final[frozenset[str]] = frozenset({
+                "flext_cli",
+                "flext_db_oracle",
+                "flext_meltano",
+                "oracledb",
+                "sqlalchemy",
+            })
             ALLOWED_MODULE_FUNCTIONS: Final[dict[str, frozenset[str]]] = {
                 "_utilities/cli.py": frozenset({"main"})
             }
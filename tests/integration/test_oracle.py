@@ -21,6 +21,8 @@ from flext_tests import tm
 from tests import c, m, p, t
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from flext_db_oracle import FlextDbOracleApi
     from flext_target_oracle import FlextTargetOracleSettings
 
@@ -129,6 +131,57 @@ class TestsFlextTargetOracleOracle:
             eq={"id": "2", "name": "Jane Smith", "email": "jane@example.com"},
         )
 
+    @pytest.mark.usefixtures("clean_database")
+    def test_batch_error_quarantines_rejected_rows(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+        tmp_path: Path,
+    ) -> None:
+        """Quarantine mode should load clean rows and capture rejected ones."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "batch_size": 10,
+                "on_batch_error": "quarantine",
+                "quarantine_dir": str(tmp_path),
+                "preflight_validation": False,
+            }
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_quarantine"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [
+                    {"id": 1, "name": "John Doe", "email": "john@example.com"},
+                    {"id": None, "name": "No Key", "email": "nokey@example.com"},
+                    {"id": 3, "name": "Jane Smith", "email": "jane@example.com"},
+                    {"id": 4, "name": "Ann Lee", "email": "ann@example.com"},
+                    {"id": 5, "name": "Bo Chen", "email": "bo@example.com"},
+                    {"id": None, "name": "Also None", "email": "none@example.com"},
+                ],
+            )
+        )
+        row_count = _query_scalar(
+            oracle_engine, 'SELECT COUNT(*) AS "count" FROM test_quarantine', "count"
+        )
+        tm.that(int(row_count), eq=4)
+        quarantined = [
+            m.TargetOracle.RejectedRow.model_validate_json(line)
+            for line in loader.quarantine.quarantine_path(stream_name)
+            .read_text(encoding="utf-8")
+            .splitlines()
+        ]
+        tm.that([row.batch_offset for row in quarantined], eq=[1, 5])
+        tm.that({row.error_code for row in quarantined}, eq={"ORA-01400"})
+        finalize_result = tm.ok(loader.finalize_all_streams())
+        tm.that(finalize_result.stream_statistics[0].rejected_records, eq=2)
+        tm.ok(loader.disconnect())
+
     @pytest.mark.usefixtures("clean_database")
     def test_merge_mode_updates(
         self,
@@ -165,6 +218,297 @@ class TestsFlextTargetOracleOracle:
         disconnect_result = loader.disconnect()
         tm.ok(disconnect_result)
 
+    @pytest.mark.usefixtures("clean_database")
+    def test_key_sorted_merge_batches(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Key-sorted flushes should merge out-of-order records unchanged."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "sdc_mode": "merge",
+                "sort_batches_by_key": True,
+                "batch_size": 10,
+            }
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_sorted_merge"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [
+                    {"id": record_id, "name": f"User {record_id}", "email": None}
+                    for record_id in (30, 4, 17, 1, 250)
+                ],
+            )
+        )
+        rows = _query_rows(
+            oracle_engine,
+            'SELECT id AS "id", name AS "name" FROM test_sorted_merge ORDER BY id',
+        )
+        tm.that(
+            [row.root["name"] for row in rows],
+            eq=["User 1", "User 4", "User 17", "User 30", "User 250"],
+        )
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_sparse_bind_groups_insert_by_signature(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Sparse records should load through narrower per-signature inserts."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={"sparse_bind_groups": 1, "batch_size": 10}
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_sparse_binds"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [
+                    {"id": 1},
+                    {"id": 2, "name": "Jane Smith"},
+                    {"id": 3},
+                    {"id": 4, "email": "ann@example.com"},
+                ],
+            )
+        )
+        rows = _query_rows(
+            oracle_engine,
+            'SELECT id AS "id", name AS "name", email AS "email" FROM test_sparse_binds ORDER BY id',
+        )
+        tm.that(len(rows), eq=4)
+        tm.that(rows[1].root["name"], eq="Jane Smith")
+        tm.that(rows[3].root["email"], eq="ann@example.com")
+        tm.that(rows[0].root["name"], none=True)
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_activate_version_swaps_shadow_table(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """A full-table version should replace the live table only when complete."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={"full_table_swap": True, "truncate_empty_versions": True}
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_swap"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [{"id": 1, "name": "Stale Row", "email": "stale@example.com"}],
+            )
+        )
+        count_sql = 'SELECT COUNT(*) AS "count" FROM test_swap'
+        tm.ok(loader.activate_version(stream_name, 2))
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [
+                    {"id": 2, "name": "Jane Smith", "email": "jane@example.com"},
+                    {"id": 3, "name": "Ann Lee", "email": "ann@example.com"},
+                ],
+                version=2,
+            )
+        )
+        tm.that(int(_query_scalar(oracle_engine, count_sql, "count")), eq=1)
+        tm.ok(loader.activate_version(stream_name, 2))
+        names = [
+            row.root["name"]
+            for row in _query_rows(
+                oracle_engine, 'SELECT name AS "name" FROM test_swap ORDER BY id'
+            )
+        ]
+        tm.that(names, eq=["Jane Smith", "Ann Lee"])
+        primary_keys = _query_scalar(
+            oracle_engine,
+            "SELECT COUNT(*) AS \"count\" FROM user_constraints "
+            "WHERE table_name = 'TEST_SWAP' AND constraint_type = 'P'",
+            "count",
+        )
+        tm.that(int(primary_keys), eq=1)
+        live_indexes = _query_scalar(
+            oracle_engine,
+            "SELECT COUNT(*) AS \"count\" FROM user_indexes "
+            "WHERE table_name = 'TEST_SWAP' AND index_name = 'TEST_SWAP_PK' "
+            "AND status = 'VALID'",
+            "count",
+        )
+        tm.that(int(live_indexes), eq=1)
+        shadow_tables = _query_scalar(
+            oracle_engine,
+            "SELECT COUNT(*) AS \"count\" FROM user_tables "
+            "WHERE table_name IN ('TEST_SWAP_SHD', 'TEST_SWAP_OLD')",
+            "count",
+        )
+        tm.that(int(shadow_tables), eq=0)
+        tm.ok(loader.activate_version(stream_name, 3))
+        tm.ok(loader.activate_version(stream_name, 3))
+        tm.that(int(_query_scalar(oracle_engine, count_sql, "count")), eq=0)
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_interval_partitioned_table_retention(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Partitioned streams should drop expired partitions, not delete rows."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "table_partitioning": (
+                    '{"test_partitioned": {"interval": "day", '
+                    '"column": "_sdc_extracted_at", "retention": 7}}'
+                )
+            }
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_partitioned"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        partitioning_type = _query_scalar(
+            oracle_engine,
+            'SELECT partitioning_type AS "partitioning_type" FROM user_part_tables '
+            "WHERE table_name = 'TEST_PARTITIONED'",
+            "partitioning_type",
+        )
+        tm.that(partitioning_type, eq="RANGE")
+        tm.ok(
+            loader.insert_records(
+                stream_name,
+                [
+                    {"id": 1, "name": "Old", "_sdc_extracted_at": "2020-01-15T10:00:00"},
+                    {"id": 2, "name": "New"},
+                ],
+            )
+        )
+        tm.that(tm.ok(loader.purge_expired_partitions(stream_name)), eq=1)
+        names = [
+            row.root["name"]
+            for row in _query_rows(
+                oracle_engine, 'SELECT name AS "name" FROM test_partitioned'
+            )
+        ]
+        tm.that(names, eq=["New"])
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_initial_load_defers_indexes_to_finalize(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Initial loads should build the key and custom indexes after loading."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "initial_load_mode": True,
+                "index_parallel_degree": 2,
+                "custom_indexes": t
+                .json_value_adapter()
+                .dump_json({
+                    "test_backfill": [{"name": "IDX_BACKFILL_EMAIL", "columns": ["EMAIL"]}]
+                })
+                .decode("utf-8"),
+            }
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_backfill"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        index_sql = (
+            'SELECT index_name AS "index_name", degree AS "degree" '
+            "FROM user_indexes WHERE table_name = 'TEST_BACKFILL' ORDER BY index_name"
+        )
+        tm.that(len(_query_rows(oracle_engine, index_sql)), eq=0)
+        for record_id in range(1, 6):
+            tm.ok(
+                loader.load_record(
+                    stream_name,
+                    {"id": record_id, "name": f"User {record_id}", "email": None},
+                )
+            )
+        tm.ok(loader.finalize_all_streams())
+        indexes = {
+            str(row.root["index_name"]): str(row.root["degree"]).strip()
+            for row in _query_rows(oracle_engine, index_sql)
+        }
+        tm.that(indexes, eq={"IDX_BACKFILL_EMAIL": "1", "TEST_BACKFILL_PK": "1"})
+        primary_keys = _query_scalar(
+            oracle_engine,
+            "SELECT COUNT(*) AS \"count\" FROM user_constraints "
+            "WHERE table_name = 'TEST_BACKFILL' AND constraint_type = 'P'",
+            "count",
+        )
+        tm.that(int(primary_keys), eq=1)
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_row_hash_merge_skips_unchanged_rows(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Row-hash MERGE should only rewrite rows whose projected values changed."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "sdc_mode": "merge",
+                "row_hash_enabled": True,
+                "row_hash_cache": True,
+                "parallel_degree": 2,
+            }
+        )
+        stream_name = "test_row_hash"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        records: list[t.JsonMapping] = [
+            {"id": 1, "name": "John Doe", "email": "john@example.com"},
+            {"id": 2, "name": "Jane Smith", "email": "jane@example.com"},
+        ]
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(loader.insert_records(stream_name, records))
+        tm.ok(loader.disconnect())
+        resync_loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(resync_loader.connect())
+        tm.ok(resync_loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        tm.ok(
+            resync_loader.insert_records(
+                stream_name,
+                [records[0], {**records[1], "email": "jane@new.example.com"}],
+            )
+        )
+        tm.that(resync_loader.stream_statistics()[0].unchanged_records, eq=1)
+        rows = _query_rows(
+            oracle_engine,
+            'SELECT email AS "email", _sdc_row_hash AS "row_hash" FROM test_row_hash ORDER BY id',
+        )
+        tm.that(rows[1].root["email"], eq="jane@new.example.com")
+        tm.that(len(str(rows[0].root["row_hash"])), eq=32)
+        assert rows[0].root["row_hash"] != rows[1].root["row_hash"]
+        tm.ok(resync_loader.disconnect())
+
     @pytest.mark.usefixtures("clean_database")
     def test_bulk_insert_performance(
         self, oracle_config: FlextTargetOracleSettings, oracle_engine: FlextDbOracleApi
@@ -210,6 +554,32 @@ class TestsFlextTargetOracleOracle:
         assert elapsed < 10.0
         tm.ok(loader.disconnect())
 
+    @pytest.mark.usefixtures("clean_database")
+    def test_load_columns_binds_columnar_batch(
+        self,
+        oracle_loader: FlextTargetOracleLoader,
+        oracle_engine: FlextDbOracleApi,
+        simple_schema: t.JsonValue,
+    ) -> None:
+        """Columnar batches should land through array DML without buffering."""
+        stream_name = "test_columns"
+        schema_dict, key_props = _schema_parts(simple_schema)
+        tm.ok(oracle_loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        result = oracle_loader.load_columns(
+            stream_name,
+            {
+                "id": list(range(1, 2501)),
+                "name": [f"user {i}" for i in range(1, 2501)],
+            },
+        )
+        tm.that(tm.ok(result), eq=2500)
+        count = _query_scalar(
+            oracle_engine,
+            'SELECT COUNT(*) AS "count" FROM test_columns WHERE email IS NULL',
+            "count",
+        )
+        tm.that(int(count), eq=2500)
+
     @pytest.mark.usefixtures("clean_database")
     def test_json_storage_mode(
         self,
@@ -268,6 +638,106 @@ class TestsFlextTargetOracleOracle:
         tm.that(len(items_data), eq=2)
         tm.ok(loader.disconnect())
 
+    @pytest.mark.usefixtures("clean_database")
+    def test_json_storage_binds_raw_record_text(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        nested_schema: t.JsonValue,
+    ) -> None:
+        """JSON payloads should be stored exactly as they appeared on the line."""
+        oracle_config = oracle_config.clone(TargetOracle={"storage_mode": "json"})
+        target = FlextTargetOracle(settings=oracle_config)
+        tm.ok(target.initialize())
+        tm.ok(
+            target.execute(
+                t.json_value_adapter().dump_json(nested_schema).decode("utf-8")
+            )
+        )
+        raw_record = '{"id": 7,  "total": 1.50, "customer": {"name": "Acme"}}'
+        tm.ok(
+            target.execute(
+                f'{{"type": "RECORD", "stream": "orders", "record": {raw_record}}}'
+            )
+        )
+        stored = _query_scalar(
+            oracle_engine, 'SELECT data AS "data" FROM orders WHERE id = 7', "data"
+        )
+        tm.that(stored, eq=raw_record)
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_native_json_column_type(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        nested_schema: t.JsonValue,
+    ) -> None:
+        """JSON column type should store binary JSON queryable with JSON_VALUE."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={"storage_mode": "json", "json_column_type": "JSON"}
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_json_native"
+        schema_dict, key_props = _schema_parts(nested_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        data_type = _query_scalar(
+            oracle_engine,
+            'SELECT data_type AS "data_type" FROM user_tab_columns WHERE table_name = :table_name AND column_name = :column_name',
+            "data_type",
+            {"table_name": "TEST_JSON_NATIVE", "column_name": "DATA"},
+        )
+        tm.that({"JSON", "BLOB"}, has=data_type)
+        tm.ok(
+            loader.insert_records(
+                stream_name, [{"id": 1, "customer": {"name": "Acme Corp"}}]
+            )
+        )
+        customer_name = _query_scalar(
+            oracle_engine,
+            "SELECT JSON_VALUE(data, '$.customer.name') AS \"name\" FROM test_json_native WHERE id = 1",
+            "name",
+        )
+        tm.that(customer_name, eq="Acme Corp")
+        tm.ok(loader.disconnect())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_table_storage_options(
+        self,
+        oracle_config: FlextTargetOracleSettings,
+        oracle_engine: FlextDbOracleApi,
+        nested_schema: t.JsonValue,
+    ) -> None:
+        """Table options should compress rows and store the JSON CLOB as SECUREFILE."""
+        oracle_config = oracle_config.clone(
+            TargetOracle={
+                "storage_mode": "json",
+                "table_options": (
+                    '{"test_storage_options": {"compression": "basic", '
+                    '"securefile": true, "lob_cache": "cache"}}'
+                ),
+            }
+        )
+        loader = FlextTargetOracleLoader(oracle_config)
+        tm.ok(loader.connect())
+        stream_name = "test_storage_options"
+        schema_dict, key_props = _schema_parts(nested_schema)
+        tm.ok(loader.ensure_table_exists(stream_name, schema_dict, key_props))
+        compress_for = _query_scalar(
+            oracle_engine,
+            'SELECT compress_for AS "compress_for" FROM user_tables '
+            "WHERE table_name = 'TEST_STORAGE_OPTIONS'",
+            "compress_for",
+        )
+        tm.that(compress_for, eq="BASIC")
+        lob_rows = _query_rows(
+            oracle_engine,
+            'SELECT securefile AS "securefile", cache AS "cache" FROM user_lobs '
+            "WHERE table_name = 'TEST_STORAGE_OPTIONS' AND column_name = 'DATA'",
+        )
+        tm.that(lob_rows[0].root, eq={"securefile": "YES", "cache": "YES"})
+        tm.ok(loader.disconnect())
+
     @pytest.mark.usefixtures("clean_database")
     def test_column_ordering(
         self, oracle_config: FlextTargetOracleSettings, oracle_engine: FlextDbOracleApi
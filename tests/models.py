@@ -6,6 +6,9 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from typing import Annotated
+
+from flext_meltano import u
 from flext_target_oracle import FlextTargetOracleModels
 from flext_tests import FlextTestsModels
 
@@ -19,6 +22,63 @@ class TestsFlextTargetOracleModels(FlextTestsModels, FlextTargetOracleModels):
         class Tests:
             """Internal tests declarations for test-only objects."""
 
+            class ScalingScenario(FlextTargetOracleModels.ArbitraryTypesModel):
+                """One point of the scaling sweep grid."""
+
+                records: Annotated[
+                    int, u.Field(ge=1, description="RECORD messages across all streams")
+                ]
+                columns: Annotated[
+                    int, u.Field(ge=1, description="Scalar columns per record")
+                ]
+                streams: Annotated[int, u.Field(ge=1, description="Stream count")]
+                batch_size: Annotated[
+                    int, u.Field(ge=1, description="Loader batch size")
+                ]
+                load_method: Annotated[
+                    str, u.Field(description="TargetOracle load_method setting")
+                ]
+
+                @property
+                def key(self) -> str:
+                    """Return the stable identifier used to match baselines."""
+                    return (
+                        f"r{self.records}-c{self.columns}-s{self.streams}"
+                        f"-b{self.batch_size}-{self.load_method.lower()}"
+                    )
+
+            class ScalingResult(FlextTargetOracleModels.ArbitraryTypesModel):
+                """Measurements for one scenario, optionally against a baseline."""
+
+                scenario: Annotated[
+                    TestsFlextTargetOracleModels.TargetOracle.Tests.ScalingScenario,
+                    u.Field(description="Measured scenario"),
+                ]
+                backend: Annotated[str, u.Field(description="fake or oracle")]
+                elapsed_seconds: Annotated[
+                    float, u.Field(ge=0.0, description="Wall time of the load")
+                ]
+                rows_per_second: Annotated[
+                    float, u.Field(ge=0.0, description="Records loaded per second")
+                ]
+                peak_rss_mb: Annotated[
+                    float, u.Field(ge=0.0, description="Peak resident set size")
+                ]
+                flushes: Annotated[
+                    int, u.Field(ge=0, description="Flushes that wrote rows")
+                ]
+                flush_p99_ms: Annotated[
+                    float, u.Field(ge=0.0, description="99th percentile flush time")
+                ]
+                baseline_rows_per_second: Annotated[
+                    float | None,
+                    u.Field(description="Baseline throughput for the same scenario"),
+                ] = None
+                regression: Annotated[
+                    bool,
+                    u.Field(description="Throughput fell below baseline tolerance"),
+                ] = False
+
 
 m = TestsFlextTargetOracleModels
 
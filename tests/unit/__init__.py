@@ -7,9 +7,14 @@ from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 _LAZY_IMPORTS = build_lazy_import_map({
     ".test_config": ("TestsFlextTargetOracleConfig",),
+    ".test_generator": ("TestsFlextTargetOracleGenerator",),
     ".test_loader": ("TestsFlextTargetOracleLoader",),
+    ".test_metrics": ("TestsFlextTargetOracleMetrics",),
     ".test_module_governance": ("TestsFlextTargetOracleModuleGovernance",),
+    ".test_profiling": ("TestsFlextTargetOracleProfiler",),
+    ".test_prometheus": ("TestsFlextTargetOracleMetricsExporter",),
     ".test_target": ("TestsFlextTargetOracleTarget",),
+    ".test_tracing": ("TestsFlextTargetOracleTracing",),
     "flext_tests": (
         "c",
         "d",
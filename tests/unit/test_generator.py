@@ -0,0 +1,72 @@
+"""Unit tests for the seeded synthetic Singer stream generator."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from flext_target_oracle.cli import FlextTargetOracleCli
+from flext_target_oracle.utilities import FlextTargetOracleSingerGenerator
+from flext_tests import tm
+from tests import m
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextTargetOracleGenerator:
+    """Behavior contract for FlextTargetOracleSingerGenerator."""
+
+    @staticmethod
+    def _messages(**options: float) -> list[dict[str, object]]:
+        command = m.TargetOracle.OracleTargetGenerateCommand.model_validate(options)
+        return [
+            json.loads(line)
+            for line in FlextTargetOracleSingerGenerator(command).lines()
+        ]
+
+    def test_same_seed_gives_identical_stream(self) -> None:
+        """Output depends only on the command, so runs are reproducible."""
+        options = {"records": 50, "nested_objects": 1, "array_length": 3}
+        first = self._messages(seed=7, **options)
+        tm.that(self._messages(seed=7, **options), eq=first)
+        assert self._messages(seed=8, **options) != first
+
+    def test_streams_state_cadence_and_clob_size(self) -> None:
+        """Schemas lead, records interleave, STATE follows every N records."""
+        messages = self._messages(streams=3, records=4, state_every=5, clob_size=300)
+        types = [message["type"] for message in messages]
+        tm.that(types[:3], eq=["SCHEMA", "SCHEMA", "SCHEMA"])
+        tm.that(types.count("RECORD"), eq=12)
+        tm.that(types.count("STATE"), eq=2)
+        records = [
+            message["record"] for message in messages if message["type"] == "RECORD"
+        ]
+        tm.that({len(record["payload"]) for record in records}, eq={300})
+
+    def test_key_cardinality_and_duplicates_bound_keys(self) -> None:
+        """Keys stay below the cardinality and duplicates repeat earlier keys."""
+        bounded = self._messages(records=200, key_cardinality=10)
+        tm.that(
+            {message["record"]["id"] for message in bounded[1:]}, eq=set(range(10))
+        )
+        duplicated = self._messages(records=200, duplicate_rate=0.5)
+        keys = [message["record"]["id"] for message in duplicated[1:]]
+        assert 0 < len(set(keys)) < len(keys)
+
+    def test_cli_generate_writes_file(self, tmp_path: Path) -> None:
+        """``target-oracle generate`` validates options and writes the stream."""
+        output = tmp_path / "stream.jsonl"
+        result = FlextTargetOracleCli().run_cli([
+            "generate",
+            "--records",
+            "25",
+            "--streams",
+            "2",
+            "--output-file",
+            str(output),
+        ])
+        tm.ok(result)
+        tm.that(len(output.read_text(encoding="utf-8").splitlines()), eq=52)
+        tm.fail(FlextTargetOracleCli().run_cli(["generate", "--records", "-1"]))
+        tm.fail(FlextTargetOracleCli().run_cli(["generate", "--records"]))
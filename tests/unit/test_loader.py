@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
 
 from flext_cli import u as cli_u
 from flext_target_oracle import FlextTargetOracleSettings
-from flext_target_oracle.utilities import FlextTargetOracleLoader
+from flext_target_oracle.cli import FlextTargetOracleCli
+from flext_target_oracle.utilities import (
+    FlextTargetOracleLoader,
+    FlextTargetOracleRowValidator,
+)
 from flext_tests import tm
-from tests import m
+from tests import c, m, u
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from flext_db_oracle import FlextDbOracleApi
     from tests import t
 
@@ -87,6 +95,760 @@ class TestsFlextTargetOracleLoader:
         )
         tm.that(result.success, is_=bool)
 
+    def test_load_columns_rejects_ragged_and_unregistered_batches(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """load_columns should fail fast before touching Oracle."""
+        loader = FlextTargetOracleLoader(loader_config)
+        ragged = loader.load_columns("users", {"id": [1, 2], "name": ["Alice"]})
+        tm.fail(ragged)
+        unregistered = loader.load_columns("users", {"id": [1, 2]})
+        tm.fail(unregistered)
+        tm.that(loader.load_columns("users", {}).value, eq=0)
+
+    def test_arrow_table_binds_timestamp_and_decimal_columns(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """A real PyArrow table should bind its temporal and decimal scalars."""
+        pa = pytest.importorskip("pyarrow")
+        settings = loader_config.clone(TargetOracle={"batch_size": 10})
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True)
+        loader = FlextTargetOracleLoader(settings, oracle_api=oracle_api)
+        tm.ok(
+            loader.ensure_table_exists(
+                "orders",
+                {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "amount": {"type": "number"},
+                        "created_at": {"type": "string", "format": "date-time"},
+                    },
+                },
+                ["id"],
+            )
+        )
+        table = pa.table({
+            "id": pa.array([1, 2], pa.int64()),
+            "amount": pa.array(
+                [Decimal("12.50"), Decimal("0.10")], pa.decimal128(10, 2)
+            ),
+            "created_at": pa.array(
+                [
+                    datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+                    datetime(2026, 1, 3, tzinfo=UTC),
+                ],
+                pa.timestamp("us", tz="UTC"),
+            ),
+        })
+        tm.that(tm.ok(loader.load_columns("orders", table)), eq=2)
+        tm.that(oracle_api.bound_values("AMOUNT"), eq=[["12.50", "0.10"]])
+        tm.that(
+            oracle_api.bound_values("CREATED_AT"),
+            eq=[["2026-01-02T03:04:05+00:00", "2026-01-03T00:00:00+00:00"]],
+        )
+
+    def test_merge_buffer_keeps_last_record_per_key(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Merge loads should collapse repeated keys to the latest buffered row."""
+        loader = FlextTargetOracleLoader(
+            loader_config.clone(TargetOracle={"batch_size": 10, "sdc_mode": "merge"})
+        )
+        schema_message = m.Meltano.SingerSchemaMessage.model_validate({
+            "type": "SCHEMA",
+            "stream": "users",
+            "schema": {
+                "type": "object",
+                "properties": cli_u.Cli.json_dumps({
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                }).unwrap(),
+            },
+            "key_properties": ["id"],
+        })
+        loader.ensure_table_exists(
+            "users", schema_message.schema_definition, schema_message.key_properties
+        )
+        for record in (
+            {"id": 1, "name": "Alice"},
+            {"id": 2, "name": "Bob"},
+            {"id": 1, "name": "Alicia"},
+            {"id": 1, "name": "Ally"},
+        ):
+            tm.ok(loader.load_record("users", record))
+        tm.that(
+            list(loader.record_buffers["users"]),
+            eq=[{"id": 1, "name": "Ally"}, {"id": 2, "name": "Bob"}],
+        )
+        tm.that(loader.stream_statistics()[0].collapsed_records, eq=2)
+
+    @staticmethod
+    def _recorded_loader(
+        settings: FlextTargetOracleSettings,
+        oracle_api: u.TargetOracle.Tests.RecordingOracleApi | None = None,
+    ) -> tuple[FlextTargetOracleLoader, u.TargetOracle.Tests.RecordingOracleApi]:
+        """Return a loader over a row-keeping double with ``users`` registered."""
+        oracle_api = oracle_api or u.TargetOracle.Tests.RecordingOracleApi(
+            settings, keep_rows=True
+        )
+        loader = FlextTargetOracleLoader(settings, oracle_api=oracle_api)
+        schema_message = m.Meltano.SingerSchemaMessage.model_validate({
+            "type": "SCHEMA",
+            "stream": "users",
+            "schema": {
+                "type": "object",
+                "properties": cli_u.Cli.json_dumps({
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "email": {"type": "string"},
+                }).unwrap(),
+            },
+            "key_properties": ["id"],
+        })
+        tm.ok(
+            loader.ensure_table_exists(
+                "users", schema_message.schema_definition, schema_message.key_properties
+            )
+        )
+        return loader, oracle_api
+
+    def test_sparse_groups_keep_key_order(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Every sparse insert group should bind its rows in key order."""
+        loader, oracle_api = self._recorded_loader(
+            loader_config.clone(
+                TargetOracle={
+                    "batch_size": 10,
+                    "sort_batches_by_key": True,
+                    "sparse_bind_groups": 1,
+                }
+            )
+        )
+        tm.ok(
+            loader.insert_records(
+                "users",
+                [
+                    {"id": 9},
+                    {"id": 5, "name": "Eve"},
+                    {"id": 3},
+                    {"id": 7, "email": "ann@example.com"},
+                    {"id": 1, "name": "Al"},
+                    {"id": 2, "name": "Bo", "email": "bo@example.com"},
+                ],
+            )
+        )
+        tm.that(oracle_api.bound_values("ID"), eq=[[1, 5], [2, 3, 7, 9]])
+
+    def test_failed_sparse_group_rolls_back_the_whole_batch(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Groups applied before a failing one should not outlive the batch."""
+        settings = loader_config.clone(
+            TargetOracle={"batch_size": 10, "sparse_bind_groups": 1}
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(
+                settings, keep_rows=True, reject_values=frozenset({"BAD"})
+            ),
+        )
+        tm.fail(
+            loader.insert_records(
+                "users",
+                [
+                    {"id": 1, "name": "Ann"},
+                    {"id": 2, "name": "Bob"},
+                    {"id": 3, "email": "BAD"},
+                ],
+            )
+        )
+        tm.that(len(oracle_api.statements("execute_many")), eq=2)
+        tm.that(oracle_api.statements("execute_sql")[-1], has="ROLLBACK TO SAVEPOINT")
+        tm.that(oracle_api.applied, eq=[])
+        tm.that(oracle_api.committed_rows, eq=[])
+
+    @pytest.mark.parametrize("rejected_id", [0, 8, 11, 15])
+    def test_partial_array_failure_is_rolled_back_before_isolation(
+        self, loader_config: FlextTargetOracleSettings, tmp_path: Path, rejected_id: int
+    ) -> None:
+        """Rows applied before an array error should load once, not twice."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 16,
+                "on_batch_error": "quarantine",
+                "quarantine_dir": str(tmp_path),
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(
+                settings, keep_rows=True, reject_values=frozenset({"BAD"})
+            ),
+        )
+        tm.ok(
+            loader.insert_records(
+                "users",
+                [
+                    {
+                        "id": record_id,
+                        "name": "BAD" if record_id == rejected_id else "ok",
+                    }
+                    for record_id in range(16)
+                ],
+            )
+        )
+        applied_ids = [row["ID"] for row in oracle_api.committed_rows]
+        tm.that(
+            sorted(applied_ids),
+            eq=[record_id for record_id in range(16) if record_id != rejected_id],
+        )
+        tm.that(loader.metrics.counters("users")["retries"], eq=8)
+        (line,) = (tmp_path / "users.jsonl").read_text(encoding="utf-8").splitlines()
+        rejected = m.TargetOracle.RejectedRow.model_validate_json(line)
+        tm.that(rejected.batch_offset, eq=rejected_id)
+        tm.that(rejected.error_code, eq="ORA-12899")
+
+    def test_initial_load_bisects_with_conventional_inserts(
+        self, loader_config: FlextTargetOracleSettings, tmp_path: Path
+    ) -> None:
+        """Retries after a direct-path failure must not hit ORA-12838."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 8,
+                "initial_load_mode": True,
+                "on_batch_error": "quarantine",
+                "quarantine_dir": str(tmp_path),
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(
+                settings, keep_rows=True, reject_values=frozenset({"BAD"})
+            ),
+        )
+        tm.ok(
+            loader.insert_records(
+                "users",
+                [
+                    {"id": record_id, "name": "BAD" if record_id == 5 else "ok"}
+                    for record_id in range(8)
+                ],
+            )
+        )
+        first_write, *retries = oracle_api.statements("execute_many")
+        tm.that(first_write, has="APPEND_VALUES")
+        assert retries
+        assert not any("APPEND_VALUES" in sql for sql in retries)
+        tm.that(
+            sorted(row["ID"] for row in oracle_api.committed_rows),
+            eq=[0, 1, 2, 3, 4, 6, 7],
+        )
+        (line,) = (tmp_path / "users.jsonl").read_text(encoding="utf-8").splitlines()
+        tm.that(m.TargetOracle.RejectedRow.model_validate_json(line).batch_offset, eq=5)
+
+    def test_merge_deletes_are_rolled_back_with_rejected_rows(
+        self, loader_config: FlextTargetOracleSettings, tmp_path: Path
+    ) -> None:
+        """A quarantined update should restore the row its key deleted."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 16,
+                "sdc_mode": "merge",
+                "on_batch_error": "quarantine",
+                "quarantine_dir": str(tmp_path),
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(
+                settings, keep_rows=True, reject_values=frozenset({"BAD"})
+            ),
+        )
+        oracle_api.reset()
+        tm.ok(
+            loader.insert_records(
+                "users", [{"id": 1, "name": "ok"}, {"id": 2, "name": "BAD"}]
+            )
+        )
+        statements = [sql for _operation, sql, _rows in oracle_api.calls]
+        deletes = [
+            index for index, sql in enumerate(statements) if sql.startswith("DELETE")
+        ]
+        tm.that(len(deletes), eq=3)
+        assert all(statements[index - 1].startswith("SAVEPOINT") for index in deletes)
+        tm.that(statements[-1], has="ROLLBACK TO SAVEPOINT")
+        tm.that([row["ID"] for row in oracle_api.committed_rows], eq=[1])
+
+    def test_row_hash_ignores_metadata_and_number_form(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Only projected field values should change the row hash."""
+        loader, oracle_api = self._recorded_loader(
+            loader_config.clone(
+                TargetOracle={
+                    "batch_size": 10,
+                    "row_hash_enabled": True,
+                    "storage_mode": "hybrid",
+                }
+            )
+        )
+        tm.ok(
+            loader.insert_records(
+                "users",
+                [
+                    {"id": 1, "name": "Ann", "_sdc_extracted_at": "2026-01-01"},
+                    {
+                        "id": 1.0,
+                        "name": "Ann",
+                        "_sdc_extracted_at": "2026-02-01",
+                        "_sdc_sequence": 7,
+                    },
+                    {"id": 1, "name": "Anne"},
+                ],
+            )
+        )
+        (hashes,) = oracle_api.bound_values("_SDC_ROW_HASH")
+        tm.that(hashes[1], eq=hashes[0])
+        assert hashes[2] != hashes[0]
+
+    def test_row_hash_cache_matches_keys_read_back_and_stays_bounded(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Seeded keys read back as numbers should hit, within the cache size."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 10,
+                "sdc_mode": "merge",
+                "row_hash_enabled": True,
+                "row_hash_cache": True,
+                "row_hash_cache_size": 2,
+            }
+        )
+        records = [{"id": record_id, "name": "Ann"} for record_id in (7, 8, 9)]
+        first_loader, first_api = self._recorded_loader(settings)
+        tm.ok(first_loader.insert_records("users", records))
+        (row_hashes,) = first_api.bound_values("_SDC_ROW_HASH")
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(
+            settings,
+            keep_rows=True,
+            query_results={
+                'AS "count"': [{"count": 1}],
+                "FETCH FIRST": [
+                    {"ID": float(record["id"]), "_SDC_ROW_HASH": row_hash}
+                    for record, row_hash in zip(records, row_hashes, strict=True)
+                ],
+            },
+        )
+        oracle_api.tables.add("USERS")
+        loader, _ = self._recorded_loader(settings, oracle_api)
+        tm.ok(loader.insert_records("users", records))
+        tm.that(oracle_api.bound_values("ID"), eq=[[9]])
+        tm.that(loader.stream_statistics()[0].unchanged_records, eq=2)
+
+    def test_quarantine_writes_rejected_rows_per_stream(
+        self, loader_config: FlextTargetOracleSettings, tmp_path: Path
+    ) -> None:
+        """Rejected rows should land in the stream JSONL file with their ORA code."""
+        loader = FlextTargetOracleLoader(
+            loader_config.clone(TargetOracle={"quarantine_dir": str(tmp_path)})
+        )
+        rejected = loader.quarantine.rejected_row(
+            "users",
+            4,
+            {"ID": None, "DATA": b'{"id":null}'},
+            'ORA-01400: cannot insert NULL into ("TEST_SCHEMA"."USERS"."ID")',
+        )
+        tm.that(tm.ok(loader.quarantine.write([rejected])), eq=1)
+        lines = (tmp_path / "users.jsonl").read_text(encoding="utf-8").splitlines()
+        tm.that(len(lines), eq=1)
+        restored = m.TargetOracle.RejectedRow.model_validate_json(lines[0])
+        tm.that(restored.error_code, eq="ORA-01400")
+        tm.that(restored.batch_offset, eq=4)
+        tm.that(restored.row["DATA"], eq='{"id":null}')
+
+    def test_row_validator_flags_width_number_and_null_violations(self) -> None:
+        """Pre-flight checks should mirror Oracle width, number and NULL errors."""
+        validator = FlextTargetOracleRowValidator((
+            m.DbOracle.Column(
+                name="ID", data_type="NUMBER(5)", nullable=False, primary_key=True
+            ),
+            m.DbOracle.Column(name="NAME", data_type="VARCHAR2(4)", nullable=True),
+            m.DbOracle.Column(name="NOTE", data_type="CLOB", nullable=True),
+        ))
+        violations = validator.violations({
+            "ID": [1, 2, "12a", 123456, None],
+            "NAME": ["Ann", "Zoë12", "Bob", "Eve", "Amy"],
+            "NOTE": ["x" * 5000, None, None, None, None],
+        })
+        tm.that(sorted(violations), eq=[1, 2, 3, 4])
+        tm.that(violations[1], has="ORA-12899")
+        tm.that(violations[2], has="ORA-01722")
+        tm.that(violations[3], has="ORA-01438")
+        tm.that(violations[4], has="ORA-01400")
+
+    @pytest.mark.parametrize(
+        ("char_used", "character_set", "accepted"),
+        [
+            ("C", "AL32UTF8", True),
+            ("B", "WE8MSWIN1252", True),
+            ("B", "AL32UTF8", False),
+        ],
+    )
+    def test_preflight_widths_follow_reported_column_semantics(
+        self,
+        loader_config: FlextTargetOracleSettings,
+        char_used: str,
+        character_set: str,
+        accepted: bool,
+    ) -> None:
+        """Widths should be measured the way the existing column declares them."""
+        settings = loader_config.clone(
+            TargetOracle={"batch_size": 10, "preflight_validation": True}
+        )
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(
+            settings,
+            keep_rows=True,
+            query_results={
+                "char_used": [
+                    {"column_name": "ID", "data_type": "NUMBER", "nullable": "N"},
+                    {
+                        "column_name": "NAME",
+                        "data_type": "VARCHAR2",
+                        "char_length": 4,
+                        "char_used": char_used,
+                        "nullable": "Y",
+                    },
+                ],
+                "NLS_CHARACTERSET": [{"value": character_set}],
+            },
+        )
+        oracle_api.tables.add("USERS")
+        loader, _ = self._recorded_loader(settings, oracle_api)
+        result = loader.insert_records("users", [{"id": 1, "name": "Zoë1"}])
+        if accepted:
+            tm.ok(result)
+            tm.that(oracle_api.bound_values("NAME"), eq=[["Zoë1"]])
+        else:
+            tm.that(tm.fail(result), has="ORA-12899")
+
+    def test_partition_column_rejects_null_before_insert(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """A NULL partition key should fail pre-flight, not the interval insert."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 10,
+                "preflight_validation": True,
+                "table_partitioning": '{"events": {"column": "created_at"}}',
+            }
+        )
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True)
+        loader = FlextTargetOracleLoader(settings, oracle_api=oracle_api)
+        tm.ok(
+            loader.ensure_table_exists(
+                "events",
+                {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "created_at": {"type": "string", "format": "date-time"},
+                    },
+                },
+                ["id"],
+            )
+        )
+        result = loader.insert_records("events", [{"id": 1, "created_at": None}])
+        tm.that(tm.fail(result), has="ORA-01400")
+        tm.that(oracle_api.bound, eq=[])
+
+    def test_loading_into_a_partitioned_table_never_purges(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Expired partitions are only dropped by an explicit purge."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "table_partitioning": (
+                    '{"users": {"interval": "day", '
+                    '"column": "_sdc_extracted_at", "retention": 7}}'
+                )
+            }
+        )
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True)
+        oracle_api.tables.add("USERS")
+        loader, oracle_api = self._recorded_loader(settings, oracle_api)
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}]))
+        assert not any(
+            "all_tab_partitions" in sql or "DROP PARTITION" in sql
+            for _operation, sql, _rows in oracle_api.calls
+        )
+
+    @pytest.mark.parametrize(
+        ("options", "error"),
+        [
+            (["--stream"], "--name value pairs"),
+            (["--config-file", "missing.json"], "Configuration file not found"),
+        ],
+    )
+    def test_purge_command_reports_invalid_options(
+        self, options: list[str], error: str
+    ) -> None:
+        """``target-oracle purge`` should validate its options before connecting."""
+        tm.that(tm.fail(FlextTargetOracleCli().run_cli(["purge", *options])), has=error)
+
+    def test_parallel_dml_is_reserved_for_the_dedup_delete(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Array INSERTs stay serial; only the set-based dedup DELETE is hinted."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 10,
+                "initial_load_mode": True,
+                "sdc_mode": "merge",
+                "parallel_degree": 4,
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings, u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True)
+        )
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}]))
+        tm.ok(loader.insert_records("users", [{"id": 2, "name": "Bob"}]))
+        inserts = oracle_api.statements("execute_many")
+        tm.that(len(inserts), eq=2)
+        assert all(
+            sql.startswith("INSERT /*+ APPEND_VALUES */ INTO") for sql in inserts
+        )
+        tm.ok(loader.finalize_all_streams())
+        statements = [sql for _operation, sql, _rows in oracle_api.calls]
+        tm.that(statements.count("ALTER SESSION ENABLE PARALLEL DML"), eq=1)
+        deletes = [sql for sql in statements if sql.startswith("DELETE")]
+        tm.that(len(deletes), eq=1)
+        tm.that(deletes[0], has="DELETE /*+ PARALLEL(4) */ FROM")
+        assert statements.index("ALTER SESSION ENABLE PARALLEL DML") < (
+            statements.index(deletes[0])
+        )
+
+    def test_merge_statements_stay_serial(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Row-hash MERGE should carry no PARALLEL hint whatever the degree."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "sdc_mode": "merge",
+                "row_hash_enabled": True,
+                "parallel_degree": 4,
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True),
+        )
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}]))
+        merges = [
+            sql
+            for _operation, sql, _rows in oracle_api.calls
+            if sql.startswith("MERGE")
+        ]
+        assert merges
+        assert not any("PARALLEL" in sql for sql in merges)
+
+    def test_shadow_table_is_complete_before_it_is_swapped_in(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Keys, indexes and grants should exist before the renames run."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "full_table_swap": True,
+                "custom_indexes": '{"users": [{"columns": ["name"]}]}',
+            }
+        )
+        loader, oracle_api = self._recorded_loader(
+            settings,
+            u.TargetOracle.Tests.RecordingOracleApi(
+                settings,
+                keep_rows=True,
+                query_results={
+                    "all_tab_privs": [
+                        {
+                            "grantee": "REPORTING",
+                            "privilege": "SELECT",
+                            "grantable": "NO",
+                        }
+                    ]
+                },
+            ),
+        )
+        tm.ok(loader.activate_version("users", 2))
+        tm.that("USERS_SHD" in oracle_api.tables, eq=False)
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}], version=2))
+        tm.that(oracle_api.inserted_columns(oracle_api.bound[-1][0]), has="ID")
+        assert "USERS_SHD" in oracle_api.bound[-1][0]
+        oracle_api.reset()
+        tm.ok(loader.activate_version("users", 2))
+        statements = oracle_api.statements("execute_sql")
+
+        def position(fragment: str) -> int:
+            return next(
+                index for index, sql in enumerate(statements) if fragment in sql
+            )
+
+        retire = position("USERS RENAME TO USERS_OLD")
+        tm.that(position("USERS_SHD RENAME TO USERS"), eq=retire + 1)
+        assert position("ADD PRIMARY KEY") < retire
+        assert position("USERS_NAME_IDX_SHD") < retire
+        assert position("GRANT SELECT ON") < retire
+        assert "TO REPORTING" in statements[position("GRANT SELECT ON")]
+        assert position("DROP TABLE") < position("USERS_PK_SHD RENAME TO USERS_PK")
+        assert position("USERS_NAME_IDX_SHD RENAME TO USERS_NAME_IDX") > retire
+
+    @pytest.mark.parametrize("truncate_empty_versions", [False, True])
+    def test_version_without_records_leaves_no_shadow(
+        self, loader_config: FlextTargetOracleSettings, truncate_empty_versions: bool
+    ) -> None:
+        """Close-only activations make no shadow; truncating is opt-in."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "full_table_swap": True,
+                "truncate_empty_versions": truncate_empty_versions,
+            }
+        )
+        loader, oracle_api = self._recorded_loader(settings)
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}]))
+        tm.ok(loader.activate_version("users", 3))
+        assert not any(
+            "USERS_SHD" in sql for sql in oracle_api.statements("execute_sql")
+        )
+        tm.ok(loader.activate_version("users", 3))
+        statements = oracle_api.statements("execute_sql")
+        tm.that(
+            any(sql.startswith("TRUNCATE TABLE") for sql in statements),
+            eq=truncate_empty_versions,
+        )
+        assert not any("USERS_SHD" in sql for sql in statements)
+
+    def test_only_versions_opened_in_this_run_load_into_a_shadow(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Unopened versions load live; an unactivated shadow is reported."""
+        settings = loader_config.clone(TargetOracle={"full_table_swap": True})
+        loader, oracle_api = self._recorded_loader(
+            settings, u.TargetOracle.Tests.RecordingOracleApi(settings, keep_rows=True)
+        )
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}], version=2))
+        assert "USERS_SHD" not in oracle_api.bound[-1][0]
+        tm.that("USERS_SHD" in oracle_api.tables, eq=False)
+        tm.ok(loader.activate_version("users", 3))
+        tm.ok(loader.insert_records("users", [{"id": 2, "name": "Bob"}], version=3))
+        assert "USERS_SHD" in oracle_api.bound[-1][0]
+        finalize_result = tm.ok(loader.finalize_all_streams())
+        tm.that(list(finalize_result.unswapped_shadows), eq=["USERS_SHD"])
+
+    @pytest.mark.parametrize(
+        ("primary_keys", "comment", "rebuilt"),
+        [
+            ([], c.TargetOracle.KEYS_PENDING_TABLE_COMMENT, True),
+            ([{"constraint_name": "SYS_C001"}], None, False),
+            ([], "Owned by reporting", False),
+        ],
+    )
+    def test_existing_table_without_primary_key_is_rebuilt(
+        self,
+        loader_config: FlextTargetOracleSettings,
+        primary_keys: list[t.JsonMapping],
+        comment: str | None,
+        rebuilt: bool,
+    ) -> None:
+        """Only a table an interrupted initial load left unkeyed is rebuilt."""
+        settings = loader_config.clone(TargetOracle={"sdc_mode": "merge"})
+        oracle_api = u.TargetOracle.Tests.RecordingOracleApi(
+            settings,
+            keep_rows=True,
+            query_results={
+                "constraint_type": primary_keys,
+                "all_tab_comments": [{"comments": comment}],
+            },
+        )
+        oracle_api.tables.add("USERS")
+        self._recorded_loader(settings, oracle_api)
+        statements = oracle_api.statements("execute_sql")
+        tm.that(any("ADD PRIMARY KEY" in sql for sql in statements), eq=rebuilt)
+        tm.that(any(sql.startswith("DELETE") for sql in statements), eq=rebuilt)
+        if rebuilt:
+            (dedup,) = [sql for sql in statements if sql.startswith("DELETE")]
+            tm.that(dedup, has='ORDER BY "_SDC_LOADED_AT" DESC')
+            assert "MAX(ROWID)" not in dedup
+            assert statements.index(dedup) < next(
+                index
+                for index, sql in enumerate(statements)
+                if "ADD PRIMARY KEY" in sql
+            )
+
+    def test_initial_load_marks_its_table_until_keys_are_built(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """The keys-pending comment lives from CREATE TABLE to the key build."""
+        settings = loader_config.clone(TargetOracle={"initial_load_mode": True})
+        loader, oracle_api = self._recorded_loader(settings)
+        marker = f"IS '{c.TargetOracle.KEYS_PENDING_TABLE_COMMENT}'"
+        tm.that(oracle_api.statements("execute_sql")[-1], has=marker)
+        tm.ok(loader.insert_records("users", [{"id": 1, "name": "Ann"}]))
+        oracle_api.reset()
+        tm.ok(loader.finalize_all_streams())
+        statements = oracle_api.statements("execute_sql")
+        tm.that(statements[-1], has="COMMENT ON TABLE")
+        tm.that(statements[-1], has="IS ''")
+        assert any("ADD PRIMARY KEY" in sql for sql in statements)
+
+    def test_columnar_merge_writes_each_key_once_per_load_stamp(
+        self, loader_config: FlextTargetOracleSettings
+    ) -> None:
+        """Deferred-key dedup can order by load stamp: no write repeats a key."""
+        settings = loader_config.clone(
+            TargetOracle={
+                "batch_size": 2,
+                "sdc_mode": "merge",
+                "initial_load_mode": True,
+            }
+        )
+        loader, oracle_api = self._recorded_loader(settings)
+        batch = {"id": [1, 1, 2, 1], "name": ["Ann", "Bob", "Cat", "Dan"]}
+        tm.that(tm.ok(loader.load_columns("users", batch)), eq=4)
+        first_names, second_names = oracle_api.bound_values("NAME")
+        tm.that(first_names, eq=["Bob"])
+        tm.that(sorted(second_names), eq=["Cat", "Dan"])
+        first_stamps, second_stamps = oracle_api.bound_values("_SDC_LOADED_AT")
+        assert max(first_stamps) < min(second_stamps)
+        tm.that(loader.stream_statistics()[0].collapsed_records, eq=1)
+
+    def test_row_validator_screens_clean_columns_in_bulk(self) -> None:
+        """Clean columns should pass and mixed columns fall back per value."""
+        validator = FlextTargetOracleRowValidator(
+            (
+                m.DbOracle.Column(
+                    name="AMOUNT", data_type="NUMBER(4,2)", nullable=True
+                ),
+                m.DbOracle.Column(
+                    name="CODE", data_type="VARCHAR2(3 BYTE)", nullable=True
+                ),
+            ),
+            encoding=None,
+        )
+        tm.that(
+            validator.violations({
+                "AMOUNT": [1, 99.5, None, -12],
+                "CODE": ["abc", "", None, "ëëë"],
+            }),
+            eq={},
+        )
+        violations = validator.violations({
+            "AMOUNT": [1, "100", 7, 3.25],
+            "CODE": ["ab", 1234, None, "abcd"],
+        })
+        tm.that(sorted(violations), eq=[1, 3])
+        tm.that(violations[1], has="ORA-01438")
+        tm.that(violations[3], has="ORA-12899")
+
     @pytest.mark.integration
     @pytest.mark.docker
     def test_flush_batch_persists_records_to_real_oracle(
@@ -0,0 +1,152 @@
+"""Unit tests for the per-stream metrics registry."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleLoader,
+    FlextTargetOracleMetrics,
+    FlextTargetOracleSingerGenerator,
+)
+from flext_tests import tm
+from tests import c, m, t, u
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestsFlextTargetOracleMetrics:
+    """Behavior contract for FlextTargetOracleMetrics."""
+
+    def test_histogram_quantiles_stay_within_bucket_error(self) -> None:
+        """Log-linear buckets bound the relative quantile error."""
+        histogram = FlextTargetOracleMetrics.Histogram()
+        for value in range(1, 100_001):
+            histogram.record(value * 1_000)
+        summary = histogram.summary()
+        tm.that(summary.count, eq=100_000)
+        tm.that(summary.min_ms, eq=0.001)
+        tm.that(summary.max_ms, eq=100.0)
+        for observed, expected in ((summary.p50_ms, 50.0), (summary.p99_ms, 99.0)):
+            assert abs(observed - expected) / expected < 0.02
+
+    def test_counters_and_snapshot(self) -> None:
+        """Counters accumulate per stream and snapshots are detached copies."""
+        metrics = FlextTargetOracleMetrics()
+        metrics.update("orders", loaded=3, failed=1)
+        metrics.increment("orders", "loaded")
+        metrics.observe(c.TargetOracle.METRIC_PHASE_EXECUTE, "orders", 2_000_000)
+        snapshot = metrics.snapshot()
+        metrics.increment("orders", "loaded")
+        (stream,) = snapshot.streams
+        tm.that(stream.counters, eq={"loaded": 4, "failed": 1})
+        tm.that(stream.latencies[c.TargetOracle.METRIC_PHASE_EXECUTE].count, eq=1)
+        tm.that(metrics.counters("unknown")["loaded"], eq=0)
+        metrics.reset()
+        tm.that(metrics.snapshot().streams, eq=())
+
+    @staticmethod
+    def _target(**options: t.JsonValue) -> tuple[FlextTargetOracle, list[str]]:
+        settings = FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": "localhost",
+                "oracle_port": 1521,
+                "oracle_service_name": "XE",
+                "oracle_user": "metrics_user",
+                "oracle_password": "metrics_password",
+                "default_target_schema": "METRICS",
+                "batch_size": 10,
+                **options,
+            }
+        })
+        target = FlextTargetOracle(
+            settings, oracle_api=u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+        lines = list(
+            FlextTargetOracleSingerGenerator(
+                m.TargetOracle.OracleTargetGenerateCommand(records=25)
+            ).lines()
+        )
+        tm.ok(
+            target.process_singer_message(
+                m.Meltano.SingerSchemaMessage.model_validate(json.loads(lines[0]))
+            )
+        )
+        for line in lines[1:]:
+            tm.ok(target.write_record(line))
+        tm.ok(target.finalize())
+        return target, lines
+
+    def test_target_records_load_path_metrics(self) -> None:
+        """Rows, bytes, flushes and phase latencies are queryable from the target."""
+        target, lines = self._target()
+        (stream,) = target.metrics_snapshot().streams
+        tm.that(stream.counters["rows_in"], eq=25)
+        tm.that(stream.counters["loaded"], eq=25)
+        tm.that(stream.counters["flushes"], eq=3)
+        tm.that(stream.counters["bytes_in"], eq=sum(map(len, lines[1:])))
+        tm.that(stream.latencies[c.TargetOracle.METRIC_PHASE_PARSE].count, eq=3)
+        tm.that(stream.latencies[c.TargetOracle.METRIC_PHASE_FLUSH].count, eq=3)
+        tm.that(stream.latencies[c.TargetOracle.METRIC_PHASE_EXECUTE].count, eq=3)
+        tm.that(stream.latencies[c.TargetOracle.METRIC_PHASE_COMMIT].count, eq=3)
+        tm.that(target.metrics.counters(stream.stream_name)["loaded"], eq=25)
+
+    @staticmethod
+    def _metric_lines(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Collect METRIC lines at the point where the loader logs them."""
+        lines: list[str] = []
+
+        def emit(_loader: FlextTargetOracleLoader, line: str) -> None:
+            lines.append(line)
+
+        monkeypatch.setattr(FlextTargetOracleLoader, "_emit_singer_metric", emit)
+        return lines
+
+    def test_singer_metric_lines_per_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each batch ends with record_count and batch_processing_time lines."""
+        lines = self._metric_lines(monkeypatch)
+        self._target(singer_metrics=True, singer_metrics_interval=0)
+        metrics = [
+            json.loads(line.removeprefix(c.TargetOracle.SINGER_METRIC_PREFIX))
+            for line in lines
+        ]
+        counters = [item for item in metrics if item["type"] == "counter"]
+        timers = [item for item in metrics if item["type"] == "timer"]
+        tm.that(sum(item["value"] for item in counters), eq=25)
+        tm.that(
+            {item["metric"] for item in counters},
+            eq={c.TargetOracle.SINGER_METRIC_RECORD_COUNT},
+        )
+        tm.that(
+            [item["tags"]["record_count"] for item in timers], eq=["10", "10", "5"]
+        )
+        tm.that(
+            {item["tags"]["status"] for item in timers},
+            eq={c.TargetOracle.SINGER_METRIC_STATUS_SUCCEEDED},
+        )
+
+    def test_singer_metrics_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No METRIC lines are written unless singer_metrics is turned on."""
+        lines = self._metric_lines(monkeypatch)
+        self._target()
+        tm.that(lines, eq=[])
+
+    def test_record_counts_wait_for_interval(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Within the interval only the timers are logged until finalize."""
+        lines = self._metric_lines(monkeypatch)
+        self._target(singer_metrics=True, singer_metrics_interval=3600)
+        metrics = [
+            json.loads(line.removeprefix(c.TargetOracle.SINGER_METRIC_PREFIX))
+            for line in lines
+        ]
+        counters = [item["value"] for item in metrics if item["type"] == "counter"]
+        tm.that(counters, eq=[25])
+        tm.that(len(metrics), eq=4)
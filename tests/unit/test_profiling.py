@@ -0,0 +1,120 @@
+"""Unit tests for opt-in CPU and allocation profiling."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import time
+from typing import TYPE_CHECKING
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleSingerGenerator,
+)
+from flext_tests import tm
+from tests import c, m, t, u
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextTargetOracleProfiler:
+    """Behavior contract for FlextTargetOracleProfiler."""
+
+    @staticmethod
+    def _target(tmp_path: Path, **options: t.JsonValue) -> FlextTargetOracle:
+        settings = FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": "localhost",
+                "oracle_port": 1521,
+                "oracle_service_name": "XE",
+                "oracle_user": "profile_user",
+                "oracle_password": "profile_password",
+                "default_target_schema": "PROFILE",
+                "batch_size": 500,
+                "profile_dir": str(tmp_path),
+                "profile_interval": 0.001,
+                **options,
+            }
+        })
+        return FlextTargetOracle(
+            settings, oracle_api=u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+
+    @staticmethod
+    def _load(target: FlextTargetOracle) -> None:
+        lines = list(
+            FlextTargetOracleSingerGenerator(
+                m.TargetOracle.OracleTargetGenerateCommand(records=3000, columns=16)
+            ).lines()
+        )
+        tm.ok(
+            target.process_singer_message(
+                m.Meltano.SingerSchemaMessage.model_validate(json.loads(lines[0]))
+            )
+        )
+        for line in lines[1:]:
+            tm.ok(target.write_record(line))
+        tm.ok(target.finalize())
+
+    def test_profile_on_start_writes_phase_folded_stacks(self, tmp_path: Path) -> None:
+        """A window opened at start is closed at finalize with folded output."""
+        target = self._target(tmp_path, profile_on_start=True)
+        profiler = target.loader.profiler
+        assert profiler is not None
+        tm.that(profiler.active, eq=True)
+        self._load(target)
+        tm.that(profiler.active, eq=False)
+        (cpu_file,) = tmp_path.glob(f"cpu-*{c.TargetOracle.PROFILE_FILE_SUFFIX}")
+        (alloc_file,) = tmp_path.glob(f"alloc-*{c.TargetOracle.PROFILE_FILE_SUFFIX}")
+        cpu_phases = {
+            line.split(";", 1)[0]
+            for line in cpu_file.read_text(encoding="utf-8").splitlines()
+        }
+        assert cpu_phases & {
+            "phase:_load_record_unchecked",
+            "phase:_build_batch_parameters",
+            "phase:_flush_batch_unchecked",
+        }
+        alloc_lines = alloc_file.read_text(encoding="utf-8").splitlines()
+        assert alloc_lines
+        assert all(
+            line.startswith("phase:") and int(line.rsplit(" ", 1)[1]) > 0
+            for line in alloc_lines
+        )
+
+    def test_window_closes_at_batch_boundary(self, tmp_path: Path) -> None:
+        """An elapsed window is written by the next flush, not by the handler."""
+        target = self._target(tmp_path, profile_on_start=True, profile_seconds=0.01)
+        profiler = target.loader.profiler
+        assert profiler is not None
+        time.sleep(0.02)
+        tm.that(profiler.expired, eq=True)
+        tm.that(profiler.active, eq=True)
+        self._load(target)
+        tm.that(profiler.active, eq=False)
+        cpu_files = list(tmp_path.glob(f"cpu-*{c.TargetOracle.PROFILE_FILE_SUFFIX}"))
+        tm.that(len(cpu_files), eq=1)
+
+    def test_signal_opens_window(self, tmp_path: Path) -> None:
+        """The configured signal starts profiling; a second one is a no-op."""
+        previous = signal.getsignal(signal.SIGUSR2)
+        try:
+            target = self._target(tmp_path, profile_signal="SIGUSR2")
+            profiler = target.loader.profiler
+            assert profiler is not None
+            tm.that(profiler.active, eq=False)
+            os.kill(os.getpid(), signal.SIGUSR2)
+            tm.that(profiler.active, eq=True)
+            tm.that(tm.ok(profiler.start()), eq=False)
+            cpu_file, alloc_file = tm.ok(profiler.stop())
+            assert cpu_file.exists()
+            assert alloc_file.exists()
+        finally:
+            signal.signal(signal.SIGUSR2, previous)
+
+    def test_profiling_is_opt_in(self, tmp_path: Path) -> None:
+        """No profiler exists unless a signal or start flag is configured."""
+        tm.that(self._target(tmp_path).loader.profiler, none=True)
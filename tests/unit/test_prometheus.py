@@ -0,0 +1,116 @@
+"""Unit tests for the Prometheus exposition of loader metrics."""
+
+from __future__ import annotations
+
+import json
+import urllib.request
+from typing import TYPE_CHECKING
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleMetrics,
+    FlextTargetOracleMetricsExporter,
+    FlextTargetOracleSingerGenerator,
+)
+from flext_tests import tm
+from tests import c, m, u
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextTargetOracleMetricsExporter:
+    """Behavior contract for FlextTargetOracleMetricsExporter."""
+
+    @staticmethod
+    def _samples(text: str) -> dict[str, str]:
+        return dict(
+            sample.rsplit(" ", 1)
+            for sample in text.splitlines()
+            if not sample.startswith("#")
+        )
+
+    def test_textfile_exposes_stream_families(self, tmp_path: Path) -> None:
+        """Every flush rewrites the textfile with per-stream samples."""
+        textfile = tmp_path / "target_oracle.prom"
+        settings = FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": "localhost",
+                "oracle_port": 1521,
+                "oracle_service_name": "XE",
+                "oracle_user": "prom_user",
+                "oracle_password": "prom_password",
+                "default_target_schema": "PROM",
+                "batch_size": 10,
+                "prometheus_textfile": str(textfile),
+            }
+        })
+        target = FlextTargetOracle(
+            settings, oracle_api=u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+        lines = list(
+            FlextTargetOracleSingerGenerator(
+                m.TargetOracle.OracleTargetGenerateCommand(records=15)
+            ).lines()
+        )
+        tm.ok(
+            target.process_singer_message(
+                m.Meltano.SingerSchemaMessage.model_validate(json.loads(lines[0]))
+            )
+        )
+        for line in lines[1:]:
+            tm.ok(target.write_record(line))
+        prefix = c.TargetOracle.PROMETHEUS_METRIC_PREFIX
+        stream = f'{{stream="{c.TargetOracle.GENERATOR_STREAM_PREFIX}_00"}}'
+        samples = self._samples(textfile.read_text(encoding="utf-8"))
+        tm.that(samples[f"{prefix}records_loaded_total{stream}"], eq="10")
+        tm.that(samples[f"{prefix}buffer_records{stream}"], eq="0")
+        tm.that(samples[f"{prefix}flush_duration_seconds_count{stream}"], eq="1")
+        tm.that(samples[f"{prefix}records_quarantined_total{stream}"], eq="0")
+        exporter = target.loader.metrics_exporter
+        assert exporter is not None
+        live = self._samples(exporter.render())
+        tm.that(live[f"{prefix}buffer_records{stream}"], eq="5")
+        assert int(live[f"{prefix}buffer_bytes{stream}"]) > 0
+        tm.ok(target.finalize())
+        samples = self._samples(textfile.read_text(encoding="utf-8"))
+        tm.that(samples[f"{prefix}records_loaded_total{stream}"], eq="15")
+        tm.that(samples[f"{prefix}buffer_bytes{stream}"], eq="0")
+
+    def test_http_endpoint_serves_metrics(self) -> None:
+        """The endpoint answers /metrics scrapes until it is closed."""
+        metrics = FlextTargetOracleMetrics()
+        metrics.update("orders", rows_in=4, loaded=3, rejected=1)
+        metrics.observe(c.TargetOracle.METRIC_PHASE_FLUSH, "orders", 5_000_000)
+        exporter = FlextTargetOracleMetricsExporter(metrics, lambda: {"orders": 1})
+        host, port = tm.ok(exporter.start("127.0.0.1", 0))
+        try:
+            with urllib.request.urlopen(
+                f"http://{host}:{port}/metrics", timeout=5
+            ) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            exporter.close()
+        tm.that(content_type, eq=c.TargetOracle.PROMETHEUS_CONTENT_TYPE)
+        prefix = c.TargetOracle.PROMETHEUS_METRIC_PREFIX
+        assert f'{prefix}records_quarantined_total{{stream="orders"}} 1' in body
+        assert f'{prefix}buffer_records{{stream="orders"}} 1' in body
+        assert f"# TYPE {prefix}flush_duration_seconds summary" in body
+        tm.that(exporter.address, none=True)
+
+    def test_records_per_second_since_previous_scrape(self) -> None:
+        """The rate covers loads since the previous render, not since start."""
+        metrics = FlextTargetOracleMetrics()
+        exporter = FlextTargetOracleMetricsExporter(metrics, dict)
+        prefix = c.TargetOracle.PROMETHEUS_METRIC_PREFIX
+        rate = f'{prefix}records_per_second{{stream="orders"}}'
+        metrics.update("orders", loaded=100)
+        assert float(self._samples(exporter.render())[rate]) > 0
+        tm.that(float(self._samples(exporter.render())[rate]), eq=0.0)
+
+    def test_disabled_by_default(self) -> None:
+        """Without exporter settings the loader creates no exporter."""
+        target = FlextTargetOracle(FlextTargetOracleSettings())
+        tm.that(target.loader.metrics_exporter, none=True)
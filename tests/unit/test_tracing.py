@@ -0,0 +1,122 @@
+"""Unit tests for statement timing spans and their OTLP/JSON export."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from flext_target_oracle import FlextTargetOracleSettings
+from flext_target_oracle.utilities import (
+    FlextTargetOracle,
+    FlextTargetOracleSingerGenerator,
+    FlextTargetOracleSpanExporter,
+    FlextTargetOracleUtilities,
+)
+from flext_tests import tm
+from tests import c, m, u
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestsFlextTargetOracleTracing:
+    """Behavior contract for FlextTargetOracleSpanExporter."""
+
+    def test_monitor_times_span_and_marks_errors(self) -> None:
+        """The monitor records wall time and flags an escaping exception."""
+        monitor = FlextTargetOracleUtilities.TargetOracle
+        with monitor.target_oracle_monitor_query_performance(
+            "ORDERS", "INSERT", bind_count=6
+        ) as span:
+            span.rows_affected = 3
+        tm.that(span.rows_affected, eq=3)
+        tm.that(span.bind_count, eq=6)
+        assert span.duration_ns > 0
+        assert span.start_unix_ns > 0
+        try:
+            with monitor.target_oracle_monitor_query_performance("ORDERS") as failed:
+                msg = "ORA-00942: table or view does not exist"
+                raise RuntimeError(msg)
+        except RuntimeError:
+            pass
+        tm.that(failed.error, eq="ORA-00942: table or view does not exist")
+
+    def test_loader_exports_statement_spans(self, tmp_path: Path) -> None:
+        """DDL and array DML land in the OTLP/JSON file, one request per batch."""
+        trace_file = tmp_path / "spans.jsonl"
+        settings = FlextTargetOracleSettings.model_validate({
+            "TargetOracle": {
+                "oracle_host": "localhost",
+                "oracle_port": 1521,
+                "oracle_service_name": "XE",
+                "oracle_user": "trace_user",
+                "oracle_password": "trace_password",
+                "default_target_schema": "TRACE",
+                "batch_size": 10,
+                "trace_export_file": str(trace_file),
+            }
+        })
+        target = FlextTargetOracle(
+            settings, oracle_api=u.TargetOracle.Tests.RecordingOracleApi(settings)
+        )
+        messages = [
+            json.loads(line)
+            for line in FlextTargetOracleSingerGenerator(
+                m.TargetOracle.OracleTargetGenerateCommand(records=20, columns=3)
+            ).lines()
+        ]
+        tm.ok(
+            target.process_singer_messages([
+                m.Meltano.SingerSchemaMessage.model_validate(messages[0]),
+                *map(m.Meltano.SingerRecordMessage.model_validate, messages[1:]),
+            ])
+        )
+        requests = list(
+            map(json.loads, trace_file.read_text(encoding="utf-8").splitlines())
+        )
+        tm.that(len(requests), eq=2)
+        spans = [
+            span
+            for request in requests
+            for resource_spans in request["resourceSpans"]
+            for scope_spans in resource_spans["scopeSpans"]
+            for span in scope_spans["spans"]
+        ]
+        attributes = [
+            {item["key"]: item["value"] for item in span["attributes"]}
+            for span in spans
+        ]
+        operations = [item["db.operation"]["stringValue"] for item in attributes]
+        tm.that(operations.count("INSERT"), eq=2)
+        assert "CREATE" in operations
+        inserts = [
+            item for item in attributes if item["db.operation"]["stringValue"] == "INSERT"
+        ]
+        tm.that(
+            [item["db.oracle.rows_affected"]["intValue"] for item in inserts],
+            eq=["10", "10"],
+        )
+        tm.that({span["traceId"] for span in spans}, eq={spans[0]["traceId"]})
+        assert all(
+            int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+            for span in spans
+        )
+
+    def test_export_queues_until_flush(self, tmp_path: Path) -> None:
+        """``export`` does no I/O; ``flush`` ships the queue in batch requests."""
+        trace_file = tmp_path / "spans.jsonl"
+        exporter = FlextTargetOracleSpanExporter(file_path=str(trace_file))
+        queued = c.TargetOracle.TRACE_EXPORT_BATCH_SPANS + 1
+        for _ in range(queued):
+            exporter.export(
+                FlextTargetOracleSpanExporter.Span("ORDERS", "INSERT", "INSERT", 1)
+            )
+        assert not trace_file.exists()
+        tm.that(tm.ok(exporter.flush()), eq=queued)
+        tm.that(len(trace_file.read_text(encoding="utf-8").splitlines()), eq=2)
+
+    def test_flush_reports_unusable_endpoint(self) -> None:
+        """A malformed endpoint URL fails the flush instead of raising."""
+        exporter = FlextTargetOracleSpanExporter(endpoint="/v1/traces")
+        exporter.export(FlextTargetOracleSpanExporter.Span("ORDERS", "INSERT", "", 0))
+        tm.fail(exporter.flush())
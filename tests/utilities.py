@@ -6,9 +6,19 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from flext_target_oracle import FlextTargetOracleUtilities
+import re
+import time
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Self
+
+from flext_db_oracle import FlextDbOracleApi, FlextDbOracleSettings
+from flext_target_oracle import FlextTargetOracleUtilities, m, r
 from flext_tests import FlextTestsUtilities
 
+if TYPE_CHECKING:
+    from flext_meltano import p
+    from flext_target_oracle import FlextTargetOracleSettings, t
+
 
 class TestsFlextTargetOracleUtilities(FlextTestsUtilities, FlextTargetOracleUtilities):
     """Test utilities combining TestsFlextUtilities and project-specific utilities."""
@@ -19,6 +29,312 @@ class TestsFlextTargetOracleUtilities(FlextTestsUtilities, FlextTargetOracleUtil
         class Tests:
             """Internal tests declarations for test-only objects."""
 
+            class RecordingOracleServices:
+                """``oracle_services`` stand-in: real SQL builders, canned queries."""
+
+                def __init__(
+                    self,
+                    api: TestsFlextTargetOracleUtilities.TargetOracle.Tests.RecordingOracleApi,
+                    services: object,
+                ) -> None:
+                    """Wrap the builder services of a never-connected API."""
+                    self._api = api
+                    self._services = services
+
+                def __getattr__(self, name: str) -> object:
+                    """Delegate statement builders to the real services."""
+                    return getattr(self._services, name)
+
+                def execute_query(
+                    self, sql: str, params: m.ConfigMap | None = None
+                ) -> p.Result[list[m.ConfigMap]]:
+                    """Record the query and answer from ``query_results``."""
+                    _ = params
+                    self._api.record("execute_query", sql, 1)
+                    rows = next(
+                        (
+                            rows
+                            for fragment, rows in self._api.query_results.items()
+                            if fragment in sql
+                        ),
+                        (),
+                    )
+                    return r[list[m.ConfigMap]].ok([
+                        m.ConfigMap(root=dict(row)) for row in rows
+                    ])
+
+            class FlushTimer:
+                """Proxy that times every ``with api`` block which wrote rows.
+
+                The loader opens one block per flush, so the recorded durations
+                are flush latencies; schema and index blocks write no rows and
+                are skipped. Works over the recording double and the real API.
+                """
+
+                def __init__(self, api: FlextDbOracleApi) -> None:
+                    """Wrap ``api``; every other attribute is delegated."""
+                    self._api = api
+                    self._session = ExitStack()
+                    self._started = 0.0
+                    self._wrote = False
+                    self.flush_seconds: list[float] = []
+
+                def __getattr__(self, name: str) -> object:
+                    """Delegate everything not timed to the wrapped API."""
+                    return getattr(self._api, name)
+
+                def __enter__(self) -> Self:
+                    """Open the wrapped session and start the clock."""
+                    self._session.enter_context(self._api)
+                    self._started = time.perf_counter()
+                    self._wrote = False
+                    return self
+
+                def __exit__(self, *exc_info: object) -> None:
+                    """Close the wrapped session and keep the block time."""
+                    elapsed = time.perf_counter() - self._started
+                    _ = exc_info
+                    self._session.close()
+                    if self._wrote:
+                        self.flush_seconds.append(elapsed)
+
+                def execute_many(
+                    self, sql: str, rows: t.SequenceOf[t.TargetOracle.BindTuple]
+                ) -> p.Result[int]:
+                    """Mark the block as a flush and forward the array DML."""
+                    self._wrote = True
+                    return self._api.execute_many(sql, rows)
+
+            class RecordingOracleApi:
+                """In-process ``FlextDbOracleApi`` double for offline benchmarks.
+
+                Exposes the surface the loader drives (context manager,
+                ``connect``/``disconnect``, ``execute_sql``, ``execute_many``,
+                ``fetch_tables`` and ``oracle_services``), records every call and
+                sleeps ``call_latency + row_latency * rows`` seconds per round
+                trip to model network and server cost.
+                """
+
+                CREATE_TABLE_RE = re.compile(
+                    r'CREATE\s+TABLE\s+(?:\w+\.)?"?(\w+)"?', re.IGNORECASE
+                )
+                DROP_TABLE_RE = re.compile(
+                    r'DROP\s+TABLE\s+(?:\w+\.)?"?(\w+)"?', re.IGNORECASE
+                )
+                DML_TABLE_RE = re.compile(
+                    r'^(?:(?:INSERT|MERGE)\b.*?\bINTO|DELETE\b.*?\bFROM|UPDATE)'
+                    r'\s+(?:\w+\.)?"?(\w+)"?',
+                    re.IGNORECASE,
+                )
+                BOUND_COLUMNS_RE = re.compile(r'"(\w+)"')
+                MERGE_SOURCE_RE = re.compile(r'AS "(\w+)"')
+
+                def __init__(
+                    self,
+                    settings: FlextTargetOracleSettings,
+                    *,
+                    call_latency: float = 0.0,
+                    row_latency: float = 0.0,
+                    query_results: t.MappingKV[
+                        str, t.SequenceOf[t.JsonMapping]
+                    ]
+                    | None = None,
+                    keep_rows: bool = False,
+                    reject_values: frozenset[str] = frozenset(),
+                ) -> None:
+                    """Build the double from target settings; nothing connects.
+
+                    With ``keep_rows`` every array-bound statement keeps its
+                    rows in ``bound`` and the INSERTed rows that are not rolled
+                    back in ``applied``. Like an Oracle session, nothing is
+                    durable before an explicit ``COMMIT``: ``committed_rows``
+                    are the applied rows up to the last one, a ``ROLLBACK``
+                    drops the rest and a commit or rollback erases the
+                    savepoint. A row holding one of ``reject_values`` fails
+                    its array statement the way Oracle does: the rows before
+                    it stay applied until a rollback. A table written by an
+                    APPEND_VALUES insert takes no more DML before the
+                    transaction ends (ORA-12838).
+                    """
+                    delegate = FlextDbOracleApi(
+                        FlextDbOracleSettings.model_validate({
+                            "DbOracle": {
+                                "host": settings.TargetOracle.oracle_host,
+                                "port": settings.TargetOracle.oracle_port,
+                                "service_name": settings.TargetOracle.oracle_service_name,
+                                "username": settings.TargetOracle.oracle_user,
+                                "password": settings.TargetOracle.oracle_password,
+                            }
+                        })
+                    )
+                    self.call_latency = call_latency
+                    self.row_latency = row_latency
+                    self.query_results = dict(query_results or {})
+                    self.tables: set[str] = set()
+                    self.calls: list[tuple[str, str, int]] = []
+                    self.keep_rows = keep_rows
+                    self.reject_values = reject_values
+                    self.applied: list[dict[str, t.TargetOracle.BindValue]] = []
+                    self.savepoint: int | None = None
+                    self.committed = 0
+                    self.direct_path_tables: set[str] = set()
+                    self.bound: list[
+                        tuple[str, t.SequenceOf[t.TargetOracle.BindTuple]]
+                    ] = []
+                    self.oracle_services = (
+                        TestsFlextTargetOracleUtilities.TargetOracle.Tests.RecordingOracleServices(
+                            self, delegate.oracle_services
+                        )
+                    )
+
+                def __enter__(self) -> Self:
+                    """Return the double itself as the connected API."""
+                    return self
+
+                def __exit__(self, *_exc_info: object) -> None:
+                    """Keep the session open, like a pooled connection."""
+
+                @property
+                def committed_rows(self) -> list[dict[str, t.TargetOracle.BindValue]]:
+                    """Return the applied rows the last ``COMMIT`` made durable."""
+                    return self.applied[: self.committed]
+
+                @property
+                def rows_written(self) -> int:
+                    """Return the rows bound through ``execute_many``."""
+                    return sum(
+                        rows
+                        for operation, _sql, rows in self.calls
+                        if operation == "execute_many"
+                    )
+
+                def bound_values(
+                    self, column_name: str
+                ) -> list[list[t.TargetOracle.BindValue]]:
+                    """Return one column's bound values per kept INSERT or MERGE."""
+                    values: list[list[t.TargetOracle.BindValue]] = []
+                    for sql, rows in self.bound:
+                        names = (
+                            self.MERGE_SOURCE_RE.findall(sql.partition(" FROM dual")[0])
+                            if sql.startswith("MERGE")
+                            else self.inserted_columns(sql)
+                        )
+                        if column_name in names:
+                            position = names.index(column_name)
+                            values.append([row[position] for row in rows])
+                    return values
+
+                def inserted_columns(self, sql: str) -> list[str]:
+                    """Return the column list of an INSERT, or nothing."""
+                    if not sql.startswith("INSERT"):
+                        return []
+                    head, _, _ = sql.partition("VALUES")
+                    return self.BOUND_COLUMNS_RE.findall(head)
+
+                def statements(self, operation: str) -> list[str]:
+                    """Return the SQL recorded for one operation."""
+                    return [sql for name, sql, _rows in self.calls if name == operation]
+
+                def record(self, operation: str, sql: str, rows: int) -> None:
+                    """Record one round trip and apply the injected latency."""
+                    self.calls.append((operation, sql, rows))
+                    delay = self.call_latency + self.row_latency * rows
+                    if delay > 0:
+                        time.sleep(delay)
+
+                def reset(self) -> None:
+                    """Forget recorded calls between benchmark rounds."""
+                    self.calls.clear()
+                    self.bound.clear()
+                    self.applied.clear()
+                    self.savepoint = None
+                    self.committed = 0
+                    self.direct_path_tables.clear()
+
+                def direct_path_conflict(self, sql: str) -> str | None:
+                    """Return ORA-12838 when ``sql`` modifies a direct-path table."""
+                    target = self.DML_TABLE_RE.search(sql)
+                    if target is None or target.group(1).upper() not in (
+                        self.direct_path_tables
+                    ):
+                        return None
+                    return (
+                        "ORA-12838: cannot read/modify an object after "
+                        "modifying it in parallel"
+                    )
+
+                def mark_direct_path(self, sql: str) -> None:
+                    """Lock the table an APPEND_VALUES insert wrote until it ends."""
+                    target = self.DML_TABLE_RE.search(sql)
+                    if "APPEND_VALUES" in sql and target is not None:
+                        self.direct_path_tables.add(target.group(1).upper())
+
+                def connect(self) -> p.Result[bool]:
+                    """Pretend to open a session."""
+                    return r[bool].ok(value=True)
+
+                def disconnect(self) -> p.Result[bool]:
+                    """Pretend to close the session."""
+                    return r[bool].ok(value=True)
+
+                def fetch_tables(self, schema: str | None = None) -> p.Result[list[str]]:
+                    """Return the tables created through this double."""
+                    _ = schema
+                    self.record("fetch_tables", "", 0)
+                    return r[list[str]].ok(sorted(self.tables))
+
+                def execute_sql(
+                    self, sql: str, params: t.JsonMapping | None = None
+                ) -> p.Result[int]:
+                    """Record DDL/DML, track tables and replay transactions."""
+                    _ = params
+                    self.record("execute_sql", sql, 1)
+                    if (conflict := self.direct_path_conflict(sql)) is not None:
+                        return r[int].fail(conflict)
+                    if sql.startswith("ROLLBACK TO SAVEPOINT"):
+                        if self.savepoint is None:
+                            return r[int].fail("ORA-01086: savepoint never established")
+                        del self.applied[self.savepoint :]
+                    elif sql in {"COMMIT", "ROLLBACK"}:
+                        if sql == "COMMIT":
+                            self.committed = len(self.applied)
+                        del self.applied[self.committed :]
+                        self.savepoint = None
+                        self.direct_path_tables.clear()
+                    elif sql.startswith("SAVEPOINT"):
+                        self.savepoint = len(self.applied)
+                    elif (created := self.CREATE_TABLE_RE.search(sql)) is not None:
+                        self.tables.add(created.group(1).upper())
+                    elif (dropped := self.DROP_TABLE_RE.search(sql)) is not None:
+                        self.tables.discard(dropped.group(1).upper())
+                    return r[int].ok(0)
+
+                def execute_many(
+                    self, sql: str, rows: t.SequenceOf[t.TargetOracle.BindTuple]
+                ) -> p.Result[int]:
+                    """Record one positionally bound statement and its row count."""
+                    self.record("execute_many", sql, len(rows))
+                    if (conflict := self.direct_path_conflict(sql)) is not None:
+                        return r[int].fail(conflict)
+                    if not (self.keep_rows or self.reject_values):
+                        self.mark_direct_path(sql)
+                        return r[int].ok(len(rows))
+                    if self.keep_rows:
+                        self.bound.append((sql, list(rows)))
+                    names = self.inserted_columns(sql)
+                    for offset, row in enumerate(rows):
+                        if any(
+                            isinstance(value, str) and value in self.reject_values
+                            for value in row
+                        ):
+                            return r[int].fail(
+                                f"ORA-12899: value rejected at array offset {offset}"
+                            )
+                        if self.keep_rows and names:
+                            self.applied.append(dict(zip(names, row, strict=True)))
+                    self.mark_direct_path(sql)
+                    return r[int].ok(len(rows))
+
 
 u = TestsFlextTargetOracleUtilities
 